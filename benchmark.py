@@ -0,0 +1,83 @@
+import time
+
+from constants import WORD_BANK_PATH
+from solver import AuxiliaryFunctions, WordBankManagement, WordleGame
+
+
+def words_filter_initial_requirements_linear(
+        list_of_words: list, length: int, number_of_vowels: int,
+        number_of_consonants: int) -> list:
+    """Filter the word bank with the three linear passes used before the index
+
+    Args:
+        list_of_words (list): List of words
+        length (int): Length that the words must have
+        number_of_vowels (int): Number of vowels that words must have
+        number_of_consonants (int): Number of consonants that words must have
+
+    Returns:
+        list: List of words that satisfy the initial requirements
+    """
+    auxiliary_functions = AuxiliaryFunctions()
+    wordlist_with_single_length = auxiliary_functions.filter_words_by_length(
+        list_of_words, length
+    )
+    wordlist_specified_number_vowels = (auxiliary_functions.
+                                        filter_words_containing_certain_letters(
+        wordlist_with_single_length, WordleGame.SET_OF_VOWELS, number_of_vowels
+    ))
+    return auxiliary_functions.filter_words_containing_certain_letters(
+        wordlist_specified_number_vowels, WordleGame.SET_OF_CONSONANTS,
+        number_of_consonants
+    )
+
+
+def benchmark_initial_requirements(list_of_words: list) -> None:
+    """Compare the per-game latency of the initial filtering before and after
+    the (length, vowels, consonants) index, over every bucket of the word bank
+
+    Args:
+        list_of_words (list): List of words
+    """
+    initial_time = time.perf_counter()
+    wordle_game = WordleGame(list_of_words)
+    index_build_time = time.perf_counter() - initial_time
+    auxiliary_functions = AuxiliaryFunctions()
+    buckets = sorted({
+        (
+            len(word),
+            auxiliary_functions.letter_counter(word, WordleGame.SET_OF_VOWELS),
+            auxiliary_functions.letter_counter(
+                word, WordleGame.SET_OF_CONSONANTS),
+        )
+        for word in list_of_words
+    })
+    linear_time = 0.0
+    index_time = 0.0
+    for bucket in buckets:
+        initial_time = time.perf_counter()
+        expected = words_filter_initial_requirements_linear(
+            list_of_words, *bucket)
+        linear_time += time.perf_counter() - initial_time
+        initial_time = time.perf_counter()
+        obtained = wordle_game.words_filter_initial_requirements(*bucket)
+        index_time += time.perf_counter() - initial_time
+        if expected != obtained:
+            raise AssertionError(f'Different words for the bucket {bucket}')
+    print(f'Words in the bank: {len(list_of_words)}')
+    print(f'Buckets (length, vowels, consonants): {len(buckets)}')
+    print(f'Index construction (once): {index_build_time * 1000:.2f} ms')
+    print(
+        'Initial filtering per game, linear passes: '
+        f'{linear_time / len(buckets) * 1000:.3f} ms'
+    )
+    print(
+        'Initial filtering per game, index lookup: '
+        f'{index_time / len(buckets) * 1000:.4f} ms'
+    )
+
+
+if __name__ == '__main__':
+    word_bank_management = WordBankManagement()
+    word_bank_management.create_list_of_words(WORD_BANK_PATH)
+    benchmark_initial_requirements(word_bank_management.get_list_of_words())
@@ -0,0 +1,40 @@
+import argparse
+
+from constants import (
+    COMPILED_WORD_BANK_PATH, TARGET_PRIOR_PATH, WORD_BANK_PATH,
+)
+from main import create_connection_pool_from_config
+from solver import TargetPrior, load_wordle_game
+from storage import Database
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(
+        description='Build or refresh the target prior with the games won that '
+                    'were written in the database'
+    )
+    parser.add_argument('--word-bank', default=WORD_BANK_PATH)
+    parser.add_argument('--compiled-word-bank', default=COMPILED_WORD_BANK_PATH)
+    parser.add_argument('--output', default=TARGET_PRIOR_PATH)
+    parser.add_argument(
+        '--rebuild', action='store_true',
+        help='Count every game again instead of only the new ones'
+    )
+    arguments = parser.parse_args()
+    target_prior = TargetPrior(
+        arguments.output,
+        load_wordle_game(arguments.word_bank, arguments.compiled_word_bank)
+    )
+    if arguments.rebuild:
+        target_prior.clear()
+    connection_pool = create_connection_pool_from_config()
+    database = Database(connection_pool=connection_pool)
+    try:
+        number_of_games = target_prior.refresh(database)
+    finally:
+        database.close_connection()
+        connection_pool.closeall()
+    target_prior.save()
+    print(
+        f'{number_of_games} games counted, last game {target_prior.last_game_id},'
+        f' target prior saved in {arguments.output}'
+    )
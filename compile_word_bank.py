@@ -0,0 +1,14 @@
+import argparse
+
+from constants import COMPILED_WORD_BANK_PATH, WORD_BANK_PATH
+from solver import WordBankManagement
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(
+        description='Compile the word bank into its binary format'
+    )
+    parser.add_argument('--word-bank', default=WORD_BANK_PATH)
+    parser.add_argument('--output', default=COMPILED_WORD_BANK_PATH)
+    arguments = parser.parse_args()
+    WordBankManagement().compile_word_bank(arguments.word_bank, arguments.output)
+    print(f'Compiled word bank saved in {arguments.output}')
@@ -0,0 +1,15 @@
+import os
+
+BASE_DIRECTORY = os.path.dirname(os.path.abspath(__file__))
+WORD_BANK_PATH = os.path.join(BASE_DIRECTORY, 'bancoPalabrasCarlos.txt')
+COMPILED_WORD_BANK_PATH = os.path.join(BASE_DIRECTORY, 'bancoPalabrasCarlos.bin')
+OPENING_BOOK_PATH = os.path.join(BASE_DIRECTORY, 'opening_book.json')
+DECISION_TREE_PATH = os.path.join(BASE_DIRECTORY, 'decision_tree.json')
+TARGET_PRIOR_PATH = os.path.join(BASE_DIRECTORY, 'bancoPalabrasCarlos.prior.json')
+DATABASE_SPOOL_PATH = os.path.join(BASE_DIRECTORY, 'database_spool.jsonl')
+# Number of words that the game allows to send
+MAXIMUM_ATTEMPTS = 5
+# Version of the filtering and the selection of the words, stored in the 
+# opening books and the decision trees. It must be increased by every change 
+# that alters the words selected, so the files generated before are rejected
+SOLVER_VERSION = 1
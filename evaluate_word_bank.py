@@ -0,0 +1,7 @@
+import sys
+
+from main import main
+
+if __name__ == '__main__':
+    # Same as the batch command of main.py, kept for the existing scripts
+    main(['batch'] + sys.argv[1:])
@@ -0,0 +1,24 @@
+import argparse
+
+from constants import DECISION_TREE_PATH, WORD_BANK_PATH
+from solver import DecisionTree, WordBankManagement, WordleGame
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(
+        description='Generate the decision tree of the word bank'
+    )
+    parser.add_argument('--word-bank', default=WORD_BANK_PATH)
+    parser.add_argument('--output', default=DECISION_TREE_PATH)
+    parser.add_argument(
+        '--strategy', default='frequency', choices=('frequency', 'entropy')
+    )
+    arguments = parser.parse_args()
+    word_bank_management = WordBankManagement()
+    word_bank_management.create_list_of_words(arguments.word_bank)
+    decision_tree = DecisionTree(
+        arguments.output,
+        WordleGame(word_bank_management.get_list_of_words()),
+        arguments.strategy,
+    )
+    decision_tree.generate()
+    print(f'Decision tree saved in {arguments.output}')
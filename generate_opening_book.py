@@ -0,0 +1,28 @@
+import argparse
+
+from constants import OPENING_BOOK_PATH, WORD_BANK_PATH
+from solver import OpeningBook, WordBankManagement, WordleGame
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(
+        description='Generate the opening book of the word bank'
+    )
+    parser.add_argument('--word-bank', default=WORD_BANK_PATH)
+    parser.add_argument('--output', default=OPENING_BOOK_PATH)
+    parser.add_argument(
+        '--strategy', default='frequency', choices=('frequency', 'entropy')
+    )
+    parser.add_argument(
+        '--second-words', action='store_true',
+        help='Also compute the second word for every feedback of the first one'
+    )
+    arguments = parser.parse_args()
+    word_bank_management = WordBankManagement()
+    word_bank_management.create_list_of_words(arguments.word_bank)
+    opening_book = OpeningBook(
+        arguments.output,
+        WordleGame(word_bank_management.get_list_of_words()),
+        arguments.strategy,
+    )
+    opening_book.generate(arguments.second_words)
+    print(f'Opening book saved in {arguments.output}')
@@ -0,0 +1,168 @@
+import argparse
+import os
+import statistics
+import tempfile
+
+from local_api import LocalWordleApi, SqliteConnectionPool
+from constants import COMPILED_WORD_BANK_PATH, WORD_BANK_PATH
+from main import print_run_summary
+from networking import ConcurrentGameRunner, RequestScheduler
+from observability import EventSink, events
+from solver import (
+    DecisionTree, OpeningBook, SpeculativeGuesser, WordBankManagement,
+    WordleGame,
+)
+from storage import Database, DatabaseWriter
+
+
+def percentile(values: list, percent: float) -> float:
+    """Return a percentile of a list of values
+
+    Args:
+        values (list): List of values
+        percent (float): Percentile, between 0 and 100
+
+    Returns:
+        float: Value of the percentile
+    """
+    if len(values) == 1:
+        return values[0]
+    return statistics.quantiles(values, n=100, method='inclusive')[
+        min(98, max(0, round(percent) - 1))
+    ]
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(
+        description='Play games against the local Wordle API and report the '
+                    'latency and throughput'
+    )
+    parser.add_argument('--games', type=int, default=200)
+    parser.add_argument('--concurrency', type=int, default=50)
+    parser.add_argument(
+        '--latency', type=float, default=0.05,
+        help='Seconds added by the local API to every response'
+    )
+    parser.add_argument(
+        '--latency-jitter', type=float, default=0.0,
+        help='Maximum random seconds added to the latency'
+    )
+    parser.add_argument(
+        '--overload-latency', type=float, default=0.0,
+        help='Seconds added by the local API for every other request in flight'
+    )
+    parser.add_argument(
+        '--failure-rate', type=float, default=0.0,
+        help='Fraction of the requests answered with a 503 status'
+    )
+    parser.add_argument(
+        '--requests-per-second', type=float, default=None,
+        help='Rate limit of the requests, by default there is no limit'
+    )
+    parser.add_argument(
+        '--target-latency', type=float, default=2.0,
+        help='Target p95 latency of the requests, in seconds'
+    )
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument(
+        '--strategy', default='frequency', choices=('frequency', 'entropy')
+    )
+    parser.add_argument('--opening-book', default=None)
+    parser.add_argument('--decision-tree', default=None)
+    parser.add_argument(
+        '--speculative-feedbacks', type=int, default=3,
+        help='Feedbacks whose next word is computed while a word is being '
+             'sent, 0 to disable it'
+    )
+    parser.add_argument(
+        '--speculative-workers', type=int, default=1,
+        help='Worker threads of the speculative guesser'
+    )
+    parser.add_argument(
+        '--sqlite', default=None,
+        help='SQLite file used instead of PostgreSQL, a temporary one by default'
+    )
+    parser.add_argument(
+        '--no-database', action='store_true', help='Do not record the games'
+    )
+    parser.add_argument(
+        '--events', default=None, help='JSONL file of the game events'
+    )
+    parser.add_argument(
+        '--events-verbosity', default='attempt',
+        choices=tuple(EventSink.VERBOSITY_LEVELS)
+    )
+    arguments = parser.parse_args()
+    if arguments.events is not None:
+        events.configure(arguments.events, arguments.events_verbosity)
+
+    word_bank_management = WordBankManagement()
+    word_bank_management.load_word_bank(COMPILED_WORD_BANK_PATH, WORD_BANK_PATH)
+    wordle_game = WordleGame(
+        word_bank_management.get_list_of_words(),
+        word_bank_management.get_initial_requirements_groups()
+    )
+    opening_book = None
+    if arguments.opening_book is not None:
+        opening_book = OpeningBook(
+            arguments.opening_book, wordle_game, arguments.strategy
+        )
+    decision_tree = None
+    if arguments.decision_tree is not None:
+        decision_tree = DecisionTree(
+            arguments.decision_tree, wordle_game, arguments.strategy
+        )
+    speculative_guesser = None
+    if arguments.speculative_feedbacks > 0:
+        speculative_guesser = SpeculativeGuesser(
+            arguments.speculative_feedbacks, arguments.speculative_workers
+        )
+    database_writer = None
+    if not arguments.no_database:
+        sqlite_path = arguments.sqlite or os.path.join(
+            tempfile.mkdtemp(), 'wordle.sqlite3'
+        )
+        connection_pool = SqliteConnectionPool(sqlite_path)
+        database = Database(connection_pool=connection_pool)
+        try:
+            database.migrate()
+        finally:
+            database.close_connection()
+        database_writer = DatabaseWriter(connection_pool)
+
+    local_api = LocalWordleApi(
+        word_bank_management.get_list_of_words(), arguments.latency,
+        arguments.latency_jitter, arguments.seed,
+        overload_latency=arguments.overload_latency,
+        failure_rate=arguments.failure_rate
+    )
+    api_get_url, api_post_url = local_api.start()
+    try:
+        summary = ConcurrentGameRunner(
+            'local', 'local', api_get_url, api_post_url, wordle_game,
+            arguments.strategy, opening_book, arguments.concurrency,
+            decision_tree, database_writer,
+            RequestScheduler(
+                arguments.concurrency,
+                requests_per_second=arguments.requests_per_second,
+                target_latency=arguments.target_latency
+            ),
+            speculative_guesser=speculative_guesser
+        ).run(arguments.games)
+    finally:
+        local_api.stop()
+        if database_writer is not None:
+            database_writer.close()
+        events.close()
+
+    print_run_summary(summary)
+    latencies = sorted(
+        result['time_to_find_word'] for result in summary['results']
+    )
+    if latencies:
+        print(
+            'Game latency: '
+            f'p50 {percentile(latencies, 50):.3f} s, '
+            f'p95 {percentile(latencies, 95):.3f} s, '
+            f'p99 {percentile(latencies, 99):.3f} s'
+        )
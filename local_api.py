@@ -0,0 +1,342 @@
+from datetime import datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import json
+import random
+import sqlite3
+import threading
+import time
+import uuid
+
+from solver import AuxiliaryFunctions, WordleGame
+
+
+class LocalWordleApi:
+    def __init__(
+            self, list_of_words: list, latency: float = 0.0,
+            latency_jitter: float = 0.0, seed: int = None,
+            host: str = '127.0.0.1', port: int = 0,
+            overload_latency: float = 0.0,
+            failure_rate: float = 0.0) -> None:
+        """LocalWordleApi class constructor
+
+        HTTP server with the same json contract as the Wordle API. A GET
+        request starts a game in a new session, kept in a cookie, and a POST
+        request sends a word of the game of the session.
+
+        Args:
+            list_of_words (list): Words that can be chosen as target words
+            latency (float, optional): Seconds added to every response.
+            Defaults to 0.0.
+            latency_jitter (float, optional): Maximum random seconds added to
+            the latency. Defaults to 0.0.
+            seed (int, optional): Seed used to choose the target words. Defaults
+            to None.
+            host (str, optional): Host of the server. Defaults to '127.0.0.1'.
+            port (int, optional): Port of the server, 0 to choose a free one.
+            Defaults to 0.
+            overload_latency (float, optional): Seconds added to every response
+            for every other request in flight. Defaults to 0.0.
+            failure_rate (float, optional): Fraction of the requests answered 
+            with a 503 status without being processed. Defaults to 0.0.
+        """
+        self.list_of_words = list_of_words
+        self.latency = latency
+        self.latency_jitter = latency_jitter
+        self.overload_latency = overload_latency
+        self.failure_rate = failure_rate
+        self.auxiliary_functions = AuxiliaryFunctions()
+        self.__random = random.Random(seed)
+        self.__games = {}
+        self.__lock = threading.Lock()
+        self.__requests_in_flight = 0
+        self.__server = ThreadingHTTPServer((host, port), LocalWordleApiHandler)
+        self.__server.daemon_threads = True
+        self.__server.wordle_api = self
+        self.__thread = None
+
+    def get_urls(self) -> tuple:
+        """Return the URLs of the server
+
+        Returns:
+            tuple: URL to start a game and URL to send a word
+        """
+        host, port = self.__server.server_address[:2]
+        return f'http://{host}:{port}/new_game', f'http://{host}:{port}/attempt'
+
+    def start(self) -> tuple:
+        """Start the server in a background thread
+
+        Returns:
+            tuple: URL to start a game and URL to send a word
+        """
+        self.__thread = threading.Thread(
+            target=self.__server.serve_forever, daemon=True
+        )
+        self.__thread.start()
+        return self.get_urls()
+
+    def stop(self) -> None:
+        """Stop the server
+        """
+        self.__server.shutdown()
+        self.__server.server_close()
+
+    def wait_latency(self) -> bool:
+        """Wait the artificial latency of a response
+
+        Returns:
+            bool: False if the request must fail without being processed
+        """
+        delay = self.latency
+        with self.__lock:
+            if self.latency_jitter > 0:
+                delay += self.__random.uniform(0, self.latency_jitter)
+            delay += self.overload_latency * self.__requests_in_flight
+            self.__requests_in_flight += 1
+            fails = self.__random.random() < self.failure_rate
+        try:
+            if delay > 0:
+                time.sleep(delay)
+        finally:
+            with self.__lock:
+                self.__requests_in_flight -= 1
+        return not fails
+
+    def new_game(self) -> tuple:
+        """Start a new game
+
+        Returns:
+            tuple: Session identifier and API response
+        """
+        session_id = uuid.uuid4().hex
+        with self.__lock:
+            target_word = self.__random.choice(self.list_of_words)
+            token_api = uuid.uuid4().hex[:24]
+            self.__games[session_id] = {
+                'target_word': target_word, 'attempts': 0,
+            }
+        number_vowels = self.auxiliary_functions.letter_counter(
+            target_word, WordleGame.SET_OF_VOWELS)
+        number_consonants = self.auxiliary_functions.letter_counter(
+            target_word, WordleGame.SET_OF_CONSONANTS)
+        return session_id, {
+            'id': token_api,
+            'length_word': len(target_word),
+            'vowels': number_vowels,
+            'consonants': number_consonants,
+        }
+
+    def send_word(self, session_id: str, word: str) -> dict:
+        """Check a word sent in the game of a session
+
+        Args:
+            session_id (str): Session identifier
+            word (str): Word sent
+
+        Returns:
+            dict: API response, None if the session has no game
+        """
+        with self.__lock:
+            game = self.__games.get(session_id)
+            if game is None:
+                return None
+            game['attempts'] += 1
+            current_attempts = game['attempts']
+        target_word = game['target_word']
+        if len(word) != len(target_word):
+            return {
+                'detail': f'The word must have {len(target_word)} letters'
+            }
+        right_letters_in_right_positions, right_letters_in_wrong_positions = (
+            self.auxiliary_functions.attempt_feedback(word, target_word)
+        )
+        return {
+            'word_sent': word,
+            'score': sum(right_letters_in_right_positions) / len(target_word),
+            'try_datetime': datetime.now().isoformat(),
+            'position_array': right_letters_in_right_positions,
+            'right_letters_in_wrong_positions': right_letters_in_wrong_positions,
+            'current_attemps': current_attempts,
+        }
+
+
+class LocalWordleApiHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def do_GET(self) -> None:
+        wordle_api = self.server.wordle_api
+        if not wordle_api.wait_latency():
+            self.__send_json(503, {'detail': 'Service unavailable'})
+            return
+        session_id, response = wordle_api.new_game()
+        self.__send_json(200, response, session_id)
+
+    def do_POST(self) -> None:
+        wordle_api = self.server.wordle_api
+        length = int(self.headers.get('Content-Length', 0))
+        body = self.rfile.read(length)
+        if not wordle_api.wait_latency():
+            self.__send_json(503, {'detail': 'Service unavailable'})
+            return
+        try:
+            word = json.loads(body).get('result_word', '')
+        except ValueError:
+            self.__send_json(400, {'detail': 'Invalid json'})
+            return
+        response = wordle_api.send_word(self.__get_session_id(), word)
+        if response is None:
+            self.__send_json(400, {'detail': 'There is no game in progress'})
+        else:
+            self.__send_json(200, response)
+
+    def log_message(self, format: str, *args) -> None:
+        # The requests are not logged, so the load tests are not slowed down
+        pass
+
+    def __get_session_id(self) -> str:
+        for cookie in self.headers.get('Cookie', '').split(';'):
+            name, _, value = cookie.strip().partition('=')
+            if name == 'session_id':
+                return value
+        return None
+
+    def __send_json(
+            self, status: int, response: dict, session_id: str = None) -> None:
+        body = json.dumps(response).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        if session_id is not None:
+            self.send_header('Set-Cookie', f'session_id={session_id}; Path=/')
+        self.end_headers()
+        self.wfile.write(body)
+
+
+class SqliteConnectionPool:
+    SCHEMA = '''
+    CREATE TABLE IF NOT EXISTS game (
+        game_id INTEGER PRIMARY KEY AUTOINCREMENT,
+        token_api TEXT NOT NULL,
+        number_vowels INTEGER,
+        number_consonants INTEGER,
+        length_word INTEGER,
+        time_to_find_word REAL,
+        total_time REAL,
+        win BOOLEAN
+    );
+    CREATE TABLE IF NOT EXISTS attempt (
+        attempt_id INTEGER PRIMARY KEY AUTOINCREMENT,
+        game_id INTEGER REFERENCES game (game_id),
+        word_sent TEXT,
+        score REAL,
+        date TEXT,
+        time TEXT,
+        current_attemps INTEGER,
+        position_array TEXT,
+        right_letters_in_wrong_positions TEXT
+    );
+    '''
+
+    def __init__(self, database_path: str) -> None:
+        """SqliteConnectionPool class constructor
+
+        Stand-in for a psycopg2 connection pool backed by a SQLite file, so the
+        Database class can be used without a PostgreSQL server. The game and
+        attempt tables are created if they do not exist.
+
+        Args:
+            database_path (str): Location of the SQLite file
+        """
+        self.database_path = database_path
+        connection = self.getconn()
+        connection.executescript(self.SCHEMA)
+        self.putconn(connection)
+
+    def getconn(self) -> 'SqliteConnection':
+        """Open a connection
+
+        Returns:
+            SqliteConnection: Connection with the psycopg2 interface used by
+            the Database class
+        """
+        return SqliteConnection(sqlite3.connect(
+            self.database_path, check_same_thread=False
+        ))
+
+    def putconn(self, connection: 'SqliteConnection') -> None:
+        """Close a connection
+
+        Args:
+            connection (SqliteConnection): Connection
+        """
+        connection.close()
+
+    def closeall(self) -> None:
+        """Close all the connections
+        """
+        pass
+
+
+class SqliteConnection:
+    def __init__(self, connection: sqlite3.Connection) -> None:
+        """SqliteConnection class constructor
+
+        Args:
+            connection (sqlite3.Connection): SQLite connection
+        """
+        self.connection = connection
+
+    def cursor(self) -> 'SqliteCursor':
+        return SqliteCursor(self.connection.cursor())
+
+    def executescript(self, script: str) -> None:
+        self.connection.executescript(script)
+
+    def commit(self) -> None:
+        self.connection.commit()
+
+    def rollback(self) -> None:
+        self.connection.rollback()
+
+    def close(self) -> None:
+        self.connection.close()
+
+
+class SqliteCursor:
+    def __init__(self, cursor: sqlite3.Cursor) -> None:
+        """SqliteCursor class constructor
+
+        Translates the psycopg2 placeholders to SQLite ones and stores the
+        lists as json.
+
+        Args:
+            cursor (sqlite3.Cursor): SQLite cursor
+        """
+        self.cursor = cursor
+
+    @staticmethod
+    def __adapt_parameters(parameters: tuple) -> tuple:
+        return tuple(
+            json.dumps(parameter) if isinstance(parameter, list) else parameter
+            for parameter in parameters
+        )
+
+    def execute(self, query: str, parameters: tuple = ()) -> None:
+        self.cursor.execute(
+            query.replace('%s', '?'), self.__adapt_parameters(parameters)
+        )
+
+    def executemany(self, query: str, rows: list) -> None:
+        self.cursor.executemany(
+            query.replace('%s', '?'),
+            [self.__adapt_parameters(row) for row in rows]
+        )
+
+    def fetchone(self) -> tuple:
+        return self.cursor.fetchone()
+
+    def fetchall(self) -> list:
+        return self.cursor.fetchall()
+
+    def close(self) -> None:
+        self.cursor.close()
@@ -1,637 +1,697 @@
-import copy
-from datetime import date
+import argparse
 import json
-from logging import exception
-import requests
+import sys
 import time
-import psycopg2
-from decouple import config
 
-class Database:
-    def __init__(self, conn) -> None:
-        self.conn = conn
-        self.cursor = self.conn.cursor()
+from constants import (
+    COMPILED_WORD_BANK_PATH, DATABASE_SPOOL_PATH, WORD_BANK_PATH,
+)
+from networking import (
+    ConcurrentGameRunner, GameQueueWorker, Play, RequestScheduler,
+)
+from observability import events, metrics
+from solver import (
+    BatchSolver, DecisionTree, FilterCache, GameSolver, OpeningBook,
+    SpeculativeGuesser, TargetPrior, load_wordle_game,
+)
+from storage import Database, DatabaseWriter
+
+
+def print_run_summary(summary: dict) -> None:
+    """Print the summary of the games played concurrently
+
+    Args:
+        summary (dict): Summary returned by ConcurrentGameRunner.run
+    """
+    print(
+        f"{summary['games']} games ({summary['wins']} won, "
+        f"{summary['failed_games']} failed) in "
+        f"{round(summary['elapsed_time'], 2)} seconds: "
+        f"{round(summary['games_per_second'], 2)} games/s, "
+        f"{round(summary['attempts_per_second'], 2)} attempts/s"
+    )
+    print(f"Request scheduler: {summary['request_scheduler']}")
+    if 'speculative_guesser' in summary:
+        print(f"Speculative guesser: {summary['speculative_guesser']}")
+    if 'filter_cache' in summary:
+        print(f"Filter cache: {summary['filter_cache']}")
+
+
+def print_evaluation(evaluation: dict) -> None:
+    """Print the result of the evaluation of the word bank
+
+    Args:
+        evaluation (dict): Evaluation returned by BatchSolver.evaluate
+    """
+    print(f"Games: {evaluation['games']}")
+    print(f"Win rate: {round(evaluation['win_rate'] * 100, 2)} %")
+    print('Attempts distribution:')
+    distribution = evaluation['attempts_distribution']
+    for number_of_attempts in sorted(
+            attempts for attempts in distribution if attempts is not None):
+        print(f'  {number_of_attempts}: {distribution[number_of_attempts]}')
+    print(f'  not found: {distribution.get(None, 0)}')
+    print(
+        'Solver CPU time per game: '
+        f"{round(evaluation['cpu_time_per_game'] * 1000, 3)} ms"
+    )
+    print(f"Elapsed time: {round(evaluation['elapsed_time'], 2)} seconds")
+
+
+def parse_feedback(line: str, attempt_word: str) -> tuple:
+    """Parse a line of feedback of the solve command
+
+    The line holds the right positions as a string of 0 and 1 and, optionally,
+    the right letters in wrong positions, separated by a space or by '|'. It 
+    may start with the word sent, when it is not the suggested one.
+
+    Args:
+        line (str): Line of feedback, for instance '0100100 co'
+        attempt_word (str): Word suggested
+
+    Raises:
+        ValueError: If the line is not valid feedback
+
+    Returns:
+        tuple: Word sent, boolean list containing the correct letter positions
+        and list containing the correct letters in the wrong positions
+    """
+    fields = line.replace('|', ' ').split()
+    if fields and not set(fields[0]) <= {'0', '1'}:
+        attempt_word = fields.pop(0)
+    if not fields or len(fields) > 2 or not set(fields[0]) <= {'0', '1'}:
+        raise ValueError(f'Invalid feedback: {line.strip()}')
+    if len(fields[0]) != len(attempt_word):
+        raise ValueError(f'The feedback must have {len(attempt_word)} positions')
+    right_letters_in_right_positions = [
+        position == '1' for position in fields[0]
+    ]
+    right_letters_in_wrong_positions = []
+    if len(fields) == 2:
+        right_letters_in_wrong_positions = list(dict.fromkeys(fields[1]))
+    return (
+        attempt_word, right_letters_in_right_positions,
+        right_letters_in_wrong_positions,
+    )
+
+
+def parse_target_word(line: str) -> tuple:
+    """Parse the line that starts a game of the solve command
+
+    Args:
+        line (str): Line holding the length, vowels and consonants of the 
+        target word, for instance '5 2 3'
+
+    Raises:
+        ValueError: If the line does not hold three numbers
+
+    Returns:
+        tuple: Length, number of vowels and number of consonants of the target
+        word
+    """
+    fields = line.split()
+    if len(fields) != 3 or not all(field.isdigit() for field in fields):
+        raise ValueError(
+            f'Invalid game: {line.strip()}, expected the length, vowels and '
+            'consonants of the target word'
+        )
+    return tuple(int(field) for field in fields)
 
-    def insert_data_game_table(self, data: tuple) -> None:
-        try:
-            cursor = self.cursor
-            insert_data_game_table_query = '''INSERT INTO game 
-            (token_api, number_vowels, number_consonants, length_word) VALUES (%s, %s, %s, %s);
-            '''
-            cursor.execute(insert_data_game_table_query, data)
-            self.conn.commit()
-        except:
-            print('No se pudo insertar los datos en la tabla game')
 
-    def update_data_game_table(self, data: tuple) -> None:
-        try:
-            add_datetime_gametable_query = '''UPDATE game SET time_to_find_word = %s, total_time = %s, win = %s WHERE token_api = %s'''
-            cursor = self.cursor
-            cursor.execute(add_datetime_gametable_query, data)
-            self.conn.commit()
-        except:
-            print('No se puedo añadir los valores al tabla game')
+def play_command(arguments: argparse.Namespace) -> None:
+    """Play games against the API, with the settings of the environment
 
-    def close_connection(self) -> None:
-        self.cursor.close()
-        self.conn.close()
-    
-    def insert_data_attempt_table(self, data: tuple) -> None:
+    The events of the games are only kept in memory unless EVENTS_PATH names a
+    JSONL file, or '-' for the standard error, so the standard output only 
+    carries the summary of the run. The games in progress are only 
+    checkpointed, to be finished by the resume command, when 
+    SESSION_COOKIES_KEY holds a Fernet key, which needs the cryptography 
+    package.
+
+    Args:
+        arguments (argparse.Namespace): Arguments of the play command
+    """
+    from decouple import config
+
+    initial_application_time = arguments.initial_application_time
+    user_name_api = config('USERNAME_API')
+    password_api = config('PASSWORD_API')
+    api_get_url = config('URL_API_GET')
+    api_post_url = config('URL_API_POST')
+    hostname_db = config('POSTGRESQL_HOSTNAME')
+    username_db = config('POSTGRESQL_USERNAME')
+    password_db = config('POSTGRESQL_PASSWORD')
+    dbname = config('POSTGRESQL_DBNAME')
+    selection_strategy = config('SELECTION_STRATEGY', default='frequency')
+    opening_book_path = config('OPENING_BOOK_PATH', default=None)
+    decision_tree_path = config('DECISION_TREE_PATH', default=None)
+    number_of_games = arguments.games
+    if number_of_games is None:
+        number_of_games = config('NUMBER_OF_GAMES', default=1, cast=int)
+    metrics_path = config('METRICS_PATH', default=None)
+    metrics.enabled = metrics_path is not None
+    events.configure(
+        config('EVENTS_PATH', default=None),
+        config('EVENTS_VERBOSITY', default='attempt'),
+        config('EVENTS_FLUSH_INTERVAL', default=1.0, cast=float),
+        config('EVENTS_MAXIMUM_BYTES', default=10 * 1024 * 1024, cast=int),
+        config('EVENTS_BACKUP_COUNT', default=3, cast=int)
+    )
+    word_bank_path = config('WORD_BANK_PATH', default=WORD_BANK_PATH)
+    compiled_word_bank_path = config(
+        'COMPILED_WORD_BANK_PATH', default=COMPILED_WORD_BANK_PATH
+    )
+    request_timeout = config('API_REQUEST_TIMEOUT', default=10.0, cast=float)
+    maximum_request_retries = config(
+        'API_MAXIMUM_RETRIES', default=3, cast=int
+    )
+
+    if number_of_games > 1:
+        connection_pool = Database.create_connection_pool(
+            hostname_db, username_db, password_db, dbname, 1, 1
+        )
         try:
-            cursor = self.cursor
-            insert_data_attempt_table_query = '''INSERT INTO attempt
-            (game_id, word_sent, score, date, time, current_attemps, position_array, right_letters_in_wrong_positions) VALUES (%s, %s, %s, %s, %s, %s, %s, %s)
-            '''
-            cursor.execute(insert_data_attempt_table_query, data)
-            self.conn.commit()
-        except:
-            print('No se pudo añadir los datos a la tabla attempt')
-
-    def search_data_game_table(self, token_game: str) :
-        try:   
-            cursor = self.cursor
-            search_data_game_table_query = '''SELECT game_id FROM game 
-            WHERE token_api = %s
-            '''
-            cursor.execute(search_data_game_table_query, (token_game,))
-            return list(cursor.fetchone())[0]
+            Database.check_pool_schema(connection_pool)
         except:
-            print('No se encontro el juego especificado')
-
-    def win_game(self, token_api: str) -> str:
-           
-        cursor = self.cursor
-        id_game = self.search_data_game_table(token_api)
-        search_data_game_table_query = '''SELECT score FROM attempt 
-        WHERE score = 1.0 AND game_id = %s
-        '''
-        cursor.execute(search_data_game_table_query, (id_game,))
-        return list(cursor.fetchone())[0]
-        
-            # print('No se encontro el juego especificado')
-
-class WordleGame:
-    def __init__(self, list_of_words: list) -> None:
-        """WordleGame class constructor
-
-        Args:
-            list_of_words (list): List of words
-        """
-        self.__list_of_words = list_of_words
-        self.auxiliary_functions = AuxiliaryFunctions()
-
-    def words_filter_initial_requirements(
-            self, length: int, number_of_vowels: int, 
-            number_of_consonants: int) -> list:
-        """Filter out words that do not meet the initial requirements
-
-        Args:
-            length (int): Length that the words must have
-            number_of_vowels (int): Number of vowels that words must have
-            number_of_consonants (int): Number of consonants that words must have
-        Returns:
-            list: List of words that have the same length, number of vowels and
-            consonants as the target word
-        """
-        # Filtering of words that do not match the length of the target word
-        wordlist_with_single_length = (self.auxiliary_functions.
-                                        filter_words_by_length(
-            self.__list_of_words, length
-        ))
-        # Filtering of words that do not match the number of vowels in the
-        # target word
-        set_of_vowels = 'aeiou'
-        wordlist_specified_number_vowels = (self.auxiliary_functions.
-                                            filter_words_containing_certain_letters(
-            wordlist_with_single_length, set_of_vowels, number_of_vowels
-        ))
-        # Filtering of words that do not match the number of consonants of the
-        # target word
-        set_of_consonants = 'bcdfghjklmnñpqrstvwxyz'
-        wordlist_specified_number_consonants = (self.auxiliary_functions.
-                                                filter_words_containing_certain_letters(
-            wordlist_specified_number_vowels, set_of_consonants, 
-            number_of_consonants
+            connection_pool.closeall()
+            raise
+        database_writer = create_database_writer_from_config(connection_pool)
+        try:
+            game_runner = create_game_runner_from_config(database_writer)
+            print_run_summary(game_runner.run(number_of_games))
+            # The games are written before the prior is updated from them
+            database_writer.close()
+            if game_runner.target_prior is not None:
+                game_runner.target_prior.update(connection_pool)
+        finally:
+            database_writer.close()
+            connection_pool.closeall()
+    else:
+        with Play(
+                user_name_api, password_api, 
+                hostname_db, username_db, password_db, dbname,
+                api_get_url, api_post_url, initial_application_time,
+                selection_strategy, opening_book_path,
+                word_bank_path=word_bank_path,
+                compiled_word_bank_path=compiled_word_bank_path,
+                decision_tree_path=decision_tree_path,
+                speculative_feedbacks=config(
+                    'SPECULATIVE_FEEDBACKS', default=3, cast=int
+                ),
+                request_timeout=request_timeout,
+                maximum_request_retries=maximum_request_retries,
+                target_prior_path=config(
+                    'TARGET_PRIOR_PATH', default=None),
+                database_spool_path=config(
+                    'DATABASE_SPOOL_PATH', default=DATABASE_SPOOL_PATH),
+                session_cookies_key=config(
+                    'SESSION_COOKIES_KEY', default=None) or None) as play:
+            play.play_game()
+
+    events.close()
+    if metrics_path is not None:
+        metrics.export(metrics_path)
+
+
+def create_game_runner_from_config(
+        database_writer: DatabaseWriter) -> ConcurrentGameRunner:
+    """Create a runner of concurrent games with the settings of the 
+    environment
+
+    Args:
+        database_writer (DatabaseWriter): Writer that records the games
+
+    Returns:
+        ConcurrentGameRunner: Runner of concurrent games
+    """
+    from decouple import config
+
+    selection_strategy = config('SELECTION_STRATEGY', default='frequency')
+    opening_book_path = config('OPENING_BOOK_PATH', default=None)
+    decision_tree_path = config('DECISION_TREE_PATH', default=None)
+    wordle_game = load_wordle_game(
+        config('WORD_BANK_PATH', default=WORD_BANK_PATH),
+        config('COMPILED_WORD_BANK_PATH', default=COMPILED_WORD_BANK_PATH),
+        FilterCache(config(
+            'FILTER_CACHE_MAXIMUM_BYTES', default=64 * 1024 * 1024, cast=int
         ))
-        return wordlist_specified_number_consonants
-
-    def filter_words(
-            self, wordlist: list, last_attempt: str,
-            right_letters_in_right_positions: list,
-            right_letters_in_wrong_positions: list) -> list:
-        """Filter out words that do not satisfy the requirements.
-
-        Args:
-            wordlist (list): List of words
-            last_attempt (str): Word used in the last attempt
-            right_letters_in_right_positions (list): Boolean list containing the 
-            correct letter positions
-            right_letters_in_wrong_positions (list): List containing the correct 
-            letters in the wrong positions
-
-        Returns:
-            list: List of filtered words 
-        """
-        # Filtering of words with letters in the correct position
-        first_filter = self.__filter_words_with_right_letters_right_positions(
-            wordlist, last_attempt, right_letters_in_right_positions
+    )
+    opening_book = None
+    if opening_book_path is not None:
+        opening_book = OpeningBook(
+            opening_book_path, wordle_game, selection_strategy
         )
-        # Filter out words containing wrong letters
-        second_filter = self.__filtering_words_with_bad_letters(
-            first_filter,
-            last_attempt,
-            right_letters_in_wrong_positions,
-            right_letters_in_right_positions,
+    decision_tree = None
+    if decision_tree_path is not None:
+        decision_tree = DecisionTree(
+            decision_tree_path, wordle_game, selection_strategy
         )
-        # Filtering of words that have correct letters but with a wrong position
-        third_filter = self.__filter_words_with_right_letters_bad_positions(
-            last_attempt,
-            second_filter,
-            right_letters_in_wrong_positions,
-            right_letters_in_right_positions,
+    target_prior_path = config('TARGET_PRIOR_PATH', default=None)
+    target_prior = None
+    if target_prior_path is not None:
+        target_prior = TargetPrior(target_prior_path, wordle_game)
+    speculative_feedbacks = config('SPECULATIVE_FEEDBACKS', default=3, cast=int)
+    speculative_guesser = None
+    if speculative_feedbacks > 0:
+        speculative_guesser = SpeculativeGuesser(
+            speculative_feedbacks,
+            config('SPECULATIVE_WORKERS', default=1, cast=int)
         )
-        return third_filter
-
-    def __filter_words_with_right_letters_right_positions(
-            self, wordlist: list, last_attempt: str, 
-            right_letters_in_right_positions: list) -> list:
-        """Filters out words containing letters in wrong positions
-
-        Args:
-            wordlist (list): List of words
-            last_attempt (str): Word used in the last attempt
-            right_letters_in_right_positions (list): Boolean list containing the 
-            correct letter positions
-
-        Returns:
-            list: List of words with the letters in the correct position
-        """
-        return list(
-            filter(
-                lambda word: word
-                if (self.auxiliary_functions.
-                        comparison_position_letter_with_array_booleans(
-                    last_attempt, word, right_letters_in_right_positions
-                ))
-                else None,
-                wordlist,
-            )
+    maximum_concurrent_games = config(
+        'MAXIMUM_CONCURRENT_GAMES', default=50, cast=int
+    )
+    request_scheduler = RequestScheduler(
+        maximum_concurrent_games,
+        requests_per_second=config(
+            'API_REQUESTS_PER_SECOND', default=0.0, cast=float
+        ) or None,
+        target_latency=config('API_TARGET_LATENCY', default=2.0, cast=float),
+        timeout=config('API_REQUEST_TIMEOUT', default=10.0, cast=float),
+        maximum_retries=config('API_MAXIMUM_RETRIES', default=3, cast=int)
+    )
+    return ConcurrentGameRunner(
+        config('USERNAME_API'), config('PASSWORD_API'), config('URL_API_GET'),
+        config('URL_API_POST'), wordle_game, selection_strategy, opening_book,
+        maximum_concurrent_games, decision_tree, database_writer,
+        request_scheduler, target_prior, speculative_guesser
+    )
+
+
+def create_database_writer_from_config(connection_pool) -> DatabaseWriter:
+    """Create a database writer with the settings of the environment
+
+    Args:
+        connection_pool (psycopg2.pool.AbstractConnectionPool): Pool from 
+        which the writer takes its connection
+
+    Returns:
+        DatabaseWriter: Writer of the games
+    """
+    from decouple import config
+
+    return DatabaseWriter(
+        connection_pool,
+        config('MAXIMUM_QUEUED_GAMES', default=1000, cast=int),
+        spool_path=config('DATABASE_SPOOL_PATH', default=DATABASE_SPOOL_PATH),
+        session_cookies_key=config('SESSION_COOKIES_KEY', default=None) or None
+    )
+
+
+def create_connection_pool_from_config():
+    """Create a pool with a single connection to the database of the 
+    environment
+
+    Returns:
+        psycopg2.pool.ThreadedConnectionPool: Pool of database connections
+    """
+    from decouple import config
+
+    return Database.create_connection_pool(
+        config('POSTGRESQL_HOSTNAME'), config('POSTGRESQL_USERNAME'),
+        config('POSTGRESQL_PASSWORD'), config('POSTGRESQL_DBNAME'), 1, 1
+    )
+
+
+def migrate_command(arguments: argparse.Namespace) -> None:
+    """Apply the pending versions of the schema to the database of the 
+    environment
+
+    Args:
+        arguments (argparse.Namespace): Arguments of the migrate command
+    """
+    connection_pool = create_connection_pool_from_config()
+    database = Database(connection_pool=connection_pool)
+    try:
+        applied_versions = database.migrate()
+    finally:
+        database.close_connection()
+        connection_pool.closeall()
+    if applied_versions:
+        print(f'Versions applied: {applied_versions}')
+    else:
+        print('The schema is up to date')
+
+
+def stats_command(arguments: argparse.Namespace) -> None:
+    """Print the statistics of the games by length of the target word
+
+    Args:
+        arguments (argparse.Namespace): Arguments of the stats command
+    """
+    connection_pool = create_connection_pool_from_config()
+    database = Database(connection_pool=connection_pool)
+    try:
+        stats = database.get_stats()
+    finally:
+        database.close_connection()
+        connection_pool.closeall()
+    if arguments.json:
+        print(json.dumps(stats, indent=2))
+        return
+    for length_word, length_stats in stats.items():
+        percentiles = ', '.join(
+            f'p{percent} {round(value, 2)} s'
+            for percent, value in length_stats[
+                'time_to_find_word_percentiles'].items()
         )
-
-    def __filter_words_with_right_letters_bad_positions(
-            self, last_attempt: str, list_of_words: list,
-            right_letters_in_bad_positions: list,
-            right_letters_in_right_positions: list,) -> list:
-        """Filtering of words that have correct letters but with a wrong 
-        position
-
-        Args:
-            last_attempt (str): Word used in the last attempt
-            list_of_words (list): List of words
-            right_letters_in_bad_positions (list): List containing the correct 
-            letters in the wrong positions
-            right_letters_in_right_positions (list): Boolean list containing the
-            correct letter positions
-
-        Returns:
-            list: List of words containing the correct letters, but in the wrong 
-            position
-        """
-        # All words containing the letters known to belong to the target word 
-        # are selected
-        wordlist_contain_right_letter = []
-        for word in list_of_words:
-            sw = True
-            for right_letter in right_letters_in_bad_positions:
-                if not right_letter in word:
-                    sw = False
-                    break
-            if sw:
-                wordlist_contain_right_letter.append(word)
-        if len(wordlist_contain_right_letter) == 0:
-            return list_of_words
-        # Eliminate words that have correct letters, but are known not to be in a
-        # certain position
-        wordslist_with_letters_wrong_positions = []
-        # Creating a list of words that have correct letters, but are known not 
-        # to be in a certain position
-        for word in wordlist_contain_right_letter:
-            for index in range(len(right_letters_in_right_positions)):
-                if (
-                    not right_letters_in_right_positions[index]
-                    and word[index] == last_attempt[index]
-                ):
-                    wordslist_with_letters_wrong_positions.append(word)
-        # Eliminating the words with an erroneous position with the list that 
-        # was generated previously
-        for word in list(set(wordslist_with_letters_wrong_positions)):
-            wordlist_contain_right_letter.remove(word)
-        return wordlist_contain_right_letter
-
-    def __filtering_words_with_bad_letters(
-            self, list_of_words: list, last_attempt: str,
-            right_letters_in_bad_positions: list,
-            right_letters_in_right_positions: list,) -> list:
-        """Filter out words containing wrong letters
-
-        Args:
-            list_of_words (list): List of words
-            last_attempt (str): Word used in the last attempt
-            right_letters_in_bad_positions (list): List containing the correct 
-            letters in the wrong positions
-            right_letters_in_right_positions (list): Boolean list containing the 
-            correct letter positions
-
-        Returns:
-            list: List of words that do not contain letters that the target word
-            is known not to possess
-        """
-        # The letters that the target word does not have and that are found in 
-        # the last attempt are found
-        letters_not_located_in_wordtarget = []
-        right_letter = [
-            last_attempt[index]
-            for index in range(len(right_letters_in_right_positions))
-            if right_letters_in_right_positions[index]
-        ]
-        for i in range(len(last_attempt)):
-            if (
-                not last_attempt[i] in right_letters_in_bad_positions
-                and not right_letters_in_right_positions[i]
-                and not last_attempt[i] in right_letter
-            ):
-                letters_not_located_in_wordtarget.append(last_attempt[i])
-        return list(
-            filter(
-                lambda word: word
-                if self.auxiliary_functions.verify_word_no_wrong_letter(
-                    letters_not_located_in_wordtarget, word
-                )
-                else None,
-                list_of_words,
-            )
+        print(
+            f"Length {length_word}: {length_stats['games']} games, "
+            f"win rate {round(length_stats['win_rate'] * 100, 2)} %, "
+            f"mean attempts {round(length_stats['mean_attempts'], 2)}, "
+            f'time to find the word {percentiles}'
         )
 
-    def __Selection_word_with_highest_number_different_letters(
-            self, list_of_word: list) -> list:
-        """Select the set of words with the highest number of different letters
-
-        Args:
-            list_of_word (list): List of words
-
-        Returns:
-            list: List of words with the highest number of different letters
-        """
-        large = -1
-        wordlist_with_highest_number_different_letters = []
-        for word in list_of_word:
-            tam = len(set(list(word)))
-            if large < tam:
-                large = tam
-                wordlist_with_highest_number_different_letters = []
-            if large == tam:
-                wordlist_with_highest_number_different_letters.append(word)
-
-        return wordlist_with_highest_number_different_letters
-
-    def select_word(
-            self, possible_words: list, length_target_word: int) -> str:
-        """Select the word most likely to be correct
-
-        Args:
-            possible_words (list): List of words
-            length_target_word (int): Length of the word target
-
-        Returns:
-            str: Selected word
-        """
-        wordlist_highest_number_different_letters = self.__Selection_word_with_highest_number_different_letters(
-            possible_words
+
+def enqueue_command(arguments: argparse.Namespace) -> None:
+    """Queue games to be played by the workers
+
+    Args:
+        arguments (argparse.Namespace): Arguments of the enqueue command
+    """
+    connection_pool = create_connection_pool_from_config()
+    database = Database(connection_pool=connection_pool)
+    try:
+        database.check_schema()
+        job_ids = database.enqueue_games(arguments.games)
+        job_counts = database.get_job_counts()
+    finally:
+        database.close_connection()
+        connection_pool.closeall()
+    print(f'{len(job_ids)} games queued, jobs by status: {job_counts}')
+
+
+def worker_command(arguments: argparse.Namespace) -> None:
+    """Play the games queued in the database of the environment
+
+    Args:
+        arguments (argparse.Namespace): Arguments of the worker command
+    """
+    from decouple import config
+
+    # The worker, its heartbeat and the database writer use a connection each
+    connection_pool = Database.create_connection_pool(
+        config('POSTGRESQL_HOSTNAME'), config('POSTGRESQL_USERNAME'),
+        config('POSTGRESQL_PASSWORD'), config('POSTGRESQL_DBNAME'), 1, 3
+    )
+    database_writer = create_database_writer_from_config(connection_pool)
+    try:
+        game_runner = create_game_runner_from_config(database_writer)
+        summary = GameQueueWorker(
+            connection_pool, game_runner,
+            batch_size=arguments.batch_size,
+            heartbeat_interval=config(
+                'WORKER_HEARTBEAT_INTERVAL', default=10.0, cast=float
+            ),
+            stale_timeout=config(
+                'WORKER_STALE_TIMEOUT', default=60.0, cast=float
+            ),
+            maximum_claims=config('WORKER_MAXIMUM_CLAIMS', default=3, cast=int)
+        ).run(arguments.maximum_jobs, arguments.exit_when_empty)
+        # The games are written before the prior is updated from them
+        database_writer.close()
+        if game_runner.target_prior is not None:
+            game_runner.target_prior.update(connection_pool)
+    finally:
+        database_writer.close()
+        connection_pool.closeall()
+    print(
+        f"Worker {summary['worker_id']}: {summary['games']} games "
+        f"({summary['wins']} won) of {summary['claimed_jobs']} jobs claimed, "
+        f"{summary['released_jobs']} queued again, "
+        f"{round(summary['games_per_second'], 2)} games/s"
+    )
+
+
+def batch_command(arguments: argparse.Namespace) -> None:
+    """Play every word of the word bank as the target word offline
+
+    Args:
+        arguments (argparse.Namespace): Arguments of the batch command
+    """
+    print_evaluation(BatchSolver.evaluate(
+        arguments.word_bank, arguments.strategy, arguments.opening_book,
+        arguments.sample, arguments.seed, arguments.workers,
+        arguments.compiled_word_bank, arguments.decision_tree,
+        not arguments.no_shared_word_bank
+    ))
+
+
+def solve_command(arguments: argparse.Namespace) -> None:
+    """Suggest the words of games whose feedback is read from the standard 
+    input
+
+    Every suggested word is printed in its own line, and the feedback it 
+    received is read from the next line. Without --length, --vowels and 
+    --consonants, each game starts with a line holding the length, vowels and
+    consonants of its target word, so one process solves many games with the
+    word bank loaded once. Invalid lines are reported in the standard error 
+    and read again.
+
+    Args:
+        arguments (argparse.Namespace): Arguments of the solve command
+    """
+    wordle_game = load_wordle_game(
+        arguments.word_bank, arguments.compiled_word_bank
+    )
+    opening_book = None
+    if arguments.opening_book is not None:
+        opening_book = OpeningBook(
+            arguments.opening_book, wordle_game, arguments.strategy
+        )
+    decision_tree = None
+    if arguments.decision_tree is not None:
+        decision_tree = DecisionTree(
+            arguments.decision_tree, wordle_game, arguments.strategy
         )
-        alpabhet = 'aeioubcdfghjklmnñpqrstvwxyz'
-        alpabhet_list = list(alpabhet)
-        # The word is selected by comparing the frequency of the letters in the 
-        # word list, from left to right
-        for index in range(length_target_word):
-            large = -1
-            letter_word = []
-            letter_select = ""
-            for word in wordlist_highest_number_different_letters:
-                letter_word.append(word[index])
-            for letter in alpabhet_list:
-                amount = self.auxiliary_functions.letter_counter(letter_word, letter)
-                if large < amount:
-                    large = amount
-                    letter_select = letter
-            words_to_remove = []
-            for word in wordlist_highest_number_different_letters:
-                if word[index] != letter_select:
-                    words_to_remove.append(word)
-            for word in words_to_remove:
-                wordlist_highest_number_different_letters.remove(word)
-        return wordlist_highest_number_different_letters[0]
-
-
-class AuxiliaryFunctions:
-    def __init__(self):
-        """AuxiliaryFunctions class constructor
-        """
-        self
-
-    def filter_words_containing_certain_letters(
-            self, list_of_words: list, string_of_letters: str,
-            number_of_letters_allowed: int,) -> list:
-        """Filters out words that do not contain a specified number of letters
-
-        Args:
-            list_of_words (list): List of words
-            string_of_letters (str): String containing the letters to be checked
-            number_of_letters_allowed (int): Number of the string of letters that must be in the word
-
-        Returns:
-            list: List of words that satisfy the specified number of letters.
-        """
-        return list(
-            filter(
-                lambda word: word
-                if self.letter_counter(word, string_of_letters)
-                == number_of_letters_allowed
-                else None,
-                list_of_words,
-            )
+    target_words = [(arguments.length, arguments.vowels, arguments.consonants)]
+    if None in target_words[0]:
+        target_words = read_target_words()
+    for length_target_word, number_vowels, number_consonants in target_words:
+        game_solver = GameSolver(
+            wordle_game, length_target_word, number_vowels, number_consonants,
+            arguments.strategy, opening_book, decision_tree
         )
+        while True:
+            attempt_word = game_solver.next_word()
+            if attempt_word is None:
+                print('No word satisfies the feedback received', file=sys.stderr)
+                print('', flush=True)
+                break
+            print(attempt_word, flush=True)
+            feedback = None
+            while feedback is None:
+                line = sys.stdin.readline()
+                if not line.strip():
+                    return
+                try:
+                    feedback = parse_feedback(line, attempt_word)
+                except ValueError as error:
+                    print(error, file=sys.stderr)
+                    # The word is suggested again so its feedback is read again
+                    print(attempt_word, flush=True)
+            if all(feedback[1]):
+                break
+            game_solver.register_feedback(*feedback)
 
-    def filter_words_by_length(
-            self, list_of_words: list, length: int) -> list:
-        """Filters out words that do not have the specified length
 
-        Args:
-            list_of_words (list): List of words
-            length (int): Length that the words must have
+def read_target_words():
+    """Read the games of the solve command from the standard input, skipping 
+    the invalid lines
 
-        Returns:
-            list: List of words with the same length
-        """
-        return list(
-            filter(lambda word: word if (len(word) == length) else None, list_of_words)
-        )
+    Yields:
+        tuple: Length, number of vowels and number of consonants of the target
+        word of every game
+    """
+    for line in sys.stdin:
+        if not line.strip():
+            continue
+        try:
+            yield parse_target_word(line)
+        except ValueError as error:
+            print(error, file=sys.stderr)
 
-    def letter_counter(self, word: str, set_of_letters: str) -> int:
-        """Count the number of times a letter appears
-
-        Args:
-            word (str): Word whose letters must be counted
-            set_of_letters (str): Letters to be counted
-
-        Returns:
-            int: Number of letters found in the word
-        """
-        return sum(map(word.count, set_of_letters))
-
-    def comparison_position_letter_with_array_booleans(
-            self, last_attempt: str, word: str, boolean_list: list) -> bool:
-        """Returns if the word to compare and the target match, plus which boolean list validates that they should be the same
-
-        Args:
-            last_attempt (str): Word used in the last attempt
-            word (str): word to be compared with an array of booleans
-            boolean_list (list): List of booleans
-
-        Returns:
-            bool: The comparison between a word and the target word is satisfactory
-        """
-        list_of_letters_in_the_correct_position = list(
-            map(
-                lambda index: True
-                if last_attempt[index] == word[index] and boolean_list[index]
-                else False,
-                range(len(word)),
-            )
-        )
-        return sum(list_of_letters_in_the_correct_position) == sum(boolean_list)
-
-    def verify_word_no_wrong_letter(
-            self, letters_not_located_in_the_target_word: list, word: str) -> bool:
-        """Check that the word does not have any wrong letters
-
-        Args:
-            letters_not_located_in_the_target_word (list): list of letters not found 
-            in the target word
-            word (str): Word to be checked that does not contain letters not found 
-            in the target word
-
-        Returns:
-            bool: Returns True if the word has letters not found in the target word
-        """
-        list_aux = list(
-            map(
-                lambda letter: True
-                if letter in letters_not_located_in_the_target_word
-                else False,
-                list(word),
-            )
-        )
-        return sum(list_aux) == 0
-
-
-class Play:
-    def __init__(
-            self, user_name_api: str, password_api: str, hostname_db: str, 
-            username_db: str, password_db: str, dbname: str, api_get_url :str,
-            api_post_url: str, initial_application_time) -> None:
-        """Play class constructor
-
-        Args:
-            user_name (str): API account username
-            password (str): API account password
-
-        """
-        session = requests.Session()
-        session.auth = (user_name_api, password_api)
-        connection = psycopg2.connect(
-            host=hostname_db,
-            user=username_db,
-            password=password_db,
-            dbname=dbname
-        )
-        self.wordle_game = None
-        self.play(session, connection, api_get_url, api_post_url, initial_application_time)
-
-    def init_game(self, url: str, session) -> json:
-        """Init the game by making the API request
-
-        Args:
-            url (str): API URL
-
-        Returns:
-            json: API response in json format
-        """
-        response = session.get(url)
-        return response.json()
-
-    def find_word(
-            self, length_target_word: int, number_vowels: int, 
-            number_consonants: int, api_post_url: str, session, token_game: str, database: Database) -> None:
-        """Find the target word
-
-        Args:
-            length_target_word (int): Length of the word target
-            number_vowels (int): Number of vowels in the target word
-            number_consonants (int): Number of consonants in the target word
-        """
-        possible_initial_words = self.wordle_game.words_filter_initial_requirements(
-            length_target_word, number_vowels, number_consonants
+
+def resume_command(arguments: argparse.Namespace) -> None:
+    """Finish the games left in progress by a process that stopped
+
+    The cookies of the API sessions of the games are decrypted with 
+    SESSION_COOKIES_KEY, the key of the process that played them, which needs
+    the cryptography package.
+
+    Args:
+        arguments (argparse.Namespace): Arguments of the resume command
+    """
+    from decouple import config
+
+    # The games can only be resumed with the key that encrypted the cookies 
+    # of their API sessions
+    session_cookies_key = config('SESSION_COOKIES_KEY', default=None)
+    if not session_cookies_key:
+        print(
+            'SESSION_COOKIES_KEY is not set, the games can only be resumed '
+            'with the key of the process that played them', file=sys.stderr
         )
-        # Select the first word
-        first_attempt = self.wordle_game.select_word(
-            possible_initial_words, length_target_word
+        sys.exit(1)
+    try:
+        from cryptography.fernet import Fernet, InvalidToken
+    except ImportError:
+        print(
+            'The resume command needs the cryptography package to decrypt the '
+            'cookies of the games', file=sys.stderr
         )
-        attempt_data = self.send_word(first_attempt, api_post_url, session)
-        attempt_word = attempt_data.get('word_sent') #1
-        attempt_count = 0
-        possible_words = copy.deepcopy(possible_initial_words)
-        position_array = attempt_data.get('position_array')#2
-        right_letters_in_wrong_positions = attempt_data.get(
-            'right_letters_in_wrong_positions'
+        sys.exit(1)
+    try:
+        Fernet(session_cookies_key)
+    except ValueError:
+        print(
+            'SESSION_COOKIES_KEY is not a Fernet key, it must be 32 url-safe '
+            'base64-encoded bytes', file=sys.stderr
         )
-        currrent_attempt_word = attempt_data.get('current_attemps')#4
-        # Make the five attempts allowed by the game to find the word
-        while attempt_count < 5:
-            attempt_score =  round(attempt_data.get('score'),2)
-            attempt_date = attempt_data.get('try_datetime').split('T')[0]
-            attempt_time = attempt_data.get('try_datetime').split('T')[1]
-            position_array_attempt = list(map(lambda pos: 1 if pos else 0,position_array))
-            if len(right_letters_in_wrong_positions) > 0:        
-                right_letters_in_wrong_positions_set = list(right_letters_in_wrong_positions)
-            else:
-                right_letters_in_wrong_positions_set = list()
-            game_id = database.search_data_game_table(token_game)
-            data_attempt_table = (game_id, attempt_word, attempt_score, attempt_date, attempt_time, currrent_attempt_word, position_array_attempt, right_letters_in_wrong_positions_set)        
-            database.insert_data_attempt_table(data_attempt_table)
-            print(f'Attempt {currrent_attempt_word}: {attempt_word}')
-            print(attempt_data)
-            if attempt_data.get('score') == 1.0:
-                print(f'Word found: {attempt_word}')
-                break
-            else:
-                possible_words = copy.deepcopy(
-                    self.wordle_game.filter_words(
-                        possible_words,
-                        attempt_word,
-                        position_array,
-                        right_letters_in_wrong_positions,
-                    )
-                )
-                attempt_word = copy.deepcopy(
-                    self.wordle_game.select_word(possible_words, length_target_word)
+        sys.exit(1)
+    connection_pool = Database.create_connection_pool(
+        config('POSTGRESQL_HOSTNAME'), config('POSTGRESQL_USERNAME'),
+        config('POSTGRESQL_PASSWORD'), config('POSTGRESQL_DBNAME'), 1, 1
+    )
+    try:
+        database = Database(connection_pool=connection_pool)
+        try:
+            database.check_schema()
+            try:
+                unfinished_games = database.get_unfinished_games(
+                    session_cookies_key, arguments.stale_after
                 )
-                attempt_data = copy.deepcopy(self.send_word(attempt_word, api_post_url, session))
-                position_array = copy.deepcopy(attempt_data.get('position_array'))
-                right_letters_in_wrong_positions = copy.deepcopy(
-                    attempt_data.get("right_letters_in_wrong_positions")
+            except InvalidToken:
+                print(
+                    'The cookies of the games in progress were not encrypted '
+                    'with SESSION_COOKIES_KEY, it must be the key of the '
+                    'process that played them', file=sys.stderr
                 )
-                currrent_attempt_word = copy.deepcopy(attempt_data.get('current_attemps'))
-            attempt_count += 1
-
-    def send_word(self, word: str, api_post_url: str, session) -> json:
-        """Sends the selected word to the API to verify if it is correct
-
-        Args:
-            word (str): Selected word
-
-        Returns:
-            json: API response when sending a word
-        """
-        data = {'result_word': word}
-        response = session.post(api_post_url,json=data)
-        return response.json()
-
-    def play(
-        self, session, connection, api_get_url: str, api_post_url: str, initial_application_time) -> None:
-        word_bank_management = WordBankManagement()
-        # Create a list of words
-        word_bank_management.create_list_of_words(
-            r'C:\Users\carlo\Documents\WordleGame\bancoPalabrasCarlos.txt'
+                sys.exit(1)
+        finally:
+            database.close_connection()
+        if not unfinished_games:
+            print('There are no games to resume')
+            return
+        print(f'Resuming {len(unfinished_games)} games')
+        database_writer = create_database_writer_from_config(connection_pool)
+        try:
+            game_runner = create_game_runner_from_config(database_writer)
+            print_run_summary(game_runner.resume(unfinished_games))
+        finally:
+            database_writer.close()
+        if game_runner.target_prior is not None:
+            game_runner.target_prior.update(connection_pool)
+    finally:
+        connection_pool.closeall()
+
+
+def main(argv: list = None) -> None:
+    """Entry point of the command line
+
+    Args:
+        argv (list, optional): Arguments of the command line. Defaults to the 
+        arguments of the process.
+    """
+    initial_application_time = time.time()
+    parser = argparse.ArgumentParser(description='Wordle solver')
+    subparsers = parser.add_subparsers(dest='command')
+
+    play_parser = subparsers.add_parser(
+        'play', help='Play games against the API (default command)'
+    )
+    play_parser.add_argument(
+        '--games', type=int, default=None,
+        help='Number of games, by default NUMBER_OF_GAMES'
+    )
+    play_parser.set_defaults(function=play_command)
+
+    batch_parser = subparsers.add_parser(
+        'batch', help='Play every word of the word bank as the target word'
+    )
+    batch_parser.add_argument(
+        '--sample', type=int, default=None,
+        help='Number of target words, by default the whole word bank'
+    )
+    batch_parser.add_argument('--seed', type=int, default=0)
+    batch_parser.add_argument(
+        '--workers', type=int, default=None,
+        help='Number of processes, by default all the cores'
+    )
+    batch_parser.add_argument(
+        '--no-shared-word-bank', action='store_true',
+        help='Every worker loads the word bank instead of attaching to a '
+             'shared copy'
+    )
+    batch_parser.set_defaults(function=batch_command)
+
+    solve_parser = subparsers.add_parser(
+        'solve', help='Suggest words for feedback read from the standard input'
+    )
+    solve_parser.add_argument('--length', type=int, default=None)
+    solve_parser.add_argument('--vowels', type=int, default=None)
+    solve_parser.add_argument('--consonants', type=int, default=None)
+    solve_parser.set_defaults(function=solve_command)
+
+    migrate_parser = subparsers.add_parser(
+        'migrate', help='Apply the pending versions of the database schema'
+    )
+    migrate_parser.set_defaults(function=migrate_command)
+
+    stats_parser = subparsers.add_parser(
+        'stats', help='Print the statistics of the games by word length'
+    )
+    stats_parser.add_argument('--json', action='store_true')
+    stats_parser.set_defaults(function=stats_command)
+    enqueue_parser = subparsers.add_parser(
+        'enqueue', help='Queue games to be played by the workers'
+    )
+    enqueue_parser.add_argument('--games', type=int, required=True)
+    enqueue_parser.set_defaults(function=enqueue_command)
+    worker_parser = subparsers.add_parser(
+        'worker', help='Play the games queued in the database'
+    )
+    worker_parser.add_argument('--batch-size', type=int, default=50)
+    worker_parser.add_argument(
+        '--maximum-jobs', type=int, default=None,
+        help='Stop after claiming this number of jobs'
+    )
+    worker_parser.add_argument(
+        '--exit-when-empty', action='store_true',
+        help='Stop when there are no pending jobs'
+    )
+    worker_parser.set_defaults(function=worker_command)
+    resume_parser = subparsers.add_parser(
+        'resume',
+        help='Finish the games left in progress by a stopped process, with '
+             'the SESSION_COOKIES_KEY that encrypted their session cookies '
+             '(needs the cryptography package)'
+    )
+    resume_parser.add_argument(
+        '--stale-after', type=float, default=60.0,
+        help='Seconds since the last checkpoint of a game in progress'
+    )
+    resume_parser.set_defaults(function=resume_command)
+
+    for subparser in (batch_parser, solve_parser):
+        subparser.add_argument('--word-bank', default=WORD_BANK_PATH)
+        subparser.add_argument(
+            '--compiled-word-bank', default=COMPILED_WORD_BANK_PATH
         )
-        wordlist = word_bank_management.get_list_of_words()
-        # Create a wordle game
-        wordle_game = WordleGame(wordlist)
-        self.wordle_game = wordle_game
-        # # Initialize the game
-        initial_time_find_word = time.time()
-        word_data = self.init_game(api_get_url, session)
-        print(word_data)
-        id_target_word = word_data.get('id')
-        length_target_word = word_data.get('length_word')
-        number_of_vowels = word_data.get('vowels')
-        number_of_consonants = word_data.get('consonants')
-        database = Database(connection)
-        data = (id_target_word, number_of_vowels, number_of_consonants, length_target_word)
-        database.insert_data_game_table(data)
-        # Play the game and find the target word
-        self.find_word(length_target_word, number_of_vowels, number_of_consonants, api_post_url, session, id_target_word, database)
-        final_application_time = time.time()
-        total_time_find_word = final_application_time - initial_time_find_word
-        total_application_time = final_application_time - initial_application_time
-        print(f'The total time to find the word is {round(total_time_find_word,2)} seconds')
-        print('')
-        print(
-            f'The total time for the execution of the application is {round(total_application_time, 2)} seconds'
+        subparser.add_argument(
+            '--strategy', default='frequency', choices=('frequency', 'entropy')
         )
-        win_game = database.win_game(id_target_word)
-        win_game_bool = bool(win_game) 
-        times_data = (total_time_find_word, total_application_time, win_game_bool, id_target_word)
-        database.update_data_game_table(times_data)
-        database.close_connection()
-
-class WordBankManagement:
-    def __init__(self) -> None:
-        """WordBankManagement class constructor
-        """
-        self.__list_of_words = []
-
-    def create_list_of_words(self, url_words_bank: str) -> None:
-        """Create a list of words
-        Args:
-            url_words_bank (str): Location of the txt file containing the words
-        """
-        try:
-            with open(
-                file=url_words_bank, mode="r", encoding="utf-8"
-            ) as word_bank_file:
-                self.__set_list_of_words(word_bank_file.readline().split())
-        except:
-            print('Error reading the file containing the words')
+        subparser.add_argument('--opening-book', default=None)
+        subparser.add_argument('--decision-tree', default=None)
 
-    def __set_list_of_words(self, list_of_words: list) -> None:
-        """Assign word list
+    if argv is None:
+        argv = sys.argv[1:]
+    # Without a command, the games are played as before the subcommands
+    if not argv or argv[0] not in (*subparsers.choices, '-h', '--help'):
+        argv = ['play'] + list(argv)
+    arguments = parser.parse_args(argv)
+    arguments.initial_application_time = initial_application_time
+    arguments.function(arguments)
 
-        Args:
-            list_of_words (list): List of words 
-        """
-        self.__list_of_words = list_of_words
-
-    def get_list_of_words(self) -> list:
-        """Return the list of words
-
-        Returns:
-            list: List of words
-        """
-        return self.__list_of_words
 
 if __name__ == '__main__':
-    initial_application_time = time.time()
-    user_name_api = config('USERNAME_API')
-    password_api = config('PASSWORD_API')
-    api_get_url = config('URL_API_GET')
-    api_post_url = config('URL_API_POST')
-    hostname_db = config('POSTGRESQL_HOSTNAME')
-    username_db = config('POSTGRESQL_USERNAME')
-    password_db = config('POSTGRESQL_PASSWORD')
-    dbname = config('POSTGRESQL_DBNAME')
-
-    Play(
-        user_name_api, password_api, 
-        hostname_db, username_db, password_db, dbname,
-        api_get_url, api_post_url, initial_application_time)
-   
\ No newline at end of file
+    main()
@@ -0,0 +1,285 @@
+import argparse
+import json
+import os
+import random
+import sys
+import time
+import tracemalloc
+
+from constants import BASE_DIRECTORY, MAXIMUM_ATTEMPTS, WORD_BANK_PATH
+from solver import AuxiliaryFunctions, WordBankManagement, WordleGame
+
+BASELINE_PATH = os.path.join(BASE_DIRECTORY, 'micro_benchmark_baseline.json')
+
+
+def select_buckets(wordle_game: WordleGame) -> dict:
+    """Choose the small, median and largest (length, vowels, consonants)
+    buckets of the word bank
+
+    Args:
+        wordle_game (WordleGame): Wordle game with the word bank
+
+    Returns:
+        dict: Bucket keys by size name
+    """
+    groups = wordle_game.get_initial_requirements_groups()
+    keys = sorted(
+        (key for key, words in groups.items() if len(words) > 1),
+        key=lambda key: (len(groups[key]), key)
+    )
+    return {
+        'small': keys[len(keys) // 10],
+        'median': keys[len(keys) // 2],
+        'largest': keys[-1],
+    }
+
+
+def play_feedback_sequences(
+        wordle_game: WordleGame, bucket: tuple, number_of_games: int,
+        seed: int) -> list:
+    """Play seeded games in a bucket and record every step of them
+
+    Args:
+        wordle_game (WordleGame): Wordle game with the word bank
+        bucket (tuple): Length, vowels and consonants of the target words
+        number_of_games (int): Number of target words
+        seed (int): Seed used to choose the target words
+
+    Returns:
+        list: Possible words, word sent and feedback of every step
+    """
+    auxiliary_functions = AuxiliaryFunctions()
+    bucket_words = wordle_game.words_filter_initial_requirements(*bucket)
+    target_words = random.Random(seed).sample(
+        bucket_words, min(number_of_games, len(bucket_words))
+    )
+    steps = []
+    for target_word in target_words:
+        possible_words = bucket_words
+        for _ in range(MAXIMUM_ATTEMPTS):
+            attempt_word = wordle_game.select_word(possible_words, bucket[0])
+            if attempt_word is None or attempt_word == target_word:
+                break
+            feedback = auxiliary_functions.attempt_feedback(
+                attempt_word, target_word
+            )
+            steps.append((possible_words, attempt_word, feedback))
+            possible_words = wordle_game.filter_words(
+                possible_words, attempt_word, *feedback
+            )
+    return steps
+
+
+def build_workloads(
+        wordle_game: WordleGame, number_of_games: int, seed: int) -> dict:
+    """Build the calls of every benchmark of the hot paths
+
+    Args:
+        wordle_game (WordleGame): Wordle game with the word bank
+        number_of_games (int): Number of games played in every bucket
+        seed (int): Seed of the games
+
+    Returns:
+        dict: Function and list of arguments of every call, by benchmark name
+    """
+    auxiliary_functions = AuxiliaryFunctions()
+    workloads = {}
+    for size, bucket in select_buckets(wordle_game).items():
+        steps = play_feedback_sequences(
+            wordle_game, bucket, number_of_games, seed
+        )
+        letter_counter_calls = []
+        comparison_calls = []
+        wrong_letter_calls = []
+        for possible_words, attempt_word, feedback in steps:
+            right_letters_in_right_positions, right_letters_in_wrong_positions = (
+                feedback
+            )
+            wrong_letters = [
+                letter for index, letter in enumerate(attempt_word)
+                if not right_letters_in_right_positions[index]
+                and letter not in right_letters_in_wrong_positions
+            ]
+            for word in possible_words:
+                letter_counter_calls.append((word, WordleGame.SET_OF_VOWELS))
+                comparison_calls.append(
+                    (attempt_word, word, right_letters_in_right_positions)
+                )
+                wrong_letter_calls.append((wrong_letters, word))
+        workloads[f'letter_counter/{size}'] = (
+            auxiliary_functions.letter_counter, letter_counter_calls
+        )
+        workloads[f'comparison_position_letter_with_array_booleans/{size}'] = (
+            auxiliary_functions.comparison_position_letter_with_array_booleans,
+            comparison_calls
+        )
+        workloads[f'verify_word_no_wrong_letter/{size}'] = (
+            auxiliary_functions.verify_word_no_wrong_letter, wrong_letter_calls
+        )
+        workloads[f'filter_words/{size}'] = (
+            wordle_game.filter_words,
+            [
+                (possible_words, attempt_word, *feedback)
+                for possible_words, attempt_word, feedback in steps
+            ]
+        )
+        for strategy in ('frequency', 'entropy'):
+            workloads[f'select_word_{strategy}/{size}'] = (
+                wordle_game.select_word,
+                [
+                    (possible_words, bucket[0], strategy)
+                    for possible_words, _, _ in steps
+                ]
+            )
+    return workloads
+
+
+def measure(
+        function, calls: list, minimum_time: float, repeats: int) -> dict:
+    """Measure the throughput and the memory allocated by a list of calls
+
+    Args:
+        function (callable): Function to be measured
+        calls (list): Arguments of every call
+        minimum_time (float): Minimum seconds of every repetition
+        repeats (int): Number of repetitions, the fastest one is kept
+
+    Returns:
+        dict: Calls per second and peak bytes allocated per call
+    """
+    best_time_per_call = None
+    for _ in range(repeats):
+        number_of_calls = 0
+        initial_time = time.perf_counter()
+        elapsed_time = 0.0
+        while elapsed_time < minimum_time:
+            for arguments in calls:
+                function(*arguments)
+            number_of_calls += len(calls)
+            elapsed_time = time.perf_counter() - initial_time
+        time_per_call = elapsed_time / number_of_calls
+        if best_time_per_call is None or time_per_call < best_time_per_call:
+            best_time_per_call = time_per_call
+    allocated_bytes = 0
+    tracemalloc.start()
+    try:
+        for arguments in calls:
+            current_bytes = tracemalloc.get_traced_memory()[0]
+            tracemalloc.reset_peak()
+            function(*arguments)
+            allocated_bytes += tracemalloc.get_traced_memory()[1] - current_bytes
+    finally:
+        tracemalloc.stop()
+    return {
+        'ops_per_second': 1 / best_time_per_call,
+        'bytes_per_call': allocated_bytes / len(calls),
+    }
+
+
+def compare_with_baseline(
+        results: dict, baseline: dict, threshold: float) -> list:
+    """Find the benchmarks that are slower or allocate more than the baseline
+
+    Args:
+        results (dict): Measures by benchmark name
+        baseline (dict): Measures of the baseline by benchmark name
+        threshold (float): Allowed relative change, 0.25 allows 25 %
+
+    Returns:
+        list: Description of every regression
+    """
+    regressions = []
+    for name, result in results.items():
+        if name not in baseline:
+            continue
+        baseline_result = baseline[name]
+        if result['ops_per_second'] < (
+                baseline_result['ops_per_second'] * (1 - threshold)):
+            regressions.append(
+                f'{name}: {result["ops_per_second"]:.0f} ops/s, baseline '
+                f'{baseline_result["ops_per_second"]:.0f} ops/s'
+            )
+        # A few bytes are always allowed, so tiny allocations do not fail on
+        # noise
+        if result['bytes_per_call'] > (
+                baseline_result['bytes_per_call'] * (1 + threshold) + 64):
+            regressions.append(
+                f'{name}: {result["bytes_per_call"]:.0f} bytes/call, baseline '
+                f'{baseline_result["bytes_per_call"]:.0f} bytes/call'
+            )
+    return regressions
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(
+        description='Measure the hot paths of the solver and compare them with '
+                    'a baseline file'
+    )
+    parser.add_argument('--word-bank', default=WORD_BANK_PATH)
+    parser.add_argument('--baseline', default=BASELINE_PATH)
+    parser.add_argument(
+        '--update-baseline', action='store_true',
+        help='Write the measures to the baseline file instead of comparing them'
+    )
+    parser.add_argument(
+        '--allow-missing-baseline', action='store_true',
+        help='Exit successfully when there is no baseline file to compare with'
+    )
+    parser.add_argument(
+        '--threshold', type=float, default=0.25,
+        help='Allowed relative regression, 0.25 allows 25 %%'
+    )
+    parser.add_argument('--games', type=int, default=8)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--minimum-time', type=float, default=0.2)
+    parser.add_argument('--repeats', type=int, default=3)
+    parser.add_argument(
+        '--filter', default=None,
+        help='Only run the benchmarks whose name contains this text'
+    )
+    arguments = parser.parse_args()
+
+    word_bank_management = WordBankManagement()
+    word_bank_management.create_list_of_words(arguments.word_bank)
+    wordle_game = WordleGame(word_bank_management.get_list_of_words())
+    workloads = build_workloads(wordle_game, arguments.games, arguments.seed)
+    results = {}
+    for name, (function, calls) in workloads.items():
+        if arguments.filter is not None and arguments.filter not in name:
+            continue
+        if not calls:
+            continue
+        results[name] = measure(
+            function, calls, arguments.minimum_time, arguments.repeats
+        )
+        print(
+            f'{name:<58} {results[name]["ops_per_second"]:>12.0f} ops/s '
+            f'{results[name]["bytes_per_call"]:>10.0f} bytes/call'
+        )
+
+    if arguments.update_baseline:
+        baseline = {}
+        if arguments.filter is not None and os.path.exists(arguments.baseline):
+            with open(arguments.baseline, encoding='utf-8') as baseline_file:
+                baseline = json.load(baseline_file)
+        baseline.update(results)
+        with open(arguments.baseline, 'w', encoding='utf-8') as baseline_file:
+            json.dump(baseline, baseline_file, indent=2, sort_keys=True)
+        print(f'Baseline saved in {arguments.baseline}')
+        sys.exit(0)
+    try:
+        with open(arguments.baseline, encoding='utf-8') as baseline_file:
+            baseline = json.load(baseline_file)
+    except (OSError, ValueError):
+        print(
+            f'There is no baseline in {arguments.baseline}, run with '
+            '--update-baseline to create it', file=sys.stderr
+        )
+        sys.exit(0 if arguments.allow_missing_baseline else 1)
+    regressions = compare_with_baseline(results, baseline, arguments.threshold)
+    if regressions:
+        print('Regressions beyond the threshold:')
+        for regression in regressions:
+            print(f'  {regression}')
+        sys.exit(1)
+    print('No regressions beyond the threshold')
@@ -0,0 +1,1254 @@
+from collections import deque
+import heapq
+import itertools
+import json
+import math
+import os
+import random
+import socket
+import sys
+import threading
+import time
+from typing import TYPE_CHECKING
+import uuid
+
+from constants import COMPILED_WORD_BANK_PATH, MAXIMUM_ATTEMPTS, WORD_BANK_PATH
+from observability import events, metrics, timed
+from solver import (
+    DecisionTree, GameSolver, OpeningBook, SpeculativeGuesser, TargetPrior,
+    WordleGame, load_wordle_game,
+)
+from storage import Database, DatabaseWriter
+
+if TYPE_CHECKING:
+    # Only imported by the type checkers, the event loop is imported lazily 
+    # by the methods that use it
+    import asyncio
+
+
+class Play:
+    # Base delay of the backoff between retries of a request, in seconds
+    REQUEST_RETRY_DELAY = 0.1
+
+    def __init__(
+            self, user_name_api: str, password_api: str, hostname_db: str, 
+            username_db: str, password_db: str, dbname: str, api_get_url :str,
+            api_post_url: str, initial_application_time: float = None,
+            selection_strategy: str = 'frequency',
+            opening_book_path: str = None, connection_pool=None,
+            decision_tree_path: str = None,
+            word_bank_path: str = WORD_BANK_PATH,
+            compiled_word_bank_path: str = COMPILED_WORD_BANK_PATH,
+            wordle_game: 'WordleGame' = None,
+            speculative_feedbacks: int = 3, request_timeout: float = 10.0,
+            maximum_request_retries: int = 3,
+            target_prior_path: str = None,
+            database_spool_path: str = None,
+            session_cookies_key: str = None) -> None:
+        """Play class constructor
+
+        Nothing is opened or loaded here. The word bank is loaded by the first
+        game and kept for the next ones, and the API session and the database 
+        writer are opened by the first game and released by close.
+
+        Args:
+            user_name (str): API account username
+            password (str): API account password
+            initial_application_time (float, optional): Time when the 
+            application started. Defaults to the time the object is created.
+            selection_strategy (str, optional): Strategy used to select the 
+            words, 'frequency' or 'entropy'. Defaults to 'frequency'.
+            opening_book_path (str, optional): Location of the opening book 
+            file. Defaults to None.
+            connection_pool (psycopg2.pool.AbstractConnectionPool, optional): 
+            Pool of database connections shared with other games. By default a
+            pool with a single connection is created. The games are written 
+            from a background thread with a connection of the pool.
+            decision_tree_path (str, optional): Location of the decision tree 
+            file. Defaults to None.
+            word_bank_path (str, optional): Location of the txt file containing
+            the words. Defaults to WORD_BANK_PATH.
+            compiled_word_bank_path (str, optional): Location of the compiled 
+            word bank, used instead of the txt file when it exists. Defaults to
+            COMPILED_WORD_BANK_PATH.
+            wordle_game (WordleGame, optional): Wordle game already loaded, 
+            used instead of loading the word bank. Defaults to None.
+            speculative_feedbacks (int, optional): Number of likely feedbacks 
+            whose next word is computed while a word is being sent, 0 to 
+            disable it. Defaults to 3.
+            request_timeout (float, optional): Seconds allowed for every API 
+            request. Defaults to 10.0.
+            maximum_request_retries (int, optional): Number of retries of a 
+            failed API request. Defaults to 3.
+            target_prior_path (str, optional): Location of the target prior 
+            file. Defaults to None.
+            database_spool_path (str, optional): Location of the spool file of
+            the games that could not be written in the database. Defaults to 
+            None.
+            session_cookies_key (str, optional): Fernet key with which the 
+            cookies of the API session are encrypted in the checkpoints of the
+            game, which needs the cryptography package. Without a key the game
+            is not checkpointed. Defaults to None.
+
+        """
+        if initial_application_time is None:
+            initial_application_time = time.time()
+        self.user_name_api = user_name_api
+        self.password_api = password_api
+        self.hostname_db = hostname_db
+        self.username_db = username_db
+        self.password_db = password_db
+        self.dbname = dbname
+        self.api_get_url = api_get_url
+        self.api_post_url = api_post_url
+        self.initial_application_time = initial_application_time
+        self.wordle_game = wordle_game
+        self.selection_strategy = selection_strategy
+        self.opening_book_path = opening_book_path
+        self.opening_book = None
+        self.decision_tree_path = decision_tree_path
+        self.decision_tree = None
+        self.target_prior_path = target_prior_path
+        self.target_prior = None
+        self.word_bank_path = word_bank_path
+        self.compiled_word_bank_path = compiled_word_bank_path
+        self.connection_pool = connection_pool
+        self.database_spool_path = database_spool_path
+        self.session_cookies_key = session_cookies_key
+        self.session = None
+        self.database_writer = None
+        self.__own_connection_pool = False
+        self.request_timeout = request_timeout
+        self.maximum_request_retries = maximum_request_retries
+        self.speculative_guesser = None
+        if speculative_feedbacks > 0:
+            self.speculative_guesser = SpeculativeGuesser(speculative_feedbacks)
+
+    def __enter__(self) -> 'Play':
+        return self
+
+    def __exit__(self, *exception_info) -> None:
+        self.close()
+
+    def load(self) -> 'WordleGame':
+        """Load the word bank, the opening book, the decision tree and the 
+        target prior, if they are not loaded yet
+
+        Returns:
+            WordleGame: Wordle game with the word bank
+        """
+        if self.wordle_game is None:
+            self.wordle_game = load_wordle_game(
+                self.word_bank_path, self.compiled_word_bank_path
+            )
+        if self.opening_book is None and self.opening_book_path is not None:
+            self.opening_book = OpeningBook(
+                self.opening_book_path, self.wordle_game,
+                self.selection_strategy
+            )
+        if self.decision_tree is None and self.decision_tree_path is not None:
+            self.decision_tree = DecisionTree(
+                self.decision_tree_path, self.wordle_game,
+                self.selection_strategy
+            )
+        if self.target_prior is None and self.target_prior_path is not None:
+            self.target_prior = TargetPrior(
+                self.target_prior_path, self.wordle_game
+            )
+        return self.wordle_game
+
+    def open(self) -> None:
+        """Open the API session and the database writer, if they are not open
+        yet
+        """
+        if self.session is not None:
+            return
+        import requests
+
+        session = requests.Session()
+        session.auth = (self.user_name_api, self.password_api)
+        if self.connection_pool is None:
+            self.connection_pool = Database.create_connection_pool(
+                self.hostname_db, self.username_db, self.password_db,
+                self.dbname, 1, 1
+            )
+            self.__own_connection_pool = True
+        Database.check_pool_schema(self.connection_pool)
+        self.database_writer = DatabaseWriter(
+            self.connection_pool, spool_path=self.database_spool_path,
+            session_cookies_key=self.session_cookies_key
+        )
+        self.session = session
+
+    def close(self) -> None:
+        """Write the pending games and close the API session and the database
+        connections opened by the games
+        """
+        if self.speculative_guesser is not None:
+            self.speculative_guesser.close()
+        if self.session is None:
+            return
+        try:
+            self.database_writer.close()
+            if self.target_prior is not None:
+                self.target_prior.update(self.connection_pool)
+        finally:
+            if self.__own_connection_pool:
+                self.connection_pool.closeall()
+                self.connection_pool = None
+                self.__own_connection_pool = False
+            self.session.close()
+            self.session = None
+            self.database_writer = None
+
+    @timed('init_game')
+    def init_game(self, url: str, session) -> json:
+        """Init the game by making the API request
+
+        Args:
+            url (str): API URL
+
+        Returns:
+            json: API response in json format
+        """
+        return self.__request(session, 'GET', url)
+
+    def find_word(
+            self, length_target_word: int, number_vowels: int, 
+            number_consonants: int, api_post_url: str, session,
+            token_game: str = None, game_data: tuple = None,
+            initial_time_find_word: float = None) -> list:
+        """Find the target word
+
+        Args:
+            length_target_word (int): Length of the word target
+            number_vowels (int): Number of vowels in the target word
+            number_consonants (int): Number of consonants in the target word
+            token_game (str, optional): Token of the game, added to the events.
+            Defaults to None.
+            game_data (tuple, optional): Data of the game in the game table. 
+            If given, every attempt is checkpointed in the database. Defaults 
+            to None.
+            initial_time_find_word (float, optional): Time when the game 
+            started, from which the time played is checkpointed. Defaults to 
+            the time the first word is selected.
+
+        Returns:
+            list: API responses of the words sent
+        """
+        game_solver = GameSolver(
+            self.wordle_game, length_target_word, number_vowels,
+            number_consonants, self.selection_strategy, self.opening_book,
+            self.decision_tree, self.speculative_guesser, self.target_prior
+        )
+        if initial_time_find_word is None:
+            initial_time_find_word = time.time()
+        attempts = []
+        attempt_word = game_solver.next_word()
+        # Make the five attempts allowed by the game to find the word
+        while attempt_word is not None:
+            game_solver.speculate(attempt_word)
+            attempt_data = self.send_word(attempt_word, api_post_url, session)
+            attempts.append(attempt_data)
+            if game_data is not None:
+                self.database_writer.submit_checkpoint(
+                    game_data, session.cookies.get_dict(), attempt_data,
+                    time.time() - initial_time_find_word
+                )
+            events.emit('attempt', 'attempt', token_api=token_game, **attempt_data)
+            if attempt_data.get('score') == 1.0:
+                break
+            if len(attempts) == MAXIMUM_ATTEMPTS:
+                break
+            game_solver.register_feedback(
+                attempt_word,
+                attempt_data.get('position_array'),
+                attempt_data.get('right_letters_in_wrong_positions'),
+            )
+            attempt_word = game_solver.next_word()
+            if attempt_word is None:
+                events.emit(
+                    'no_possible_words', token_api=token_game,
+                    current_attemps=attempt_data.get('current_attemps')
+                )
+        return attempts
+
+    @timed('send_word')
+    def send_word(self, word: str, api_post_url: str, session) -> json:
+        """Sends the selected word to the API to verify if it is correct
+
+        Args:
+            word (str): Selected word
+
+        Returns:
+            json: API response when sending a word
+        """
+        data = {'result_word': word}
+        return self.__request(
+            session, 'POST', api_post_url, idempotent=False, json=data
+        )
+
+    def __request(
+            self, session, method: str, url: str, idempotent: bool = True,
+            **kwargs) -> json:
+        """Send a request to the API, retrying it with jittered backoff when it
+        fails
+
+        Requests that are not idempotent are only retried when the API did not
+        process them.
+
+        Args:
+            session (requests.Session): API session
+            method (str): HTTP method
+            url (str): URL of the request
+            idempotent (bool, optional): Whether the request can be sent twice.
+            Defaults to True.
+
+        Raises:
+            requests.RequestException: If the request failed and cannot be 
+            retried
+
+        Returns:
+            json: API response in json format
+        """
+        import requests
+
+        for retry in range(self.maximum_request_retries + 1):
+            if retry > 0:
+                time.sleep(RequestScheduler.backoff_delay(
+                    retry - 1, self.REQUEST_RETRY_DELAY
+                ))
+            try:
+                response = session.request(
+                    method, url, timeout=self.request_timeout, **kwargs
+                )
+                if response.status_code not in (
+                        RequestScheduler.RETRYABLE_STATUSES):
+                    response.raise_for_status()
+                    return response.json()
+                processed = response.status_code not in (
+                    RequestScheduler.UNPROCESSED_STATUSES
+                )
+                error = requests.HTTPError(
+                    f'{response.status_code} error for url: {url}',
+                    response=response
+                )
+            except (requests.ConnectionError, requests.Timeout) as exception:
+                # A request whose connection could not be opened never reached
+                # the API
+                processed = not Play.__connection_not_opened(exception)
+                error = exception
+            if processed and not idempotent:
+                break
+        raise error
+
+    @staticmethod
+    def __connection_not_opened(exception: Exception) -> bool:
+        """Check whether a request failed before its connection was opened,
+        because it was refused or timed out while connecting
+
+        Args:
+            exception (requests.RequestException): Error of the request
+
+        Returns:
+            bool: True if the request never reached the API
+        """
+        import requests
+        import urllib3
+
+        if isinstance(exception, requests.ConnectTimeout):
+            return True
+        # requests wraps the error of urllib3, whose reason is a 
+        # NewConnectionError, a subclass of ConnectTimeoutError, when the 
+        # connection could not be opened
+        reason = exception.args[0] if exception.args else None
+        reason = getattr(reason, 'reason', reason)
+        return isinstance(reason, urllib3.exceptions.ConnectTimeoutError)
+
+    def play_game(self) -> dict:
+        """Play a game against the API and queue it to be written in the
+        database
+
+        Returns:
+            dict: Token of the game, attempts, whether it was won and time taken
+        """
+        self.load()
+        self.open()
+        session = self.session
+        # # Initialize the game
+        initial_time_find_word = time.time()
+        word_data = self.init_game(self.api_get_url, session)
+        events.emit('game_started', token_api=word_data.get('id'), **{
+            key: value for key, value in word_data.items() if key != 'id'
+        })
+        id_target_word = word_data.get('id')
+        length_target_word = word_data.get('length_word')
+        number_of_vowels = word_data.get('vowels')
+        number_of_consonants = word_data.get('consonants')
+        data = (id_target_word, number_of_vowels, number_of_consonants, length_target_word)
+        # The game can be resumed by the resume command from its checkpoints
+        self.database_writer.submit_checkpoint(
+            data, session.cookies.get_dict(),
+            elapsed_time=time.time() - initial_time_find_word
+        )
+        # Play the game and find the target word
+        attempts = self.find_word(length_target_word, number_of_vowels, number_of_consonants, self.api_post_url, session, id_target_word, data, initial_time_find_word)
+        final_application_time = time.time()
+        total_time_find_word = final_application_time - initial_time_find_word
+        metrics.observe('wordle_phase_seconds', 'game', total_time_find_word)
+        total_application_time = final_application_time - self.initial_application_time
+        win_game_bool = any(
+            attempt_data.get('score') == 1.0 for attempt_data in attempts
+        )
+        if win_game_bool and self.target_prior is not None:
+            self.target_prior.observe(attempts[-1].get('word_sent'))
+        events.emit(
+            'game_finished', token_api=id_target_word, win=win_game_bool,
+            attempts=len(attempts),
+            word=attempts[-1].get('word_sent') if win_game_bool else None,
+            time_to_find_word=total_time_find_word,
+            total_time=total_application_time,
+            speculation=(
+                self.speculative_guesser.get_statistics()
+                if self.speculative_guesser is not None else None
+            )
+        )
+        times_data = (total_time_find_word, total_application_time, win_game_bool, id_target_word)
+        # The game is written by the background thread of the writer
+        self.database_writer.submit_game(data, attempts, times_data)
+        return {
+            'token_api': id_target_word,
+            'attempts': attempts,
+            'win': win_game_bool,
+            'time_to_find_word': total_time_find_word,
+        }
+
+
+class RequestScheduler:
+    # Priorities of the requests, the lowest value is sent first, so the games
+    # already started finish before new ones are started
+    PRIORITY_SEND_WORD = 0
+    PRIORITY_INIT_GAME = 1
+    # Status codes of the responses that are retried
+    RETRYABLE_STATUSES = frozenset((429, 502, 503, 504))
+    # Status codes whose requests were not processed by the API, so they are 
+    # retried even when they are not idempotent
+    UNPROCESSED_STATUSES = frozenset((429, 503))
+    # Status codes that mean the API is overloaded, so the concurrency limit 
+    # is decreased. Other failures are transient and only retried
+    OVERLOAD_STATUSES = frozenset((429,))
+    # Factor applied to the concurrency limit when the latency is too high
+    DECREASE_FACTOR = 0.5
+
+    def __init__(
+            self, maximum_concurrency: int = 50,
+            initial_concurrency: int = None, minimum_concurrency: int = 1,
+            requests_per_second: float = None, burst: int = None,
+            target_latency: float = 2.0, timeout: float = 10.0,
+            maximum_retries: int = 3, retry_delay: float = 0.1,
+            latency_window: int = 100) -> None:
+        """RequestScheduler class constructor
+
+        Sends the API requests of all the games played on an event loop. The
+        requests are limited by a token bucket and by a concurrency limit that
+        is adjusted with AIMD: it grows by one request every round of requests
+        whose p95 latency is under the target, and it is halved when the p95
+        latency is over the target or the API signals that it is overloaded, 
+        with a 429 status or a timeout. Other failures, like a random 503, are
+        retried without decreasing the limit. The requests waiting for room 
+        are sent by priority.
+
+        Args:
+            maximum_concurrency (int, optional): Maximum number of requests in
+            flight. Defaults to 50.
+            initial_concurrency (int, optional): Initial number of requests in
+            flight. Defaults to maximum_concurrency.
+            minimum_concurrency (int, optional): Minimum number of requests in
+            flight. Defaults to 1.
+            requests_per_second (float, optional): Rate of the token bucket, 
+            None to not limit the rate. Defaults to None.
+            burst (int, optional): Size of the token bucket. Defaults to one 
+            second of requests.
+            target_latency (float, optional): Target p95 latency in seconds. 
+            Defaults to 2.0.
+            timeout (float, optional): Seconds allowed for every request. 
+            Defaults to 10.0.
+            maximum_retries (int, optional): Number of retries of a failed 
+            request. Defaults to 3.
+            retry_delay (float, optional): Base delay of the backoff between 
+            retries, in seconds. Defaults to 0.1.
+            latency_window (int, optional): Number of latencies used to compute
+            the p95 latency. Defaults to 100.
+        """
+        if initial_concurrency is None:
+            initial_concurrency = maximum_concurrency
+        self.maximum_concurrency = maximum_concurrency
+        self.minimum_concurrency = minimum_concurrency
+        self.concurrency_limit = float(initial_concurrency)
+        self.requests_per_second = requests_per_second
+        if burst is None and requests_per_second is not None:
+            burst = max(1, math.ceil(requests_per_second))
+        self.burst = burst
+        self.target_latency = target_latency
+        self.timeout = timeout
+        self.maximum_retries = maximum_retries
+        self.retry_delay = retry_delay
+        self.requests = 0
+        self.retries = 0
+        self.failures = 0
+        self.__latencies = deque(maxlen=latency_window)
+        # Latencies of the current round of requests
+        self.__round_latencies = []
+        # Number of requests sent when the limit was last decreased
+        self.__last_decrease = None
+        self.__in_flight = 0
+        # Heap of the requests waiting for room: priority, arrival order and
+        # future resolved when the request can be sent
+        self.__waiting_requests = []
+        self.__arrival_order = itertools.count()
+        self.__tokens = burst
+        self.__token_time = time.monotonic()
+
+    @staticmethod
+    def backoff_delay(retry: int, retry_delay: float) -> float:
+        """Return the delay before a retry, exponential with full jitter
+
+        Args:
+            retry (int): Number of the retry, starting at 0
+            retry_delay (float): Base delay in seconds
+
+        Returns:
+            float: Seconds to wait
+        """
+        return random.uniform(0, retry_delay * 2 ** retry)
+
+    async def request(
+            self, session, method: str, url: str, priority: int,
+            idempotent: bool = True, **kwargs) -> dict:
+        """Send a request and return its json response, retrying it when it 
+        fails
+
+        Requests that are not idempotent are only retried when the API did not
+        process them.
+
+        Args:
+            session (aiohttp.ClientSession): HTTP session of the game
+            method (str): HTTP method
+            url (str): URL of the request
+            priority (int): Priority of the request, PRIORITY_SEND_WORD or 
+            PRIORITY_INIT_GAME
+            idempotent (bool, optional): Whether the request can be sent twice.
+            Defaults to True.
+
+        Raises:
+            aiohttp.ClientError: If the request failed and cannot be retried
+            asyncio.TimeoutError: If the last retry timed out
+
+        Returns:
+            dict: API response in json format
+        """
+        import asyncio
+        import aiohttp
+
+        timeout = aiohttp.ClientTimeout(total=self.timeout)
+        for retry in range(self.maximum_retries + 1):
+            if retry > 0:
+                self.retries += 1
+                await asyncio.sleep(
+                    self.backoff_delay(retry - 1, self.retry_delay)
+                )
+            # The room is given back when the request fails or is cancelled,
+            # also while it waits for a token
+            room_acquired = False
+            try:
+                await self.__acquire(priority)
+                room_acquired = True
+                await self.__take_token()
+                self.requests += 1
+                initial_time = time.perf_counter()
+                async with session.request(
+                    method, url, timeout=timeout, **kwargs
+                ) as response:
+                    if response.status not in self.RETRYABLE_STATUSES:
+                        response.raise_for_status()
+                        response_data = await response.json()
+                        self.__observe_latency(
+                            time.perf_counter() - initial_time
+                        )
+                        return response_data
+                    processed = response.status not in self.UNPROCESSED_STATUSES
+                    overloaded = response.status in self.OVERLOAD_STATUSES
+                    error = aiohttp.ClientResponseError(
+                        response.request_info, response.history,
+                        status=response.status, message=response.reason
+                    )
+            except (asyncio.TimeoutError, aiohttp.ClientConnectionError) as exception:
+                # A request whose connection could not be opened never reached
+                # the API
+                processed = not isinstance(
+                    exception, aiohttp.ClientConnectorError
+                )
+                # A timeout is a latency far over the target
+                overloaded = isinstance(exception, asyncio.TimeoutError)
+                error = exception
+            finally:
+                if room_acquired:
+                    self.__release()
+            self.failures += 1
+            if overloaded:
+                self.__decrease_concurrency()
+            if processed and not idempotent:
+                break
+        raise error
+
+    def get_statistics(self) -> dict:
+        """Return the statistics of the scheduler
+
+        Returns:
+            dict: Concurrency limit, requests, retries, failures and p95 
+            latency
+        """
+        return {
+            'concurrency_limit': int(self.concurrency_limit),
+            'requests': self.requests,
+            'retries': self.retries,
+            'failures': self.failures,
+            'p95_latency': self.__p95_latency(self.__latencies),
+        }
+
+    async def __acquire(self, priority: int) -> None:
+        """Wait until there is room for the request under the concurrency 
+        limit. The room is not taken if the request is cancelled while waiting
+
+        Args:
+            priority (int): Priority of the request
+        """
+        import asyncio
+
+        if (
+            self.__waiting_requests
+            or self.__in_flight >= int(self.concurrency_limit)
+        ):
+            future = asyncio.get_running_loop().create_future()
+            heapq.heappush(
+                self.__waiting_requests,
+                (priority, next(self.__arrival_order), future)
+            )
+            try:
+                await future
+            except asyncio.CancelledError:
+                # The room given to a cancelled request is given back
+                if future.done() and not future.cancelled():
+                    self.__release()
+                raise
+        else:
+            self.__in_flight += 1
+
+    async def __take_token(self) -> None:
+        """Wait until the token bucket has a token for the request
+        """
+        import asyncio
+
+        if self.requests_per_second is None:
+            return
+        while True:
+            now = time.monotonic()
+            self.__tokens = min(
+                self.burst,
+                self.__tokens
+                + (now - self.__token_time) * self.requests_per_second
+            )
+            self.__token_time = now
+            if self.__tokens >= 1:
+                self.__tokens -= 1
+                return
+            await asyncio.sleep(
+                (1 - self.__tokens) / self.requests_per_second
+            )
+
+    def __release(self) -> None:
+        """Free the room of a request and let the waiting requests be sent
+        """
+        self.__in_flight -= 1
+        self.__wake_waiting_requests()
+
+    def __wake_waiting_requests(self) -> None:
+        """Let the waiting requests with the highest priority be sent while 
+        there is room
+        """
+        while (
+            self.__waiting_requests
+            and self.__in_flight < int(self.concurrency_limit)
+        ):
+            _, _, future = heapq.heappop(self.__waiting_requests)
+            if future.cancelled():
+                continue
+            self.__in_flight += 1
+            future.set_result(None)
+
+    def __observe_latency(self, latency: float) -> None:
+        """Record the latency of a request and adjust the concurrency limit
+        after every round of requests
+
+        Args:
+            latency (float): Seconds taken by the request
+        """
+        self.__latencies.append(latency)
+        self.__round_latencies.append(latency)
+        if len(self.__round_latencies) < int(self.concurrency_limit):
+            return
+        if self.__p95_latency(self.__round_latencies) > self.target_latency:
+            self.__decrease_concurrency()
+        else:
+            self.concurrency_limit = min(
+                self.maximum_concurrency, self.concurrency_limit + 1
+            )
+            self.__wake_waiting_requests()
+        self.__round_latencies = []
+
+    def __decrease_concurrency(self) -> None:
+        """Reduce the concurrency limit, at most once every round of requests
+        """
+        if (
+            self.__last_decrease is not None
+            and self.requests - self.__last_decrease
+            < int(self.concurrency_limit)
+        ):
+            return
+        self.__last_decrease = self.requests
+        self.__round_latencies = []
+        self.concurrency_limit = max(
+            self.minimum_concurrency,
+            self.concurrency_limit * self.DECREASE_FACTOR
+        )
+
+    @staticmethod
+    def __p95_latency(latencies: list) -> float:
+        """Return the p95 of a list of latencies
+
+        Args:
+            latencies (list): Latencies in seconds
+
+        Returns:
+            float: p95 latency in seconds, 0.0 if there are no latencies
+        """
+        if not latencies:
+            return 0.0
+        latencies = sorted(latencies)
+        return latencies[math.ceil(0.95 * len(latencies)) - 1]
+
+
+class ConcurrentGameRunner:
+    def __init__(
+            self, user_name_api: str, password_api: str, api_get_url: str,
+            api_post_url: str, wordle_game: WordleGame,
+            selection_strategy: str = 'frequency',
+            opening_book: OpeningBook = None,
+            maximum_concurrent_games: int = 50,
+            decision_tree: DecisionTree = None,
+            database_writer: DatabaseWriter = None,
+            request_scheduler: RequestScheduler = None,
+            target_prior: TargetPrior = None,
+            speculative_guesser: SpeculativeGuesser = None) -> None:
+        """ConcurrentGameRunner class constructor
+
+        Plays several games at the same time on a single event loop. The word 
+        bank, its indexes and the opening book are shared by all the games, and
+        their API requests are sent by a single request scheduler. The 
+        speculative guesser is shared as well, so its workers predict the next
+        word of some of the games while their words are being sent.
+
+        Args:
+            user_name_api (str): API account username
+            password_api (str): API account password
+            api_get_url (str): API URL to start a game
+            api_post_url (str): API URL to send a word
+            wordle_game (WordleGame): Wordle game shared by all the games
+            selection_strategy (str, optional): Strategy used to select the 
+            words. Defaults to 'frequency'.
+            opening_book (OpeningBook, optional): Opening book. Defaults to None.
+            maximum_concurrent_games (int, optional): Maximum number of games 
+            played at the same time. Defaults to 50.
+            decision_tree (DecisionTree, optional): Decision tree. Defaults to 
+            None.
+            database_writer (DatabaseWriter, optional): Writer that records the
+            games and their attempts in the database. Defaults to None.
+            request_scheduler (RequestScheduler, optional): Scheduler of the API
+            requests. By default a scheduler with maximum_concurrent_games 
+            requests in flight is created.
+            target_prior (TargetPrior, optional): Prior of the target words, 
+            updated with the games won. Defaults to None.
+            speculative_guesser (SpeculativeGuesser, optional): Guesser that
+            computes the next word while a word is being sent. Defaults to 
+            None.
+        """
+        if request_scheduler is None:
+            request_scheduler = RequestScheduler(maximum_concurrent_games)
+        self.user_name_api = user_name_api
+        self.password_api = password_api
+        self.api_get_url = api_get_url
+        self.api_post_url = api_post_url
+        self.wordle_game = wordle_game
+        self.selection_strategy = selection_strategy
+        self.opening_book = opening_book
+        self.maximum_concurrent_games = maximum_concurrent_games
+        self.decision_tree = decision_tree
+        self.database_writer = database_writer
+        self.request_scheduler = request_scheduler
+        self.target_prior = target_prior
+        self.speculative_guesser = speculative_guesser
+
+    def run(self, number_of_games: int, jobs: list = None) -> dict:
+        """Play a number of games and report the aggregate throughput
+
+        Args:
+            number_of_games (int): Number of games to play
+            jobs (list, optional): job_id and worker_id of the queued job of 
+            every game. Defaults to None.
+
+        Returns:
+            dict: Summary with the results of the games and the throughput
+        """
+        import asyncio
+
+        return asyncio.run(self.play_games(number_of_games, jobs))
+
+    def resume(self, unfinished_games: list) -> dict:
+        """Finish the games left in progress by a process that stopped
+
+        Args:
+            unfinished_games (list): Games in progress, as returned by 
+            Database.get_unfinished_games
+
+        Returns:
+            dict: Summary with the results of the games and the throughput
+        """
+        import asyncio
+
+        return asyncio.run(self.play_games(
+            len(unfinished_games), unfinished_games=unfinished_games
+        ))
+
+    async def play_games(
+            self, number_of_games: int, jobs: list = None,
+            unfinished_games: list = None) -> dict:
+        """Play a number of games concurrently
+
+        Args:
+            number_of_games (int): Number of games to play
+            jobs (list, optional): job_id and worker_id of the queued job of 
+            every game. Defaults to None.
+            unfinished_games (list, optional): Games in progress resumed 
+            instead of starting new ones. Defaults to None.
+
+        Returns:
+            dict: Summary with the results of the games and the throughput
+        """
+        import asyncio
+        import aiohttp
+
+        semaphore = asyncio.Semaphore(self.maximum_concurrent_games)
+        # The connections are pooled and kept alive between games, while every
+        # game keeps its own cookies in its own session
+        connector = aiohttp.TCPConnector(limit=self.maximum_concurrent_games)
+        auth = aiohttp.BasicAuth(self.user_name_api, self.password_api)
+        if jobs is None:
+            jobs = [None] * number_of_games
+        if unfinished_games is None:
+            unfinished_games = [None] * number_of_games
+        initial_time = time.perf_counter()
+        try:
+            games = await asyncio.gather(*(
+                self.__play_game_limited(
+                    semaphore, connector, auth, job, unfinished_game
+                )
+                for job, unfinished_game in zip(jobs, unfinished_games)
+            ), return_exceptions=True)
+        finally:
+            await connector.close()
+            if self.speculative_guesser is not None:
+                # The workers are started again by the next run
+                self.speculative_guesser.close()
+        elapsed_time = time.perf_counter() - initial_time
+        results = [game for game in games if isinstance(game, dict)]
+        number_of_attempts = sum(len(game['attempts']) for game in results)
+        summary = {
+            'games': len(results),
+            'failed_games': number_of_games - len(results),
+            'wins': sum(game['win'] for game in results),
+            'attempts': number_of_attempts,
+            'elapsed_time': elapsed_time,
+            'games_per_second': len(results) / elapsed_time,
+            'attempts_per_second': number_of_attempts / elapsed_time,
+            'results': results,
+            'request_scheduler': self.request_scheduler.get_statistics(),
+        }
+        if self.speculative_guesser is not None:
+            summary['speculative_guesser'] = (
+                self.speculative_guesser.get_statistics()
+            )
+        if self.wordle_game.filter_cache is not None:
+            summary['filter_cache'] = (
+                self.wordle_game.filter_cache.get_statistics()
+            )
+        # The summary is recorded with the events and metrics of the games, 
+        # the commands print it
+        metrics.observe('wordle_phase_seconds', 'run', elapsed_time)
+        events.emit('run_finished', **{
+            key: value for key, value in summary.items() if key != 'results'
+        })
+        events.flush()
+        return summary
+
+    async def __play_game_limited(
+            self, semaphore: 'asyncio.Semaphore', connector, auth,
+            job: tuple = None, unfinished_game: dict = None) -> dict:
+        """Play a game once there is room under the concurrency limit
+
+        Args:
+            semaphore (asyncio.Semaphore): Semaphore of the concurrency limit
+            connector (aiohttp.TCPConnector): Shared connection pool
+            auth (aiohttp.BasicAuth): API credentials
+            job (tuple, optional): job_id and worker_id of the queued job of 
+            the game. Defaults to None.
+            unfinished_game (dict, optional): Game in progress to be resumed.
+            Defaults to None.
+
+        Returns:
+            dict: Result of the game
+        """
+        import aiohttp
+
+        # A resumed game continues in the API session of its checkpoints
+        cookies = None
+        if unfinished_game is not None:
+            cookies = unfinished_game['session_cookies']
+        async with semaphore:
+            async with aiohttp.ClientSession(
+                connector=connector, connector_owner=False, auth=auth,
+                cookie_jar=aiohttp.CookieJar(unsafe=True), cookies=cookies
+            ) as session:
+                return await self.play_game(session, job, unfinished_game)
+
+    async def play_game(
+            self, session, job: tuple = None,
+            unfinished_game: dict = None) -> dict:
+        """Play a whole game
+
+        The game is checkpointed in the database after it is started and after
+        every word sent, so it can be resumed if the process stops. The words 
+        are selected in worker threads, so filtering and selecting them does 
+        not stall the other games and their requests, and the next word is 
+        speculated while a word is being sent.
+
+        Args:
+            session (aiohttp.ClientSession): HTTP session of the game
+            job (tuple, optional): job_id and worker_id of the queued job of 
+            the game, finished when the game is written. Defaults to None.
+            unfinished_game (dict, optional): Game in progress, as returned by 
+            Database.get_unfinished_games. Its attempts are replayed and the 
+            game continues with the attempts left instead of starting a new 
+            one. Defaults to None.
+
+        Returns:
+            dict: Token of the game, attempts, whether it was won and time taken
+        """
+        import asyncio
+
+        initial_time = time.perf_counter()
+        if unfinished_game is not None:
+            # The time played before the process stopped is kept
+            initial_time -= unfinished_game['elapsed_time']
+        if unfinished_game is None:
+            with metrics.time('init_game'):
+                word_data = await self.request_scheduler.request(
+                    session, 'GET', self.api_get_url,
+                    RequestScheduler.PRIORITY_INIT_GAME
+                )
+            token_game = word_data.get('id')
+            length_target_word = word_data.get('length_word')
+            number_vowels = word_data.get('vowels')
+            number_consonants = word_data.get('consonants')
+            events.emit('game_started', token_api=token_game, **{
+                key: value for key, value in word_data.items() if key != 'id'
+            })
+            attempts = []
+        else:
+            token_game = unfinished_game['token_api']
+            length_target_word = unfinished_game['length_word']
+            number_vowels = unfinished_game['number_vowels']
+            number_consonants = unfinished_game['number_consonants']
+            attempts = list(unfinished_game['attempts'])
+            events.emit(
+                'game_resumed', token_api=token_game, attempts=len(attempts)
+            )
+        game_data = (
+            token_game, number_vowels, number_consonants, length_target_word,
+        )
+        game_solver = GameSolver(
+            self.wordle_game, length_target_word, number_vowels,
+            number_consonants, self.selection_strategy, self.opening_book,
+            self.decision_tree, self.speculative_guesser, self.target_prior
+        )
+        win = any(attempt_data.get('score') == 1.0 for attempt_data in attempts)
+        attempt_word = None
+        if unfinished_game is None:
+            await self.__checkpoint_game(session, game_data, initial_time)
+            attempt_word = await asyncio.to_thread(game_solver.next_word)
+        elif not win and len(attempts) < MAXIMUM_ATTEMPTS:
+            # The words already sent are replayed in a single filtering pass
+            await asyncio.to_thread(game_solver.replay, [
+                (
+                    attempt_data.get('word_sent'),
+                    attempt_data.get('position_array'),
+                    attempt_data.get('right_letters_in_wrong_positions'),
+                )
+                for attempt_data in attempts
+            ])
+            attempt_word = await asyncio.to_thread(game_solver.next_word)
+        while attempt_word is not None:
+            if self.speculative_guesser is not None:
+                # The possible words may still have to be filtered
+                await asyncio.to_thread(game_solver.speculate, attempt_word)
+            with metrics.time('send_word'):
+                attempt_data = await self.request_scheduler.request(
+                    session, 'POST', self.api_post_url,
+                    RequestScheduler.PRIORITY_SEND_WORD, idempotent=False,
+                    json={'result_word': attempt_word}
+                )
+            attempts.append(attempt_data)
+            await self.__checkpoint_game(
+                session, game_data, initial_time, attempt_data
+            )
+            events.emit('attempt', 'attempt', token_api=token_game, **attempt_data)
+            if attempt_data.get('score') == 1.0:
+                win = True
+                if self.target_prior is not None:
+                    self.target_prior.observe(attempt_word)
+                break
+            # A word sent right before the process stopped may have been 
+            # counted by the API without being checkpointed
+            if max(len(attempts), attempt_data.get('current_attemps') or 0) >= (
+                    MAXIMUM_ATTEMPTS):
+                break
+            game_solver.register_feedback(
+                attempt_word, attempt_data.get('position_array'),
+                attempt_data.get('right_letters_in_wrong_positions')
+            )
+            attempt_word = await asyncio.to_thread(game_solver.next_word)
+            if attempt_word is None:
+                events.emit(
+                    'no_possible_words', token_api=token_game,
+                    current_attemps=attempt_data.get('current_attemps')
+                )
+        time_to_find_word = time.perf_counter() - initial_time
+        metrics.observe('wordle_phase_seconds', 'game', time_to_find_word)
+        events.emit(
+            'game_finished', token_api=token_game, win=win,
+            attempts=len(attempts),
+            word=attempts[-1].get('word_sent') if win else None,
+            time_to_find_word=time_to_find_word, total_time=time_to_find_word
+        )
+        if self.database_writer is not None:
+            times_data = (time_to_find_word, time_to_find_word, win, token_game)
+            await self.__submit_to_database_writer(
+                self.database_writer.submit_game, game_data, attempts,
+                times_data, job
+            )
+        return {
+            'token_api': token_game,
+            'attempts': attempts,
+            'win': win,
+            'time_to_find_word': time_to_find_word,
+        }
+
+    async def __checkpoint_game(
+            self, session, game_data: tuple, initial_time: float,
+            attempt_data: dict = None) -> None:
+        """Queue the checkpoint of a game in progress with the cookies of its
+        API session
+
+        Args:
+            session (aiohttp.ClientSession): HTTP session of the game
+            game_data (tuple): Data of the game in the game table
+            initial_time (float): perf_counter time when the game started
+            attempt_data (dict, optional): API response of the word just sent.
+            Defaults to None.
+        """
+        if (
+            self.database_writer is None
+            or self.database_writer.session_cookies_key is None
+        ):
+            # Without the key the game could not be resumed from the 
+            # checkpoint
+            return
+        session_cookies = {
+            cookie.key: cookie.value for cookie in session.cookie_jar
+        }
+        await self.__submit_to_database_writer(
+            self.database_writer.submit_checkpoint, game_data, session_cookies,
+            attempt_data, time.perf_counter() - initial_time
+        )
+
+    async def __submit_to_database_writer(
+            self, submit_function, *arguments) -> None:
+        """Queue a write in the database writer
+
+        Args:
+            submit_function (callable): Method of the database writer
+        """
+        if self.database_writer.is_full():
+            # Wait for room in the queue without blocking the event loop
+            import asyncio
+
+            await asyncio.to_thread(submit_function, *arguments)
+        else:
+            submit_function(*arguments)
+
+
+class GameQueueWorker:
+    def __init__(
+            self, connection_pool, game_runner: ConcurrentGameRunner,
+            worker_id: str = None, batch_size: int = 50,
+            heartbeat_interval: float = 10.0, stale_timeout: float = 60.0,
+            maximum_claims: int = 3, poll_interval: float = 1.0) -> None:
+        """GameQueueWorker class constructor
+
+        Plays the games queued in the game_job table of the database. Workers
+        on several machines share the queue: every worker claims batches of 
+        pending jobs with SELECT ... FOR UPDATE SKIP LOCKED, so no job is 
+        claimed twice and the workers never wait on each other. The running 
+        jobs are heartbeated from a background thread, and the jobs of workers
+        that stopped heartbeating are queued again. Every game is written with
+        its job in the same transaction by the database writer of the runner.
+
+        Args:
+            connection_pool (psycopg2.pool.AbstractConnectionPool): Pool of 
+            database connections, with room for the worker and its heartbeat
+            game_runner (ConcurrentGameRunner): Runner that plays the batches,
+            with a database writer
+            worker_id (str, optional): Identifier of the worker. Defaults to 
+            the host name, the process id and a random suffix.
+            batch_size (int, optional): Number of jobs claimed at a time. 
+            Defaults to 50.
+            heartbeat_interval (float, optional): Seconds between heartbeats.
+            Defaults to 10.0.
+            stale_timeout (float, optional): Seconds without a heartbeat after
+            which the jobs of a worker are queued again. Defaults to 60.0.
+            maximum_claims (int, optional): Number of times a job is claimed
+            before it is marked as failed. Defaults to 3.
+            poll_interval (float, optional): Seconds waited when there are no
+            pending jobs. Defaults to 1.0.
+
+        Raises:
+            ValueError: If the game runner has no database writer
+        """
+        if game_runner.database_writer is None:
+            raise ValueError('The game runner must have a database writer')
+        if worker_id is None:
+            worker_id = (
+                f'{socket.gethostname()}-{os.getpid()}-{uuid.uuid4().hex[:8]}'
+            )
+        self.connection_pool = connection_pool
+        self.game_runner = game_runner
+        self.worker_id = worker_id
+        self.batch_size = batch_size
+        self.heartbeat_interval = heartbeat_interval
+        self.stale_timeout = stale_timeout
+        self.maximum_claims = maximum_claims
+        self.poll_interval = poll_interval
+
+    def run(
+            self, maximum_jobs: int = None,
+            exit_when_empty: bool = False) -> dict:
+        """Claim and play batches of jobs until the limit is reached
+
+        Args:
+            maximum_jobs (int, optional): Maximum number of jobs to claim, None
+            to keep running. Defaults to None.
+            exit_when_empty (bool, optional): Whether to stop when there are no
+            pending jobs instead of waiting for new ones. Defaults to False.
+
+        Returns:
+            dict: Number of jobs claimed and released, games played and won, 
+            and the throughput
+        """
+        database = Database(connection_pool=self.connection_pool)
+        stop_heartbeat = threading.Event()
+        heartbeat_thread = threading.Thread(
+            target=self.__heartbeat, args=(stop_heartbeat,), daemon=True
+        )
+        claimed_jobs = 0
+        released_jobs = 0
+        number_of_games = 0
+        number_of_wins = 0
+        initial_time = time.perf_counter()
+        try:
+            database.check_schema()
+            heartbeat_thread.start()
+            while maximum_jobs is None or claimed_jobs < maximum_jobs:
+                batch_size = self.batch_size
+                if maximum_jobs is not None:
+                    batch_size = min(batch_size, maximum_jobs - claimed_jobs)
+                database.requeue_stale_jobs(
+                    self.stale_timeout, self.maximum_claims
+                )
+                job_ids = database.claim_jobs(self.worker_id, batch_size)
+                if not job_ids:
+                    if exit_when_empty:
+                        break
+                    time.sleep(self.poll_interval)
+                    continue
+                claimed_jobs += len(job_ids)
+                summary = self.game_runner.run(len(job_ids), [
+                    (job_id, self.worker_id) for job_id in job_ids
+                ])
+                number_of_games += summary['games']
+                number_of_wins += summary['wins']
+                # The jobs are finished as their games are written, so the 
+                # ones still running failed to be played or written
+                self.game_runner.database_writer.flush()
+                released_jobs += len(database.release_jobs(
+                    self.worker_id, self.maximum_claims
+                ))
+        finally:
+            stop_heartbeat.set()
+            if heartbeat_thread.is_alive():
+                heartbeat_thread.join()
+            try:
+                database.release_jobs(self.worker_id, self.maximum_claims)
+            finally:
+                database.close_connection()
+        elapsed_time = time.perf_counter() - initial_time
+        summary = {
+            'worker_id': self.worker_id,
+            'claimed_jobs': claimed_jobs,
+            'released_jobs': released_jobs,
+            'games': number_of_games,
+            'wins': number_of_wins,
+            'elapsed_time': elapsed_time,
+            'games_per_second': number_of_games / elapsed_time,
+        }
+        events.emit('worker_finished', **summary)
+        return summary
+
+    def __heartbeat(self, stop_heartbeat: threading.Event) -> None:
+        """Heartbeat the running jobs of the worker until it stops
+
+        Args:
+            stop_heartbeat (threading.Event): Event set when the worker stops
+        """
+        database = Database(connection_pool=self.connection_pool)
+        try:
+            while not stop_heartbeat.wait(self.heartbeat_interval):
+                try:
+                    database.heartbeat_jobs(self.worker_id)
+                except Exception as error:
+                    # The next heartbeat is tried anyway, the jobs are only 
+                    # queued again after stale_timeout seconds
+                    print(
+                        f'No se pudo registrar el latido del worker: {error}',
+                        file=sys.stderr
+                    )
+        finally:
+            database.close_connection()
@@ -0,0 +1,381 @@
+import atexit
+import bisect
+from collections import deque
+import functools
+import json
+import math
+import os
+import sys
+import threading
+import time
+
+
+class Metrics:
+    # Upper bounds of the histogram buckets of the phase durations, in seconds
+    LATENCY_BUCKETS = (
+        0.0001, 0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5,
+        5.0, 10.0, math.inf,
+    )
+    # Upper bounds of the histogram buckets of the number of possible words
+    SIZE_BUCKETS = (1, 2, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, math.inf)
+
+    def __init__(self, enabled: bool = False) -> None:
+        """Metrics class constructor
+
+        Histograms of the duration of every phase of a game and of the number 
+        of possible words per attempt. While it is disabled, timing a phase 
+        only costs a method call.
+
+        Args:
+            enabled (bool, optional): Record the measurements. Defaults to False.
+        """
+        self.enabled = enabled
+        self.__histograms = {}
+        self.__lock = threading.Lock()
+
+    def time(self, phase: str) -> 'PhaseTimer':
+        """Return a context manager that measures the duration of a phase
+
+        Args:
+            phase (str): Name of the phase
+
+        Returns:
+            PhaseTimer: Timer of the phase
+        """
+        if not self.enabled:
+            return DISABLED_PHASE_TIMER
+        return PhaseTimer(self, phase)
+
+    def observe(
+            self, name: str, label: str, value: float,
+            buckets: tuple = LATENCY_BUCKETS) -> None:
+        """Record a value in a histogram
+
+        Args:
+            name (str): Name of the histogram
+            label (str): Label of the value inside the histogram
+            value (float): Value observed
+            buckets (tuple, optional): Upper bounds of the buckets. Defaults to
+            LATENCY_BUCKETS.
+        """
+        if not self.enabled:
+            return
+        with self.__lock:
+            histogram = self.__histograms.get((name, label))
+            if histogram is None:
+                histogram = {
+                    'buckets': buckets, 'counts': [0] * len(buckets),
+                    'sum': 0.0, 'count': 0,
+                }
+                self.__histograms[name, label] = histogram
+            histogram['counts'][bisect.bisect_left(buckets, value)] += 1
+            histogram['sum'] += value
+            histogram['count'] += 1
+
+    def observe_possible_words(self, number_of_words: int) -> None:
+        """Record the number of possible words of an attempt
+
+        Args:
+            number_of_words (int): Number of possible words
+        """
+        self.observe(
+            'wordle_possible_words', 'select_word', number_of_words,
+            self.SIZE_BUCKETS
+        )
+
+    def to_dict(self) -> dict:
+        """Return the histograms recorded
+
+        Returns:
+            dict: Histograms by name and label with their cumulative bucket 
+            counts, sum and count
+        """
+        result = {}
+        with self.__lock:
+            for (name, label), histogram in sorted(self.__histograms.items()):
+                cumulative_count = 0
+                buckets = {}
+                for bound, count in zip(
+                        histogram['buckets'], histogram['counts']):
+                    cumulative_count += count
+                    buckets['+Inf' if bound == math.inf else str(bound)] = (
+                        cumulative_count
+                    )
+                result.setdefault(name, {})[label] = {
+                    'buckets': buckets,
+                    'sum': histogram['sum'],
+                    'count': histogram['count'],
+                }
+        return result
+
+    def to_prometheus(self) -> str:
+        """Return the histograms recorded in the Prometheus text format
+
+        Returns:
+            str: Histograms in the Prometheus text format
+        """
+        lines = []
+        label_name = 'phase'
+        for name, histograms in self.to_dict().items():
+            lines.append(f'# TYPE {name} histogram')
+            for label, histogram in histograms.items():
+                for bound, count in histogram['buckets'].items():
+                    lines.append(
+                        f'{name}_bucket{{{label_name}="{label}",le="{bound}"}} '
+                        f'{count}'
+                    )
+                lines.append(
+                    f'{name}_sum{{{label_name}="{label}"}} {histogram["sum"]}'
+                )
+                lines.append(
+                    f'{name}_count{{{label_name}="{label}"}} '
+                    f'{histogram["count"]}'
+                )
+        return '\n'.join(lines) + '\n'
+
+    def export(self, file_path: str) -> None:
+        """Write the histograms recorded to a file, in json format if the file
+        has the json extension and in the Prometheus text format otherwise
+
+        Args:
+            file_path (str): Location of the file
+        """
+        if not self.enabled:
+            return
+        try:
+            with open(file=file_path, mode='w', encoding='utf-8') as metrics_file:
+                if file_path.endswith('.json'):
+                    json.dump(self.to_dict(), metrics_file)
+                else:
+                    metrics_file.write(self.to_prometheus())
+        except OSError:
+            print('Error writing the metrics file', file=sys.stderr)
+
+
+class PhaseTimer:
+    def __init__(self, metrics: Metrics, phase: str) -> None:
+        """PhaseTimer class constructor
+
+        Args:
+            metrics (Metrics): Metrics where the duration is recorded
+            phase (str): Name of the phase
+        """
+        self.metrics = metrics
+        self.phase = phase
+        self.initial_time = 0.0
+
+    def __enter__(self) -> 'PhaseTimer':
+        self.initial_time = time.perf_counter()
+        return self
+
+    def __exit__(self, *exception_info) -> None:
+        self.metrics.observe(
+            'wordle_phase_seconds', self.phase,
+            time.perf_counter() - self.initial_time
+        )
+
+
+class DisabledPhaseTimer:
+    def __enter__(self) -> 'DisabledPhaseTimer':
+        return self
+
+    def __exit__(self, *exception_info) -> None:
+        pass
+
+
+DISABLED_PHASE_TIMER = DisabledPhaseTimer()
+# Metrics of the process, enabled when a metrics file is configured
+metrics = Metrics()
+
+
+def timed(phase: str):
+    """Decorate a function so that its duration is recorded as a phase of the
+    metrics of the process
+
+    Args:
+        phase (str): Name of the phase
+    """
+    def decorator(function):
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            if not metrics.enabled:
+                return function(*args, **kwargs)
+            with PhaseTimer(metrics, phase):
+                return function(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+class EventSink:
+    # Records emitted by each verbosity: nothing, one per game or one per game
+    # and per attempt
+    VERBOSITY_LEVELS = {'off': 0, 'game': 1, 'attempt': 2}
+
+    def __init__(
+            self, file_path: str = None, verbosity: str = 'off',
+            flush_interval: float = 1.0,
+            maximum_bytes: int = 10 * 1024 * 1024, backup_count: int = 3,
+            ring_buffer_size: int = 1000) -> None:
+        """EventSink class constructor
+
+        Emits one compact json record per event. The last records are kept in
+        a ring buffer and, when there is a file, they are written to it in 
+        batches: at most once every flush interval, when the sink is flushed or
+        closed, and at exit. While it is off, emitting an event only costs a 
+        dictionary lookup.
+
+        Args:
+            file_path (str, optional): Location of the JSONL file, '-' for the
+            standard error. By default the records are only kept in the ring
+            buffer.
+            verbosity (str, optional): 'off', 'game' or 'attempt'. Defaults to
+            'off'.
+            flush_interval (float, optional): Seconds between writes of the 
+            file. Defaults to 1.0.
+            maximum_bytes (int, optional): Size from which the file is rotated,
+            0 to never rotate it. Defaults to 10 MiB.
+            backup_count (int, optional): Number of rotated files kept. 
+            Defaults to 3.
+            ring_buffer_size (int, optional): Number of records kept in memory.
+            Defaults to 1000.
+        """
+        self.__lock = threading.Lock()
+        self.__file = None
+        self.__pending_lines = []
+        self.configure(
+            file_path, verbosity, flush_interval, maximum_bytes, backup_count,
+            ring_buffer_size
+        )
+        atexit.register(self.close)
+
+    def configure(
+            self, file_path: str = None, verbosity: str = 'attempt',
+            flush_interval: float = 1.0,
+            maximum_bytes: int = 10 * 1024 * 1024, backup_count: int = 3,
+            ring_buffer_size: int = 1000) -> None:
+        """Change the destination and verbosity of the records, writing the 
+        pending ones first
+
+        Args:
+            file_path (str, optional): Location of the JSONL file, '-' for the
+            standard error. Defaults to None.
+            verbosity (str, optional): 'off', 'game' or 'attempt'. Defaults to
+            'attempt'.
+            flush_interval (float, optional): Seconds between writes of the 
+            file. Defaults to 1.0.
+            maximum_bytes (int, optional): Size from which the file is rotated.
+            Defaults to 10 MiB.
+            backup_count (int, optional): Number of rotated files kept. 
+            Defaults to 3.
+            ring_buffer_size (int, optional): Number of records kept in memory.
+            Defaults to 1000.
+
+        Raises:
+            ValueError: If the verbosity is unknown
+        """
+        if verbosity not in self.VERBOSITY_LEVELS:
+            raise ValueError(f'Unknown verbosity: {verbosity}')
+        self.close()
+        with self.__lock:
+            self.file_path = file_path
+            self.verbosity = verbosity
+            self.flush_interval = flush_interval
+            self.maximum_bytes = maximum_bytes
+            self.backup_count = backup_count
+            self.__level = self.VERBOSITY_LEVELS[verbosity]
+            self.__ring_buffer = deque(maxlen=ring_buffer_size)
+            self.__pending_lines = []
+            self.__file_size = 0
+            self.__last_write_time = time.monotonic()
+
+    def emit(self, event: str, verbosity: str = 'game', **fields) -> None:
+        """Emit a record
+
+        Args:
+            event (str): Name of the event
+            verbosity (str, optional): Lowest verbosity that emits the record,
+            'game' or 'attempt'. Defaults to 'game'.
+            **fields: Fields of the record
+        """
+        if self.VERBOSITY_LEVELS[verbosity] > self.__level:
+            return
+        record = {'time': round(time.time(), 6), 'event': event}
+        record.update(fields)
+        with self.__lock:
+            self.__ring_buffer.append(record)
+            if self.file_path is None:
+                return
+            self.__pending_lines.append(json.dumps(
+                record, ensure_ascii=False, separators=(',', ':')
+            ))
+            if time.monotonic() - self.__last_write_time >= self.flush_interval:
+                self.__write_pending_lines()
+
+    def get_recent_events(self) -> list:
+        """Return the records kept in the ring buffer
+
+        Returns:
+            list: Last records emitted, oldest first
+        """
+        with self.__lock:
+            return list(self.__ring_buffer)
+
+    def flush(self) -> None:
+        """Write the pending records
+        """
+        with self.__lock:
+            self.__write_pending_lines()
+
+    def close(self) -> None:
+        """Write the pending records and close the file
+        """
+        with self.__lock:
+            self.__write_pending_lines()
+            if self.__file is not None:
+                self.__file.close()
+                self.__file = None
+
+    def __write_pending_lines(self) -> None:
+        self.__last_write_time = time.monotonic()
+        if not self.__pending_lines:
+            return
+        data = '\n'.join(self.__pending_lines) + '\n'
+        self.__pending_lines = []
+        try:
+            if self.file_path == '-':
+                # The standard output is left to the results of the commands
+                sys.stderr.write(data)
+                sys.stderr.flush()
+                return
+            encoded_data = data.encode('utf-8')
+            if self.__file is None:
+                self.__file = open(self.file_path, mode='ab')
+                self.__file_size = self.__file.tell()
+            if (
+                self.maximum_bytes
+                and self.__file_size > 0
+                and self.__file_size + len(encoded_data) > self.maximum_bytes
+            ):
+                self.__rotate()
+            self.__file.write(encoded_data)
+            self.__file.flush()
+            self.__file_size += len(encoded_data)
+        except OSError:
+            print('Error writing the events file', file=sys.stderr)
+
+    def __rotate(self) -> None:
+        # events.jsonl becomes events.jsonl.1, events.jsonl.1 becomes 
+        # events.jsonl.2 and so on, dropping the oldest one
+        self.__file.close()
+        if self.backup_count > 0:
+            for index in range(self.backup_count - 1, 0, -1):
+                source = f'{self.file_path}.{index}'
+                if os.path.exists(source):
+                    os.replace(source, f'{self.file_path}.{index + 1}')
+            os.replace(self.file_path, f'{self.file_path}.1')
+        self.__file = open(self.file_path, mode='wb')
+        self.__file_size = 0
+
+
+# Events of the games played by the process
+events = EventSink()
@@ -0,0 +1,3117 @@
+from array import array
+from collections import OrderedDict
+from collections.abc import Mapping
+import hashlib
+import json
+import math
+import mmap
+import os
+import random
+import struct
+import sys
+import threading
+import time
+from typing import TYPE_CHECKING
+import weakref
+
+from constants import (
+    COMPILED_WORD_BANK_PATH, MAXIMUM_ATTEMPTS, SOLVER_VERSION, WORD_BANK_PATH,
+)
+from observability import metrics, timed
+
+if TYPE_CHECKING:
+    # Only imported by the type checkers, the solver does not depend on the 
+    # database, which is imported lazily by the methods that use it
+    from storage import Database
+
+# Name of the header fields of the files generated from the word bank, used in
+# the error messages
+WORD_BANK_FILE_FIELD_NAMES = {
+    'word_bank_hash': 'word bank',
+    'selection_strategy': 'strategy',
+}
+
+
+class WordleGame:
+    SET_OF_VOWELS = 'aeiou'
+    SET_OF_CONSONANTS = 'bcdfghjklmnñpqrstvwxyz'
+    # Number of words whose expected information is computed when selecting a
+    # word with the entropy strategy
+    MAXIMUM_WORDS_SCORED_BY_ENTROPY = 150
+
+    def __init__(
+            self, list_of_words: list,
+            initial_requirements_groups: dict = None,
+            filter_cache: 'FilterCache' = None, word_bank_hash: str = None,
+            maximum_group_indexes: int = None) -> None:
+        """WordleGame class constructor
+
+        The possible words of a game always belong to the group of its target 
+        word, so they are filtered with the bitmask index of that group.
+
+        Args:
+            list_of_words (list): List of words, None if the groups are the 
+            view of a SharedWordBank, which decodes the list the first time it
+            is requested
+            initial_requirements_groups (dict, optional): Words already grouped
+            by (length, vowels, consonants), as given by the compiled word bank
+            or a SharedWordBank. By default they are grouped from the list of 
+            words.
+            filter_cache (FilterCache, optional): Cache of the possible words of
+            the games played with this Wordle game. Defaults to None.
+            word_bank_hash (str, optional): Hash of the word bank, computed 
+            from the list of words by default. Defaults to None.
+            maximum_group_indexes (int, optional): Number of groups whose 
+            bitmask index is kept, the least recently used are dropped. By 
+            default all of them are kept.
+        """
+        self.__list_of_words = list_of_words
+        self.filter_cache = filter_cache
+        self.auxiliary_functions = AuxiliaryFunctions()
+        # The initial requirements only depend on the word bank, so the words
+        # are grouped once by (length, vowels, consonants)
+        if initial_requirements_groups is None:
+            initial_requirements_groups = (
+                self.__build_initial_requirements_index(list_of_words)
+            )
+        self.__initial_requirements_index = initial_requirements_groups
+        self.__word_bank_hash = word_bank_hash
+        self.__word_bitmask_indexes = {}
+        self.maximum_group_indexes = maximum_group_indexes
+        self.__group_bitmask_indexes = OrderedDict()
+        self.__group_bitmask_indexes_lock = threading.Lock()
+
+    def __build_initial_requirements_index(self, list_of_words: list) -> dict:
+        """Group the words by length, number of vowels and number of consonants
+
+        Args:
+            list_of_words (list): List of words
+
+        Returns:
+            dict: Dictionary whose keys are (length, vowels, consonants) tuples
+            and whose values are the words of that group, in word bank order
+        """
+        index = {}
+        for word in list_of_words:
+            index.setdefault(self.get_group_key(word), []).append(word)
+        return index
+
+    def get_group_key(self, word: str) -> tuple:
+        """Return the group of a word
+
+        Args:
+            word (str): Word
+
+        Returns:
+            tuple: Length, number of vowels and number of consonants of the word
+        """
+        return (
+            len(word),
+            self.auxiliary_functions.letter_counter(word, self.SET_OF_VOWELS),
+            self.auxiliary_functions.letter_counter(
+                word, self.SET_OF_CONSONANTS),
+        )
+
+    def get_list_of_words(self) -> list:
+        """Return the list of words of the word bank
+
+        Returns:
+            list: List of words
+        """
+        if self.__list_of_words is None:
+            self.__list_of_words = (
+                self.__initial_requirements_index.get_list_of_words()
+            )
+        return self.__list_of_words
+
+    def get_word_bank_hash(self) -> str:
+        """Return the hash that identifies the word bank, computing it the 
+        first time
+
+        Returns:
+            str: Hexadecimal sha256 hash of the word bank
+        """
+        if self.__word_bank_hash is None:
+            self.__word_bank_hash = OpeningBook.word_bank_hash(
+                self.get_list_of_words()
+            )
+        return self.__word_bank_hash
+
+    def get_initial_requirements_groups(self) -> dict:
+        """Return the words of the word bank grouped by length, number of 
+        vowels and number of consonants
+
+        Returns:
+            dict: Dictionary whose keys are (length, vowels, consonants) tuples
+            and whose values are the words of that group
+        """
+        return self.__initial_requirements_index
+
+    @timed('words_filter_initial_requirements')
+    def words_filter_initial_requirements(
+            self, length: int, number_of_vowels: int, 
+            number_of_consonants: int) -> list:
+        """Filter out words that do not meet the initial requirements
+
+        Args:
+            length (int): Length that the words must have
+            number_of_vowels (int): Number of vowels that words must have
+            number_of_consonants (int): Number of consonants that words must have
+        Returns:
+            list: List of words that have the same length, number of vowels and
+            consonants as the target word
+        """
+        # A copy is returned so that callers can modify the list without
+        # altering the index
+        return list(self.__initial_requirements_index.get(
+            (length, number_of_vowels, number_of_consonants), []
+        ))
+
+    def filter_words(
+            self, wordlist: list, last_attempt: str,
+            right_letters_in_right_positions: list,
+            right_letters_in_wrong_positions: list) -> list:
+        """Filter out words that do not satisfy the requirements.
+
+        Args:
+            wordlist (list): List of words
+            last_attempt (str): Word used in the last attempt
+            right_letters_in_right_positions (list): Boolean list containing the 
+            correct letter positions
+            right_letters_in_wrong_positions (list): List containing the correct 
+            letters in the wrong positions
+
+        Returns:
+            list: List of filtered words 
+        """
+        word_constraints = WordConstraints(len(last_attempt))
+        word_constraints.add_feedback(
+            last_attempt,
+            right_letters_in_right_positions,
+            right_letters_in_wrong_positions,
+        )
+        return self.filter_words_by_constraints(wordlist, word_constraints)
+
+    @timed('filter_words')
+    def filter_words_by_constraints(
+            self, wordlist: list, word_constraints: 'WordConstraints') -> list:
+        """Filter out words that do not satisfy a set of constraints
+
+        Args:
+            wordlist (list): List of words
+            word_constraints (WordConstraints): Constraints on the target word
+
+        Returns:
+            list: List of filtered words
+        """
+        if len(wordlist) == 0:
+            return []
+        word_bitmask_index, candidates = self.__words_to_bitset(
+            wordlist, word_constraints.length
+        )
+        candidates = word_bitmask_index.filter_bitset(
+            candidates, word_constraints
+        )
+        return word_bitmask_index.bitset_to_words(candidates)
+
+    def __words_to_bitset(self, list_of_words: list, length: int) -> tuple:
+        """Convert a list of words into a bitset of the bitmask index of their
+        length
+
+        Args:
+            list_of_words (list): List of words
+            length (int): Length of the words
+
+        Returns:
+            tuple: Bitmask index and bitset of the words
+        """
+        word_bitmask_index = self.get_group_bitmask_index(
+            self.get_group_key(list_of_words[0])
+        )
+        try:
+            return (
+                word_bitmask_index,
+                word_bitmask_index.words_to_bitset(list_of_words),
+            )
+        except KeyError:
+            # Words outside the word bank are handled with an index of their own
+            word_bitmask_index = WordBitmaskIndex(list_of_words)
+            return (
+                word_bitmask_index,
+                word_bitmask_index.words_to_bitset(list_of_words),
+            )
+
+    def get_word_bitmask_index(self, length: int) -> 'WordBitmaskIndex':
+        """Return the bitmask index of the words of the bank with a given length,
+        building it the first time it is requested
+
+        Args:
+            length (int): Length of the words
+
+        Returns:
+            WordBitmaskIndex: Bitmask index of the words with that length
+        """
+        if length not in self.__word_bitmask_indexes:
+            self.__word_bitmask_indexes[length] = WordBitmaskIndex([
+                word for word in self.get_list_of_words() if len(word) == length
+            ])
+        return self.__word_bitmask_indexes[length]
+
+    def get_group_bitmask_index(self, key: tuple) -> 'WordBitmaskIndex':
+        """Return the bitmask index of the words of a group, building it the 
+        first time it is requested
+
+        Args:
+            key (tuple): Length, number of vowels and number of consonants of 
+            the group
+
+        Returns:
+            WordBitmaskIndex: Bitmask index of the words of the group, in word
+            bank order
+        """
+        with self.__group_bitmask_indexes_lock:
+            word_bitmask_index = self.__group_bitmask_indexes.get(key)
+            if word_bitmask_index is not None:
+                self.__group_bitmask_indexes.move_to_end(key)
+                return word_bitmask_index
+        word_bitmask_index = WordBitmaskIndex(
+            self.__initial_requirements_index.get(key, [])
+        )
+        with self.__group_bitmask_indexes_lock:
+            self.__group_bitmask_indexes[key] = word_bitmask_index
+            if (
+                self.maximum_group_indexes is not None
+                and len(self.__group_bitmask_indexes) > (
+                    self.maximum_group_indexes)
+            ):
+                self.__group_bitmask_indexes.popitem(last=False)
+        return word_bitmask_index
+
+    @timed('select_word')
+    def select_word(
+            self, possible_words: list, length_target_word: int,
+            strategy: str = 'frequency',
+            target_prior: 'TargetPrior' = None) -> str:
+        """Select the word most likely to be correct
+
+        Args:
+            possible_words (list): List of words
+            length_target_word (int): Length of the word target
+            strategy (str, optional): 'frequency' selects the word by the 
+            frequency of its letters in each position, 'entropy' selects the 
+            word with the highest expected information. Defaults to 'frequency'.
+            target_prior (TargetPrior, optional): Prior of the target words, 
+            whose weights replace the number of words in the letter 
+            frequencies and in the feedback partitions. Defaults to None.
+
+        Raises:
+            ValueError: If the strategy is unknown
+
+        Returns:
+            str: Selected word
+        """
+        if strategy == 'entropy':
+            return self.__select_word_highest_expected_information(
+                possible_words, length_target_word, target_prior
+            )
+        if strategy != 'frequency':
+            raise ValueError(f'Unknown selection strategy: {strategy}')
+        return self.__select_word_highest_letter_frequency(
+            possible_words, length_target_word, target_prior
+        )
+
+    def __select_word_highest_letter_frequency(
+            self, possible_words: list, length_target_word: int,
+            target_prior: 'TargetPrior' = None) -> str:
+        """Select the word whose letters are the most frequent in each 
+        position among the words with the highest number of different letters
+
+        The positions are visited from left to right. In each one, the letter 
+        histogram of the remaining words is computed and only the words with 
+        the most frequent letter are kept. With a target prior every word adds
+        its weight to the histogram. Ties are broken in favour of the first 
+        letter of the alphabet, and the first remaining word of the list is 
+        returned.
+
+        Args:
+            possible_words (list): List of words
+            length_target_word (int): Length of the word target
+            target_prior (TargetPrior, optional): Prior of the target words. 
+            Defaults to None.
+
+        Returns:
+            str: Selected word
+        """
+        if len(possible_words) <= 1:
+            return possible_words[0]
+        word_bitmask_index, candidates = self.__words_to_bitset(
+            possible_words, length_target_word
+        )
+        word_weights = None
+        if target_prior is not None:
+            word_weights = target_prior.get_word_weights(
+                word_bitmask_index, possible_words
+            )
+        for number_of_letters in range(length_target_word, 0, -1):
+            words_with_most_letters = (
+                candidates
+                & word_bitmask_index.words_with_distinct_letters(
+                    number_of_letters)
+            )
+            if words_with_most_letters:
+                candidates = words_with_most_letters
+                break
+        alphabet = WordBitmaskIndex.ALPHABET
+        for position in range(length_target_word):
+            if candidates & (candidates - 1) == 0:
+                # A single word is left
+                break
+            histogram = word_bitmask_index.position_letter_histogram(
+                candidates, position, word_weights
+            )[:len(alphabet)]
+            highest_frequency = max(histogram)
+            if highest_frequency == 0:
+                continue
+            candidates &= word_bitmask_index.words_with_letter_in_position(
+                position, alphabet[histogram.index(highest_frequency)]
+            )
+        words_selected = set(word_bitmask_index.bitset_to_words(candidates))
+        for word in possible_words:
+            if word in words_selected:
+                return word
+
+    def __shortlist_words_by_letter_frequency(
+            self, possible_words: list, word_bitmask_index: 'WordBitmaskIndex',
+            candidates: int, word_weights: 'WordWeights' = None) -> list:
+        """Select the words whose letters are the most frequent among the 
+        possible words, so that the entropy is only computed for them
+
+        Args:
+            possible_words (list): List of words
+            word_bitmask_index (WordBitmaskIndex): Bitmask index of the words
+            candidates (int): Bitset of the possible words
+            word_weights (WordWeights, optional): Weights of the words, added 
+            instead of counting the words. Defaults to None.
+
+        Returns:
+            list: At most MAXIMUM_WORDS_SCORED_BY_ENTROPY words, in the order of
+            the list of possible words
+        """
+        if len(possible_words) <= self.MAXIMUM_WORDS_SCORED_BY_ENTROPY:
+            return possible_words
+        letter_codes_table = word_bitmask_index.letter_codes_table
+        letter_histogram = word_bitmask_index.letter_histogram(
+            candidates, word_weights
+        )
+        position_letter_histograms = [
+            word_bitmask_index.position_letter_histogram(
+                candidates, position, word_weights
+            )
+            for position in range(word_bitmask_index.length)
+        ]
+        scores = []
+        for word in possible_words:
+            score = 0
+            for letter in set(word):
+                score += letter_histogram[letter_codes_table[letter]]
+            for position, letter in enumerate(word):
+                score += position_letter_histograms[position][
+                    letter_codes_table[letter]
+                ]
+            scores.append(score)
+        shortlist = sorted(
+            range(len(possible_words)), key=lambda index: -scores[index]
+        )[:self.MAXIMUM_WORDS_SCORED_BY_ENTROPY]
+        return [possible_words[index] for index in sorted(shortlist)]
+
+    def __select_word_highest_expected_information(
+            self, possible_words: list, length_target_word: int,
+            target_prior: 'TargetPrior' = None) -> str:
+        """Select the word whose feedback is expected to give the most 
+        information about the target word
+
+        Every possible word is scored with the entropy of the partition that 
+        its feedback induces on the possible words. With a target prior the
+        mass of every part is the weight of its words instead of their number.
+        Ties are broken in favour of the first word of the list.
+
+        Args:
+            possible_words (list): List of words
+            length_target_word (int): Length of the word target
+            target_prior (TargetPrior, optional): Prior of the target words. 
+            Defaults to None.
+
+        Returns:
+            str: Selected word
+        """
+        if len(possible_words) <= 2:
+            return possible_words[0]
+        word_bitmask_index, candidates = self.__words_to_bitset(
+            possible_words, length_target_word
+        )
+        word_weights = None
+        number_of_candidates = len(possible_words)
+        if target_prior is not None:
+            word_weights = target_prior.get_word_weights(
+                word_bitmask_index, possible_words
+            )
+        if word_weights is not None:
+            number_of_candidates = word_weights.weigh(candidates)
+        log_number_of_candidates = math.log2(number_of_candidates)
+        highest_information = -1.0
+        word_selected = possible_words[0]
+        for word in self.__shortlist_words_by_letter_frequency(
+                possible_words, word_bitmask_index, candidates, word_weights):
+            partition_sizes = word_bitmask_index.feedback_partition_sizes(
+                word, candidates, word_weights
+            )
+            # H = log2(N) - sum(n * log2(n)) / N
+            information = log_number_of_candidates - sum(
+                size * math.log2(size) for size in partition_sizes if size
+            ) / number_of_candidates
+            if information > highest_information:
+                highest_information = information
+                word_selected = word
+        return word_selected
+
+
+class WordBitmaskIndex:
+    ALPHABET = 'aeioubcdfghjklmnñpqrstvwxyz'
+
+    def __init__(self, list_of_words: list) -> None:
+        """WordBitmaskIndex class constructor
+
+        Each word is stored as a bitmask of the letters it contains and as one
+        letter code per position. From them, a bitset over the word indexes is
+        built for every letter and for every (position, letter) pair, so the
+        feedback of an attempt is applied to all the words at once with
+        integer AND/NOT operations.
+
+        Args:
+            list_of_words (list): List of words, all of them with the same length
+        """
+        self.__list_of_words = list(list_of_words)
+        self.length = len(self.__list_of_words[0]) if self.__list_of_words else 0
+        if any(len(word) != self.length for word in self.__list_of_words):
+            raise ValueError('All the words must have the same length')
+        self.__position_of_word = {
+            word: index for index, word in enumerate(self.__list_of_words)
+        }
+        self.letter_codes_table = {
+            letter: code for code, letter in enumerate(self.ALPHABET)
+        }
+        self.letter_masks = array('Q')
+        self.letter_codes = [array('B') for _ in range(self.length)]
+        for word in self.__list_of_words:
+            mask = 0
+            for position, letter in enumerate(word):
+                code = self.letter_codes_table.setdefault(
+                    letter, len(self.letter_codes_table))
+                mask |= 1 << code
+                self.letter_codes[position].append(code)
+            self.letter_masks.append(mask)
+        number_of_letters = len(self.letter_codes_table)
+        self.__words_with_letter_in_position = [
+            self.__build_bitsets(codes, number_of_letters)
+            for codes in self.letter_codes
+        ]
+        self.__words_with_letter = [0] * number_of_letters
+        for bitsets in self.__words_with_letter_in_position:
+            for code, bitset in enumerate(bitsets):
+                self.__words_with_letter[code] |= bitset
+        self.__words_with_distinct_letters = self.__build_bitsets(
+            array('B', (bin(mask).count('1') for mask in self.letter_masks)),
+            self.length + 1
+        )
+
+    def __build_bitsets(self, codes: array, number_of_letters: int) -> list:
+        """Build, for every letter, the bitset of the words having that letter
+        in a position
+
+        Args:
+            codes (array): Letter code of every word in the position
+            number_of_letters (int): Number of known letter codes
+
+        Returns:
+            list: Bitset of every letter code
+        """
+        bits = [bytearray(b'0' * len(codes)) for _ in range(number_of_letters)]
+        last_index = len(codes) - 1
+        for index, code in enumerate(codes):
+            # The first word is the least significant bit
+            bits[code][last_index - index] = 49
+        return [int(letter_bits, 2) if letter_bits else 0 for letter_bits in bits]
+
+    def get_list_of_words(self) -> list:
+        """Return the list of indexed words
+
+        Returns:
+            list: List of words
+        """
+        return self.__list_of_words
+
+    def get_word_position(self, word: str) -> int:
+        """Return the index of a word
+
+        Args:
+            word (str): Word
+
+        Returns:
+            int: Index of the word, None if it is not indexed
+        """
+        return self.__position_of_word.get(word)
+
+    def all_words_bitset(self) -> int:
+        """Return the bitset containing every indexed word
+
+        Returns:
+            int: Bitset of all the words
+        """
+        return (1 << len(self.__list_of_words)) - 1
+
+    def words_to_bitset(self, list_of_words: list) -> int:
+        """Convert a list of indexed words into a bitset
+
+        Args:
+            list_of_words (list): List of words
+
+        Raises:
+            KeyError: If a word is not indexed
+
+        Returns:
+            int: Bitset of the words
+        """
+        if len(list_of_words) == len(self.__list_of_words):
+            if list_of_words == self.__list_of_words:
+                return self.all_words_bitset()
+        bits = bytearray(b'0' * len(self.__list_of_words))
+        last_index = len(self.__list_of_words) - 1
+        for word in list_of_words:
+            bits[last_index - self.__position_of_word[word]] = 49
+        return int(bits, 2) if bits else 0
+
+    def bitset_to_words(self, bitset: int) -> list:
+        """Convert a bitset into the list of words it contains, in index order
+
+        Args:
+            bitset (int): Bitset of words
+
+        Returns:
+            list: List of words
+        """
+        list_of_words = self.__list_of_words
+        bits = bin(bitset)[:1:-1]
+        result = []
+        index = bits.find('1')
+        while index != -1:
+            result.append(list_of_words[index])
+            index = bits.find('1', index + 1)
+        return result
+
+    def count_bitset(self, bitset: int) -> int:
+        """Count the words of a bitset
+
+        Args:
+            bitset (int): Bitset of words
+
+        Returns:
+            int: Number of words
+        """
+        return bin(bitset).count('1')
+
+    def words_with_letter(self, letter: str) -> int:
+        """Return the bitset of the words containing a letter
+
+        Args:
+            letter (str): Letter
+
+        Returns:
+            int: Bitset of the words
+        """
+        code = self.letter_codes_table.get(letter)
+        if code is None or code >= len(self.__words_with_letter):
+            return 0
+        return self.__words_with_letter[code]
+
+    def words_with_letter_in_position(self, position: int, letter: str) -> int:
+        """Return the bitset of the words having a letter in a position
+
+        Args:
+            position (int): Position of the letter
+            letter (str): Letter
+
+        Returns:
+            int: Bitset of the words
+        """
+        code = self.letter_codes_table.get(letter)
+        bitsets = self.__words_with_letter_in_position[position]
+        if code is None or code >= len(bitsets):
+            return 0
+        return bitsets[code]
+
+    def words_with_distinct_letters(self, number_of_letters: int) -> int:
+        """Return the bitset of the words with a number of different letters
+
+        Args:
+            number_of_letters (int): Number of different letters
+
+        Returns:
+            int: Bitset of the words
+        """
+        if not 0 <= number_of_letters <= self.length:
+            return 0
+        return self.__words_with_distinct_letters[number_of_letters]
+
+    def letter_histogram(
+            self, candidates: int, word_weights: 'WordWeights' = None) -> list:
+        """Count, for every letter, the candidate words containing it
+
+        Args:
+            candidates (int): Bitset of candidate words
+            word_weights (WordWeights, optional): Weights of the words, which
+            are added instead of counting the words. Defaults to None.
+
+        Returns:
+            list: Number or weight of the words of every letter code
+        """
+        count_bitset = self.count_bitset
+        if word_weights is not None:
+            count_bitset = word_weights.weigh
+        return [
+            count_bitset(words) if words else 0
+            for words in map(candidates.__and__, self.__words_with_letter)
+        ]
+
+    def position_letter_histogram(
+            self, candidates: int, position: int,
+            word_weights: 'WordWeights' = None) -> list:
+        """Count, for every letter, the candidate words having it in a 
+        position
+
+        Args:
+            candidates (int): Bitset of candidate words
+            position (int): Position of the letters
+            word_weights (WordWeights, optional): Weights of the words, which
+            are added instead of counting the words. Defaults to None.
+
+        Returns:
+            list: Number or weight of the words of every letter code
+        """
+        count_bitset = self.count_bitset
+        if word_weights is not None:
+            count_bitset = word_weights.weigh
+        return [
+            count_bitset(words) if words else 0
+            for words in map(
+                candidates.__and__,
+                self.__words_with_letter_in_position[position]
+            )
+        ]
+
+    def words_with_letter_count(self, letter: str, count: int) -> int:
+        """Return the bitset of the words containing a letter at least a number
+        of times
+
+        Args:
+            letter (str): Letter
+            count (int): Minimum number of times the letter appears
+
+        Returns:
+            int: Bitset of the words
+        """
+        if count <= 0:
+            return self.all_words_bitset()
+        if count == 1:
+            return self.words_with_letter(letter)
+        # words_with_count[number] holds the words with at least number times
+        # the letter in the positions already visited
+        words_with_count = [self.all_words_bitset()] + [0] * count
+        for position in range(self.length):
+            in_position = self.words_with_letter_in_position(position, letter)
+            if in_position == 0:
+                continue
+            for number in range(count, 0, -1):
+                words_with_count[number] |= (
+                    words_with_count[number - 1] & in_position
+                )
+        return words_with_count[count]
+
+    def feedback_partition_sizes(
+            self, attempt: str, candidates: int,
+            word_weights: 'WordWeights' = None) -> list:
+        """Split the candidate words by the feedback that an attempt would 
+        receive if each of them were the target word
+
+        The feedback is the set of positions with the right letter plus the set
+        of letters of the attempt, outside those positions, that the target word
+        contains. Since a letter in a right position is always contained in the
+        target word, the same split is obtained by the letters of the attempt
+        contained in the target word and the positions with the right letter.
+
+        Args:
+            attempt (str): Word to be sent
+            candidates (int): Bitset of candidate words
+            word_weights (WordWeights, optional): Weights of the words, which
+            are added instead of counting the words. Defaults to None.
+
+        Returns:
+            list: Number or weight of the candidate words that share each 
+            feedback
+        """
+        letters = list(dict.fromkeys(attempt))
+        # Each group keeps the mask of the letters of the attempt it contains
+        groups = [candidates]
+        letters_contained = [0]
+        for letter_index, letter in enumerate(letters):
+            words_with_letter = self.words_with_letter(letter)
+            split_groups = []
+            split_letters_contained = []
+            for bitset, mask in zip(groups, letters_contained):
+                with_letter = bitset & words_with_letter
+                if with_letter:
+                    split_groups.append(with_letter)
+                    split_letters_contained.append(mask | 1 << letter_index)
+                    if with_letter == bitset:
+                        continue
+                    bitset ^= with_letter
+                split_groups.append(bitset)
+                split_letters_contained.append(mask)
+            groups = split_groups
+            letters_contained = split_letters_contained
+        for position, letter in enumerate(attempt):
+            letter_bit = 1 << letters.index(letter)
+            words_with_letter_in_position = self.words_with_letter_in_position(
+                position, letter)
+            split_groups = []
+            split_letters_contained = []
+            for bitset, mask in zip(groups, letters_contained):
+                if mask & letter_bit:
+                    right = bitset & words_with_letter_in_position
+                    if right and right != bitset:
+                        split_groups.append(right)
+                        split_letters_contained.append(mask)
+                        bitset ^= right
+                split_groups.append(bitset)
+                split_letters_contained.append(mask)
+            groups = split_groups
+            letters_contained = split_letters_contained
+        if word_weights is not None:
+            return [word_weights.weigh(bitset) for bitset in groups]
+        return [self.count_bitset(bitset) for bitset in groups]
+
+    def filter_bitset(
+            self, candidates: int, word_constraints: 'WordConstraints') -> int:
+        """Apply a set of constraints to a bitset of candidate words
+
+        Args:
+            candidates (int): Bitset of candidate words
+            word_constraints (WordConstraints): Constraints on the target word
+
+        Returns:
+            int: Bitset of the candidate words that satisfy the constraints
+        """
+        for position, letter in enumerate(word_constraints.fixed_letters):
+            if letter is not None:
+                candidates &= self.words_with_letter_in_position(
+                    position, letter)
+        for position, letters in enumerate(word_constraints.excluded_letters):
+            for letter in letters:
+                candidates &= ~self.words_with_letter_in_position(
+                    position, letter)
+        for letter, count in word_constraints.maximum_counts.items():
+            if count == 0:
+                candidates &= ~self.words_with_letter(letter)
+            else:
+                candidates &= ~self.words_with_letter_count(letter, count + 1)
+        for letter, count in word_constraints.minimum_counts.items():
+            candidates &= self.words_with_letter_count(letter, count)
+        return candidates
+
+
+
+class WordWeights:
+    def __init__(
+            self, word_bitmask_index: WordBitmaskIndex, word_counts: dict,
+            smoothing: float = 1.0) -> None:
+        """WordWeights class constructor
+
+        Weight of the words of a bitmask index, their count plus the smoothing.
+        Only a few words are counted, so a bitset is weighed from its number 
+        of words and the counts of the counted words it contains.
+
+        Args:
+            word_bitmask_index (WordBitmaskIndex): Bitmask index of the words
+            word_counts (dict): Count of every counted word
+            smoothing (float, optional): Weight added to every word. Defaults 
+            to 1.0.
+        """
+        self.word_bitmask_index = word_bitmask_index
+        self.smoothing = smoothing
+        # Count of the counted words by their index, and their bitset
+        self.__counts = {}
+        self.__counted_words = 0
+        for word, count in word_counts.items():
+            index = word_bitmask_index.get_word_position(word)
+            if index is not None and count:
+                self.__counts[index] = count
+                self.__counted_words |= 1 << index
+
+    def weigh(self, bitset: int) -> float:
+        """Return the weight of the words of a bitset
+
+        Args:
+            bitset (int): Bitset of words
+
+        Returns:
+            float: Sum of the weights of the words
+        """
+        weight = self.smoothing * self.word_bitmask_index.count_bitset(bitset)
+        counted_words = bitset & self.__counted_words
+        while counted_words:
+            lowest_word = counted_words & -counted_words
+            weight += self.__counts[lowest_word.bit_length() - 1]
+            counted_words ^= lowest_word
+        return weight
+
+
+class WordConstraints:
+    def __init__(self, length: int) -> None:
+        """WordConstraints class constructor
+
+        Everything known about the target word from the feedback received so 
+        far: the letter fixed in each position, the letters excluded from each
+        position and the minimum and maximum number of times a letter appears.
+
+        Args:
+            length (int): Length of the target word
+        """
+        self.length = length
+        self.fixed_letters = [None] * length
+        self.excluded_letters = [set() for _ in range(length)]
+        self.minimum_counts = {}
+        self.maximum_counts = {}
+
+    def add_feedback(
+            self, attempt_word: str, right_letters_in_right_positions: list,
+            right_letters_in_wrong_positions: list) -> 'WordConstraints':
+        """Add the feedback of an attempt to the constraints
+
+        A letter outside its right position is reported as a right letter 
+        whenever the target word contains it, so its minimum count is the 
+        number of right positions it has, or one. A letter outside its right 
+        position that is not reported appears only in its right positions.
+
+        Args:
+            attempt_word (str): Word sent
+            right_letters_in_right_positions (list): Boolean list containing the
+            correct letter positions
+            right_letters_in_wrong_positions (list): List containing the correct
+            letters in the wrong positions
+
+        Returns:
+            WordConstraints: Constraints that were not known before this 
+            feedback, so the words already filtered only need to be checked 
+            against them
+        """
+        new_constraints = WordConstraints(self.length)
+        right_positions = {}
+        wrong_positions = {}
+        for position, letter in enumerate(attempt_word):
+            if right_letters_in_right_positions[position]:
+                right_positions[letter] = right_positions.get(letter, 0) + 1
+                if self.fixed_letters[position] != letter:
+                    self.fixed_letters[position] = letter
+                    new_constraints.fixed_letters[position] = letter
+            else:
+                wrong_positions[letter] = True
+                if letter not in self.excluded_letters[position]:
+                    self.excluded_letters[position].add(letter)
+                    new_constraints.excluded_letters[position].add(letter)
+        for letter in set(right_positions) | set(wrong_positions):
+            minimum_count = max(
+                right_positions.get(letter, 0),
+                self.fixed_letters.count(letter),
+            )
+            if letter in right_letters_in_wrong_positions:
+                minimum_count = max(minimum_count, 1)
+            elif letter in wrong_positions:
+                maximum_count = right_positions.get(letter, 0)
+                if maximum_count < self.maximum_counts.get(letter, self.length):
+                    self.maximum_counts[letter] = maximum_count
+                    new_constraints.maximum_counts[letter] = maximum_count
+            # A letter fixed in a position is already checked there, so only 
+            # a minimum above its fixed positions adds information
+            if (
+                minimum_count > self.minimum_counts.get(letter, 0)
+                and minimum_count > self.fixed_letters.count(letter)
+            ):
+                self.minimum_counts[letter] = minimum_count
+                new_constraints.minimum_counts[letter] = minimum_count
+        return new_constraints
+
+    def is_satisfied_by(self, word: str) -> bool:
+        """Check whether a word satisfies the constraints
+
+        Args:
+            word (str): Word to be checked
+
+        Returns:
+            bool: True if the word can be the target word
+        """
+        if len(word) != self.length:
+            return False
+        for position, letter in enumerate(word):
+            fixed_letter = self.fixed_letters[position]
+            if fixed_letter is not None and fixed_letter != letter:
+                return False
+            if letter in self.excluded_letters[position]:
+                return False
+        for letter, count in self.maximum_counts.items():
+            if word.count(letter) > count:
+                return False
+        for letter, count in self.minimum_counts.items():
+            if word.count(letter) < count:
+                return False
+        return True
+
+
+class FilterCache:
+    def __init__(self, maximum_bytes: int = 64 * 1024 * 1024) -> None:
+        """FilterCache class constructor
+
+        Least recently used cache of the possible words of a game, keyed by the
+        group of the target word and the ordered feedback received. It is shared
+        by all the games that use the same Wordle game.
+
+        Args:
+            maximum_bytes (int, optional): Approximate memory that the cached 
+            lists can use before the least recently used ones are evicted. 
+            Defaults to 64 MiB.
+        """
+        self.maximum_bytes = maximum_bytes
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.current_bytes = 0
+        self.__entries = OrderedDict()
+        self.__lock = threading.Lock()
+
+    @staticmethod
+    def make_key(
+            length: int, number_of_vowels: int, number_of_consonants: int,
+            history: list) -> tuple:
+        """Build the canonical key of the feedback received in a game
+
+        Args:
+            length (int): Length of the target word
+            number_of_vowels (int): Number of vowels in the target word
+            number_of_consonants (int): Number of consonants in the target word
+            history (list): Words sent, each with its boolean list of correct 
+            positions and its list of correct letters in wrong positions
+
+        Returns:
+            tuple: Hashable key of the game state
+        """
+        return (
+            length, number_of_vowels, number_of_consonants,
+            tuple(
+                (attempt_word, OpeningBook.feedback_key(
+                    right_letters_in_right_positions,
+                    right_letters_in_wrong_positions
+                ))
+                for attempt_word, right_letters_in_right_positions,
+                right_letters_in_wrong_positions in history
+            ),
+        )
+
+    def get(self, key: tuple) -> list:
+        """Return the possible words cached for a key
+
+        Args:
+            key (tuple): Key of the game state
+
+        Returns:
+            list: List of possible words, which must not be modified, or None 
+            if the key is not cached
+        """
+        with self.__lock:
+            entry = self.__entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self.__entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def put(self, key: tuple, list_of_words: list) -> None:
+        """Cache the possible words of a key, evicting the least recently used
+        entries when the memory limit is exceeded
+
+        Args:
+            key (tuple): Key of the game state
+            list_of_words (list): List of possible words
+        """
+        # The words are shared with the word bank, so only the list and the key
+        # are counted
+        size = sys.getsizeof(list_of_words) + sys.getsizeof(key) + sum(
+            sys.getsizeof(attempt) for attempt in key[3]
+        )
+        with self.__lock:
+            if key in self.__entries:
+                return
+            self.__entries[key] = (list_of_words, size)
+            self.current_bytes += size
+            while self.current_bytes > self.maximum_bytes and self.__entries:
+                _, (_, evicted_size) = self.__entries.popitem(last=False)
+                self.current_bytes -= evicted_size
+                self.evictions += 1
+
+    def get_statistics(self) -> dict:
+        """Return the counters of the cache
+
+        Returns:
+            dict: Hits, misses, evictions, entries and memory used
+        """
+        with self.__lock:
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'entries': len(self.__entries),
+                'current_bytes': self.current_bytes,
+                'maximum_bytes': self.maximum_bytes,
+            }
+
+
+class AuxiliaryFunctions:
+    def __init__(self):
+        """AuxiliaryFunctions class constructor
+        """
+        self
+
+    def filter_words_containing_certain_letters(
+            self, list_of_words: list, string_of_letters: str,
+            number_of_letters_allowed: int,) -> list:
+        """Filters out words that do not contain a specified number of letters
+
+        Args:
+            list_of_words (list): List of words
+            string_of_letters (str): String containing the letters to be checked
+            number_of_letters_allowed (int): Number of the string of letters that must be in the word
+
+        Returns:
+            list: List of words that satisfy the specified number of letters.
+        """
+        return list(
+            filter(
+                lambda word: word
+                if self.letter_counter(word, string_of_letters)
+                == number_of_letters_allowed
+                else None,
+                list_of_words,
+            )
+        )
+
+    def filter_words_by_length(
+            self, list_of_words: list, length: int) -> list:
+        """Filters out words that do not have the specified length
+
+        Args:
+            list_of_words (list): List of words
+            length (int): Length that the words must have
+
+        Returns:
+            list: List of words with the same length
+        """
+        return list(
+            filter(lambda word: word if (len(word) == length) else None, list_of_words)
+        )
+
+    def letter_counter(self, word: str, set_of_letters: str) -> int:
+        """Count the number of times a letter appears
+
+        Args:
+            word (str): Word whose letters must be counted
+            set_of_letters (str): Letters to be counted
+
+        Returns:
+            int: Number of letters found in the word
+        """
+        return sum(map(word.count, set_of_letters))
+
+    def comparison_position_letter_with_array_booleans(
+            self, last_attempt: str, word: str, boolean_list: list) -> bool:
+        """Returns if the word to compare and the target match, plus which boolean list validates that they should be the same
+
+        Args:
+            last_attempt (str): Word used in the last attempt
+            word (str): word to be compared with an array of booleans
+            boolean_list (list): List of booleans
+
+        Returns:
+            bool: The comparison between a word and the target word is satisfactory
+        """
+        list_of_letters_in_the_correct_position = list(
+            map(
+                lambda index: True
+                if last_attempt[index] == word[index] and boolean_list[index]
+                else False,
+                range(len(word)),
+            )
+        )
+        return sum(list_of_letters_in_the_correct_position) == sum(boolean_list)
+
+    def attempt_feedback(self, attempt_word: str, target_word: str) -> tuple:
+        """Compute the feedback that the API gives when a word is sent
+
+        Args:
+            attempt_word (str): Word sent
+            target_word (str): Word to be found
+
+        Returns:
+            tuple: Boolean list containing the correct letter positions and list
+            containing the correct letters in the wrong positions
+        """
+        right_letters_in_right_positions = [
+            attempt_letter == target_letter
+            for attempt_letter, target_letter in zip(attempt_word, target_word)
+        ]
+        right_letters_in_wrong_positions = []
+        for index, letter in enumerate(attempt_word):
+            if (
+                not right_letters_in_right_positions[index]
+                and letter in target_word
+                and letter not in right_letters_in_wrong_positions
+            ):
+                right_letters_in_wrong_positions.append(letter)
+        return right_letters_in_right_positions, right_letters_in_wrong_positions
+
+    def verify_word_no_wrong_letter(
+            self, letters_not_located_in_the_target_word: list, word: str) -> bool:
+        """Check that the word does not have any wrong letters
+
+        Args:
+            letters_not_located_in_the_target_word (list): list of letters not found 
+            in the target word
+            word (str): Word to be checked that does not contain letters not found 
+            in the target word
+
+        Returns:
+            bool: Returns True if the word has letters not found in the target word
+        """
+        list_aux = list(
+            map(
+                lambda letter: True
+                if letter in letters_not_located_in_the_target_word
+                else False,
+                list(word),
+            )
+        )
+        return sum(list_aux) == 0
+
+
+def read_word_bank_file(
+        file_path: str, description: str, expected_header: dict,
+        missing_ok: bool = False) -> dict:
+    """Read a json file generated from the word bank, such as the opening book,
+    the decision tree or the target prior
+
+    The header of the file must match the word bank, and where it is stored,
+    the selection strategy and the version of the solver. The content is 
+    returned whole, so the readers publish it at once and the games solved in
+    worker threads never see a file half read.
+
+    Args:
+        file_path (str): Location of the json file
+        description (str): Name of the file in the error messages
+        expected_header (dict): Value that every field of the header must have,
+        among 'solver_version', 'word_bank_hash' and 'selection_strategy'
+        missing_ok (bool, optional): Whether a file that does not exist is
+        ignored without reporting it. Defaults to False.
+
+    Returns:
+        dict: Content of the file, None if it cannot be read or its header does
+        not match
+    """
+    try:
+        with open(file=file_path, mode='r', encoding='utf-8') as json_file:
+            content = json.load(json_file)
+    except FileNotFoundError:
+        if not missing_ok:
+            print(f'Error reading the {description} file', file=sys.stderr)
+        return None
+    except (OSError, ValueError):
+        print(f'Error reading the {description} file', file=sys.stderr)
+        return None
+    if (
+        'solver_version' in expected_header
+        and content.get('solver_version') != expected_header['solver_version']
+    ):
+        print(
+            f'The {description} was generated by another version of the '
+            'solver, it must be generated again', file=sys.stderr
+        )
+        return None
+    mismatches = [
+        WORD_BANK_FILE_FIELD_NAMES[field]
+        for field, value in expected_header.items()
+        if field != 'solver_version' and content.get(field) != value
+    ]
+    if mismatches:
+        print(
+            f'The {description} does not match the '
+            + ' or the '.join(mismatches), file=sys.stderr
+        )
+        return None
+    return content
+
+
+class OpeningBook:
+    def __init__(
+            self, file_path: str, wordle_game: WordleGame,
+            selection_strategy: str = 'frequency') -> None:
+        """OpeningBook class constructor
+
+        The opening book stores, for every (length, vowels, consonants) group
+        of the word bank, the first word to send and optionally the second word
+        for every feedback of the first one. The file is only read the first 
+        time a word is requested and it is ignored when it was generated from
+        another word bank, with another selection strategy or by another 
+        version of the solver.
+
+        Args:
+            file_path (str): Location of the json file of the opening book
+            wordle_game (WordleGame): Wordle game whose word bank is used
+            selection_strategy (str, optional): Strategy used to select the 
+            words. Defaults to 'frequency'.
+        """
+        self.file_path = file_path
+        self.wordle_game = wordle_game
+        self.selection_strategy = selection_strategy
+        self.auxiliary_functions = AuxiliaryFunctions()
+        self.__openings = None
+
+    @staticmethod
+    def word_bank_hash(list_of_words: list) -> str:
+        """Compute the hash that identifies a word bank
+
+        Args:
+            list_of_words (list): List of words
+
+        Returns:
+            str: Hexadecimal sha256 hash of the word bank
+        """
+        return hashlib.sha256(
+            '\n'.join(list_of_words).encode('utf-8')
+        ).hexdigest()
+
+    @staticmethod
+    def feedback_key(
+            right_letters_in_right_positions: list,
+            right_letters_in_wrong_positions: list) -> str:
+        """Build the key of the feedback of an attempt
+
+        Args:
+            right_letters_in_right_positions (list): Boolean list containing the
+            correct letter positions
+            right_letters_in_wrong_positions (list): List containing the correct
+            letters in the wrong positions
+
+        Returns:
+            str: Key of the feedback
+        """
+        return '{}|{}'.format(
+            ''.join('1' if right else '0'
+                    for right in right_letters_in_right_positions),
+            ''.join(sorted(set(right_letters_in_wrong_positions))),
+        )
+
+    def generate(self, include_second_words: bool = False) -> None:
+        """Compute the opening words of every group of the word bank and save 
+        them in the opening book file
+
+        Args:
+            include_second_words (bool, optional): Also compute the second word
+            for every feedback of the first one. Defaults to False.
+        """
+        openings = {}
+        for (length, number_of_vowels, number_of_consonants), possible_words in (
+                self.wordle_game.get_initial_requirements_groups().items()):
+            first_word = self.wordle_game.select_word(
+                list(possible_words), length, self.selection_strategy
+            )
+            opening = {'first_word': first_word}
+            if include_second_words:
+                second_words = {}
+                for target_word in possible_words:
+                    if target_word == first_word:
+                        continue
+                    feedback = self.auxiliary_functions.attempt_feedback(
+                        first_word, target_word
+                    )
+                    key = self.feedback_key(*feedback)
+                    if key in second_words:
+                        continue
+                    filtered_words = self.wordle_game.filter_words(
+                        possible_words, first_word, *feedback
+                    )
+                    second_words[key] = self.wordle_game.select_word(
+                        filtered_words, length, self.selection_strategy
+                    )
+                opening['second_words'] = second_words
+            openings[f'{length},{number_of_vowels},{number_of_consonants}'] = (
+                opening
+            )
+        with open(file=self.file_path, mode='w', encoding='utf-8') as book_file:
+            json.dump(
+                {
+                    'solver_version': SOLVER_VERSION,
+                    'word_bank_hash': self.wordle_game.get_word_bank_hash(),
+                    'selection_strategy': self.selection_strategy,
+                    'openings': openings,
+                },
+                book_file,
+                ensure_ascii=False,
+            )
+        self.__openings = openings
+
+    def __get_openings(self) -> dict:
+        """Return the openings of the book, reading the file the first time
+
+        Returns:
+            dict: Openings by group, empty if the file does not exist or does 
+            not belong to the word bank, the selection strategy and the version
+            of the solver
+        """
+        if self.__openings is None:
+            book = read_word_bank_file(self.file_path, 'opening book', {
+                'solver_version': SOLVER_VERSION,
+                'word_bank_hash': self.wordle_game.get_word_bank_hash(),
+                'selection_strategy': self.selection_strategy,
+            })
+            self.__openings = (book or {}).get('openings', {})
+        return self.__openings
+
+    def get_first_word(
+            self, length: int, number_of_vowels: int,
+            number_of_consonants: int) -> str:
+        """Return the first word to send for a group
+
+        Args:
+            length (int): Length of the target word
+            number_of_vowels (int): Number of vowels in the target word
+            number_of_consonants (int): Number of consonants in the target word
+
+        Returns:
+            str: First word, None if the book does not contain the group
+        """
+        opening = self.__get_openings().get(
+            f'{length},{number_of_vowels},{number_of_consonants}', {}
+        )
+        return opening.get('first_word')
+
+    def get_second_word(
+            self, length: int, number_of_vowels: int, number_of_consonants: int,
+            right_letters_in_right_positions: list,
+            right_letters_in_wrong_positions: list) -> str:
+        """Return the second word to send for a group after the feedback of the
+        first word
+
+        Args:
+            length (int): Length of the target word
+            number_of_vowels (int): Number of vowels in the target word
+            number_of_consonants (int): Number of consonants in the target word
+            right_letters_in_right_positions (list): Boolean list containing the
+            correct letter positions of the first word
+            right_letters_in_wrong_positions (list): List containing the correct
+            letters in the wrong positions of the first word
+
+        Returns:
+            str: Second word, None if the book does not contain the feedback
+        """
+        opening = self.__get_openings().get(
+            f'{length},{number_of_vowels},{number_of_consonants}', {}
+        )
+        return opening.get('second_words', {}).get(self.feedback_key(
+            right_letters_in_right_positions, right_letters_in_wrong_positions
+        ))
+
+
+class DecisionTree:
+    def __init__(
+            self, file_path: str, wordle_game: WordleGame,
+            selection_strategy: str = 'frequency') -> None:
+        """DecisionTree class constructor
+
+        The decision tree stores, for every (length, vowels, consonants) group
+        of the word bank, the word that the solver sends after every sequence
+        of feedbacks that the targets of the group can produce. Every node is a
+        list with the word to send and a dictionary with the node that follows
+        each feedback. The file is only read the first time a node is requested
+        and it is ignored when it was generated from another word bank, with 
+        another selection strategy or by another version of the solver.
+
+        Args:
+            file_path (str): Location of the json file of the decision tree
+            wordle_game (WordleGame): Wordle game whose word bank is used
+            selection_strategy (str, optional): Strategy used to select the 
+            words. Defaults to 'frequency'.
+        """
+        self.file_path = file_path
+        self.wordle_game = wordle_game
+        self.selection_strategy = selection_strategy
+        self.auxiliary_functions = AuxiliaryFunctions()
+        self.__trees = None
+
+    def generate(self) -> None:
+        """Compute the decision tree of every group of the word bank and save 
+        it in the decision tree file
+        """
+        trees = {}
+        for (length, number_of_vowels, number_of_consonants), possible_words in (
+                self.wordle_game.get_initial_requirements_groups().items()):
+            trees[f'{length},{number_of_vowels},{number_of_consonants}'] = (
+                self.__build_node(list(possible_words), length, 1)
+            )
+        with open(file=self.file_path, mode='w', encoding='utf-8') as tree_file:
+            json.dump(
+                {
+                    'solver_version': SOLVER_VERSION,
+                    'word_bank_hash': self.wordle_game.get_word_bank_hash(),
+                    'selection_strategy': self.selection_strategy,
+                    'trees': trees,
+                },
+                tree_file,
+                ensure_ascii=False,
+                separators=(',', ':'),
+            )
+        self.__trees = trees
+
+    def __build_node(
+            self, possible_words: list, length: int, attempt: int) -> list:
+        """Build the node of the decision tree for a set of possible words
+
+        Args:
+            possible_words (list): List of possible words
+            length (int): Length of the target word
+            attempt (int): Number of the attempt of the node
+
+        Returns:
+            list: Word to send and nodes that follow each of its feedbacks
+        """
+        attempt_word = self.wordle_game.select_word(
+            possible_words, length, self.selection_strategy
+        )
+        next_nodes = {}
+        if attempt < MAXIMUM_ATTEMPTS:
+            for target_word in possible_words:
+                if target_word == attempt_word:
+                    continue
+                feedback = self.auxiliary_functions.attempt_feedback(
+                    attempt_word, target_word
+                )
+                key = OpeningBook.feedback_key(*feedback)
+                if key in next_nodes:
+                    continue
+                filtered_words = self.wordle_game.filter_words(
+                    possible_words, attempt_word, *feedback
+                )
+                if len(filtered_words) > 0:
+                    next_nodes[key] = self.__build_node(
+                        filtered_words, length, attempt + 1
+                    )
+        return [attempt_word, next_nodes]
+
+    def __get_trees(self) -> dict:
+        """Return the trees of every group, reading the file the first time
+
+        Returns:
+            dict: Trees by group, empty if the file does not exist or does not 
+            belong to the word bank, the selection strategy and the version of
+            the solver
+        """
+        if self.__trees is None:
+            decision_tree = read_word_bank_file(
+                self.file_path, 'decision tree', {
+                    'solver_version': SOLVER_VERSION,
+                    'word_bank_hash': self.wordle_game.get_word_bank_hash(),
+                    'selection_strategy': self.selection_strategy,
+                }
+            )
+            self.__trees = (decision_tree or {}).get('trees', {})
+        return self.__trees
+
+    def get_root(
+            self, length: int, number_of_vowels: int,
+            number_of_consonants: int) -> list:
+        """Return the root node of the tree of a group
+
+        Args:
+            length (int): Length of the target word
+            number_of_vowels (int): Number of vowels in the target word
+            number_of_consonants (int): Number of consonants in the target word
+
+        Returns:
+            list: Root node, None if the tree does not contain the group
+        """
+        return self.__get_trees().get(
+            f'{length},{number_of_vowels},{number_of_consonants}'
+        )
+
+    @staticmethod
+    def get_next_node(
+            node: list, right_letters_in_right_positions: list,
+            right_letters_in_wrong_positions: list) -> list:
+        """Return the node that follows the feedback of the word of a node
+
+        Args:
+            node (list): Current node
+            right_letters_in_right_positions (list): Boolean list containing the
+            correct letter positions
+            right_letters_in_wrong_positions (list): List containing the correct
+            letters in the wrong positions
+
+        Returns:
+            list: Next node, None if the tree does not contain the feedback
+        """
+        return node[1].get(OpeningBook.feedback_key(
+            right_letters_in_right_positions, right_letters_in_wrong_positions
+        ))
+
+
+class TargetPrior:
+    def __init__(
+            self, file_path: str, wordle_game: WordleGame,
+            smoothing: float = 1.0, guess_threshold: float = 0.5) -> None:
+        """TargetPrior class constructor
+
+        The prior counts the games won with every word of the word bank, 
+        grouped by (length, vowels, consonants). The probability of a possible
+        word is its count plus the smoothing divided by the sum over all the 
+        possible words, so the words never seen as targets keep a small 
+        probability. The file only stores the counts of the words already seen
+        and the last game counted, so it is refreshed with the new games only.
+        It is read the first time it is needed and it is ignored when it was 
+        built from another word bank. The games won while playing are counted
+        in memory until the prior is updated from the database, which counts
+        every game once even when several processes update the same file.
+
+        Args:
+            file_path (str): Location of the json file of the prior
+            wordle_game (WordleGame): Wordle game whose word bank is used
+            smoothing (float, optional): Count added to every word. Defaults to
+            1.0.
+            guess_threshold (float, optional): Probability of the most likely 
+            possible word from which it is sent instead of the word selected by
+            the strategy. Defaults to 0.5.
+        """
+        self.file_path = file_path
+        self.wordle_game = wordle_game
+        self.smoothing = smoothing
+        self.guess_threshold = guess_threshold
+        self.auxiliary_functions = AuxiliaryFunctions()
+        self.last_game_id = 0
+        self.__counts = None
+        # Games won while playing that are not counted from the database yet
+        self.__observed_counts = {}
+
+    def __get_counts(self) -> dict:
+        """Return the number of games won with every word, reading the file the
+        first time
+
+        Returns:
+            dict: Number of games by word, empty if the file does not exist or 
+            does not belong to the word bank
+        """
+        if self.__counts is None:
+            # The games solved in worker threads only see the counts once they
+            # are read
+            counts = {}
+            target_prior = read_word_bank_file(
+                self.file_path, 'target prior', {
+                    'word_bank_hash': self.wordle_game.get_word_bank_hash(),
+                }, missing_ok=True
+            )
+            if target_prior is not None:
+                for word_counts in target_prior.get('counts', {}).values():
+                    counts.update(word_counts)
+                self.last_game_id = target_prior.get('last_game_id', 0)
+            self.__counts = counts
+        return self.__counts
+
+    def clear(self) -> None:
+        """Forget every game counted, so the next refresh counts them all
+        """
+        self.__counts = {}
+        self.__observed_counts = {}
+        self.last_game_id = 0
+
+    def observe(self, word: str) -> None:
+        """Count a game won with a word while playing, until the game is 
+        counted from the database by refresh
+
+        Args:
+            word (str): Target word of the game
+        """
+        self.__observed_counts[word] = self.__observed_counts.get(word, 0) + 1
+
+    def get_count(self, word: str) -> int:
+        """Return the number of games won with a word
+
+        Args:
+            word (str): Word of the word bank
+
+        Returns:
+            int: Games counted from the database and observed while playing
+        """
+        return self.__get_counts().get(word, 0) + self.__observed_counts.get(
+            word, 0)
+
+    def refresh(self, database: 'Database') -> int:
+        """Count the games won that were written in the database after the 
+        last refresh
+
+        Args:
+            database (Database): Database of the games, or any object whose 
+            get_won_words method returns the (game_id, word) tuples of the 
+            games won after a game_id
+
+        Returns:
+            int: Number of games counted
+        """
+        counts = self.__get_counts()
+        won_words = database.get_won_words(self.last_game_id)
+        for game_id, word in won_words:
+            counts[word] = counts.get(word, 0) + 1
+            self.last_game_id = max(self.last_game_id, game_id)
+        # The games observed while playing were written before the refresh, 
+        # so they are counted now
+        self.__observed_counts = {}
+        return len(won_words)
+
+    def update(self, connection_pool) -> int:
+        """Count the games won that were written in the database and save the
+        target prior file, so the next processes learn from them
+
+        Args:
+            connection_pool (psycopg2.pool.AbstractConnectionPool): Pool of 
+            database connections
+
+        Returns:
+            int: Number of games counted, 0 if the prior could not be updated
+        """
+        from storage import Database
+
+        try:
+            database = Database(connection_pool=connection_pool)
+            try:
+                number_of_games = self.refresh(database)
+            finally:
+                database.close_connection()
+            self.save()
+        except Exception as error:
+            print(f'Error updating the target prior file: {error}', file=sys.stderr)
+            return 0
+        return number_of_games
+
+    def save(self) -> None:
+        """Save the counts read from the database in the target prior file, 
+        grouped by (length, vowels, consonants)
+
+        The file is replaced at once, so a process never reads it half written.
+        """
+        groups = {}
+        # The counts are copied first, since the games may count a word while
+        # they are saved
+        for word, count in sorted(dict(self.__get_counts()).items()):
+            key = ','.join(str(value) for value in (
+                len(word),
+                self.auxiliary_functions.letter_counter(
+                    word, WordleGame.SET_OF_VOWELS),
+                self.auxiliary_functions.letter_counter(
+                    word, WordleGame.SET_OF_CONSONANTS),
+            ))
+            groups.setdefault(key, {})[word] = count
+        temporary_path = f'{self.file_path}.{os.getpid()}.tmp'
+        with open(file=temporary_path, mode='w', encoding='utf-8') as prior_file:
+            json.dump(
+                {
+                    'word_bank_hash': self.wordle_game.get_word_bank_hash(),
+                    'last_game_id': self.last_game_id,
+                    'counts': groups,
+                },
+                prior_file,
+                ensure_ascii=False,
+                separators=(',', ':'),
+            )
+        os.replace(temporary_path, self.file_path)
+
+    def rank_words(self, possible_words: list) -> list:
+        """Sort the possible words from the most to the least likely, keeping 
+        the order of the words with the same count
+
+        Args:
+            possible_words (list): List of possible words
+
+        Returns:
+            list: Sorted list of words, the same list if no word was seen
+        """
+        counts = self.__get_counts()
+        observed_counts = self.__observed_counts
+        if not any(
+                word in counts or word in observed_counts
+                for word in possible_words):
+            return possible_words
+        return sorted(possible_words, key=lambda word: -self.get_count(word))
+
+    def get_word_weights(
+            self, word_bitmask_index: WordBitmaskIndex,
+            possible_words: list) -> WordWeights:
+        """Return the weights of the possible words, their count plus the 
+        smoothing
+
+        Args:
+            word_bitmask_index (WordBitmaskIndex): Bitmask index of the 
+            possible words
+            possible_words (list): List of possible words
+
+        Returns:
+            WordWeights: Weights of the words, None if no possible word was 
+            seen, since then every word weighs the same
+        """
+        word_counts = {}
+        for word in possible_words:
+            count = self.get_count(word)
+            if count:
+                word_counts[word] = count
+        if not word_counts:
+            return None
+        return WordWeights(word_bitmask_index, word_counts, self.smoothing)
+
+    def get_likely_word(self, possible_words: list) -> str:
+        """Return the most likely possible word if its probability reaches the
+        guess threshold
+
+        Args:
+            possible_words (list): List of possible words
+
+        Returns:
+            str: Most likely word, None if no word reaches the threshold
+        """
+        highest_count = 0
+        likely_word = None
+        total = self.smoothing * len(possible_words)
+        for word in possible_words:
+            count = self.get_count(word)
+            total += count
+            if count > highest_count:
+                highest_count = count
+                likely_word = word
+        if likely_word is None:
+            return None
+        if (highest_count + self.smoothing) / total < self.guess_threshold:
+            return None
+        return likely_word
+
+
+class SpeculativeGuesser:
+    def __init__(
+            self, maximum_feedbacks: int = 3, maximum_workers: int = 1) -> None:
+        """SpeculativeGuesser class constructor
+
+        While a word is being sent, the possible words are split by the 
+        feedback that the word would receive from each of them, and the next 
+        word is computed in a worker thread for the most likely feedbacks. When
+        the feedback received is one of them, the next word is ready as soon as
+        the response arrives. No prediction is started while every worker is 
+        busy, so a new prediction never waits behind a late one, and a late 
+        prediction stops at the next feedback it would compute.
+
+        Args:
+            maximum_feedbacks (int, optional): Number of feedbacks whose next 
+            word is computed. Defaults to 3.
+            maximum_workers (int, optional): Number of worker threads. Defaults
+            to 1.
+        """
+        self.maximum_feedbacks = maximum_feedbacks
+        self.maximum_workers = maximum_workers
+        # Feedbacks predicted, not predicted, and received before the 
+        # prediction was finished, and predictions not started because every
+        # worker was busy
+        self.hits = 0
+        self.misses = 0
+        self.late = 0
+        self.skipped = 0
+        self.__executor = None
+        self.__lock = threading.Lock()
+        # Event that stops every prediction submitted and not finished
+        self.__stop_events = {}
+
+    def speculate(
+            self, wordle_game: WordleGame, possible_words: list,
+            attempt_word: str, length_target_word: int,
+            selection_strategy: str = 'frequency'):
+        """Start computing the next word for the most likely feedbacks of a 
+        word
+
+        Args:
+            wordle_game (WordleGame): Wordle game with the word bank
+            possible_words (list): Possible words before sending the word
+            attempt_word (str): Word being sent
+            length_target_word (int): Length of the word target
+            selection_strategy (str, optional): Strategy used to select the 
+            words. Defaults to 'frequency'.
+
+        Returns:
+            concurrent.futures.Future: Future of the predictions, None if every
+            worker is busy
+        """
+        with self.__lock:
+            if len(self.__stop_events) >= self.maximum_workers:
+                self.skipped += 1
+                return None
+            if self.__executor is None:
+                from concurrent.futures import ThreadPoolExecutor
+
+                self.__executor = ThreadPoolExecutor(
+                    max_workers=self.maximum_workers,
+                    thread_name_prefix='speculative-guesser'
+                )
+            stop_event = threading.Event()
+            predictions_future = self.__executor.submit(
+                self.predict_next_words, wordle_game, possible_words,
+                attempt_word, length_target_word, selection_strategy,
+                self.maximum_feedbacks, stop_event
+            )
+            self.__stop_events[predictions_future] = stop_event
+        predictions_future.add_done_callback(self.__forget_prediction)
+        return predictions_future
+
+    def __forget_prediction(self, predictions_future) -> None:
+        """Free the worker of a prediction that finished or was cancelled
+
+        Args:
+            predictions_future (concurrent.futures.Future): Future of the 
+            predictions
+        """
+        with self.__lock:
+            self.__stop_events.pop(predictions_future, None)
+
+    @staticmethod
+    def predict_next_words(
+            wordle_game: WordleGame, possible_words: list, attempt_word: str,
+            length_target_word: int, selection_strategy: str,
+            maximum_feedbacks: int,
+            stop_event: threading.Event = None) -> dict:
+        """Compute the next word for the most likely feedbacks of a word
+
+        The target word is one of the possible words, so a feedback is as 
+        likely as the number of possible words that produce it, and those words
+        are the possible words after receiving it.
+
+        Args:
+            wordle_game (WordleGame): Wordle game with the word bank
+            possible_words (list): Possible words before sending the word
+            attempt_word (str): Word being sent
+            length_target_word (int): Length of the word target
+            selection_strategy (str): Strategy used to select the words
+            maximum_feedbacks (int): Number of feedbacks whose next word is 
+            computed
+            stop_event (threading.Event, optional): Event set when the 
+            predictions are no longer needed. Defaults to None.
+
+        Returns:
+            dict: Possible words and next word, by feedback key
+        """
+        auxiliary_functions = AuxiliaryFunctions()
+        words_by_feedback = {}
+        for word in possible_words:
+            words_by_feedback.setdefault(
+                OpeningBook.feedback_key(
+                    *auxiliary_functions.attempt_feedback(attempt_word, word)
+                ),
+                []
+            ).append(word)
+        predictions = {}
+        for feedback_key in sorted(
+                words_by_feedback,
+                key=lambda key: -len(words_by_feedback[key])):
+            if len(predictions) == maximum_feedbacks:
+                break
+            if stop_event is not None and stop_event.is_set():
+                break
+            if '0' not in feedback_key.split('|')[0]:
+                # The word sent is the target word
+                continue
+            next_possible_words = words_by_feedback[feedback_key]
+            predictions[feedback_key] = (
+                next_possible_words,
+                wordle_game.select_word(
+                    next_possible_words, length_target_word, selection_strategy
+                ),
+            )
+        return predictions
+
+    def resolve(
+            self, predictions_future, right_letters_in_right_positions: list,
+            right_letters_in_wrong_positions: list) -> tuple:
+        """Return the prediction of the feedback received, if there is one
+
+        Args:
+            predictions_future (concurrent.futures.Future): Future returned by 
+            speculate
+            right_letters_in_right_positions (list): Boolean list containing the
+            correct letter positions
+            right_letters_in_wrong_positions (list): List containing the correct
+            letters in the wrong positions
+
+        Returns:
+            tuple: Possible words and next word, None if the feedback was not 
+            predicted or the prediction is not finished
+        """
+        if all(right_letters_in_right_positions):
+            return None
+        if not predictions_future.done():
+            # Waiting could take longer than computing the next word directly,
+            # and a prediction already running stops at the next feedback
+            predictions_future.cancel()
+            with self.__lock:
+                self.late += 1
+                stop_event = self.__stop_events.get(predictions_future)
+                if stop_event is not None:
+                    stop_event.set()
+            return None
+        try:
+            prediction = predictions_future.result().get(
+                OpeningBook.feedback_key(
+                    right_letters_in_right_positions,
+                    right_letters_in_wrong_positions
+                )
+            )
+        except Exception:
+            prediction = None
+        with self.__lock:
+            if prediction is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        return prediction
+
+    def get_statistics(self) -> dict:
+        """Return the counters of the predictions
+
+        Returns:
+            dict: Hits, misses, late and skipped predictions and hit rate
+        """
+        with self.__lock:
+            total = self.hits + self.misses + self.late
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'late': self.late,
+                'skipped': self.skipped,
+                'hit_rate': self.hits / total if total else 0.0,
+            }
+
+    def close(self) -> None:
+        """Stop the worker threads
+        """
+        with self.__lock:
+            if self.__executor is not None:
+                self.__executor.shutdown(cancel_futures=True)
+                self.__executor = None
+
+
+class GameSolver:
+    def __init__(
+            self, wordle_game: WordleGame, length_target_word: int,
+            number_vowels: int, number_consonants: int,
+            selection_strategy: str = 'frequency',
+            opening_book: OpeningBook = None,
+            decision_tree: DecisionTree = None,
+            speculative_guesser: SpeculativeGuesser = None,
+            target_prior: TargetPrior = None) -> None:
+        """GameSolver class constructor
+
+        Keeps the state of a single game and chooses the words to send. The 
+        decision tree is followed while it contains the feedbacks received, 
+        then the opening book is used, and the words are computed with the 
+        Wordle game otherwise. The possible words are only filtered when a word
+        has to be computed.
+
+        Args:
+            wordle_game (WordleGame): Wordle game with the word bank
+            length_target_word (int): Length of the word target
+            number_vowels (int): Number of vowels in the target word
+            number_consonants (int): Number of consonants in the target word
+            selection_strategy (str, optional): Strategy used to select the 
+            words. Defaults to 'frequency'.
+            opening_book (OpeningBook, optional): Opening book. Defaults to None.
+            decision_tree (DecisionTree, optional): Decision tree. Defaults to 
+            None.
+            speculative_guesser (SpeculativeGuesser, optional): Guesser that
+            computes the next word while a word is being sent. Defaults to 
+            None.
+            target_prior (TargetPrior, optional): Prior of the target words. A
+            possible word likely enough is sent before anything else, the 
+            strategy weighs the words by their prior, and its ties are broken in
+            favour of the likely words. Defaults to None.
+        """
+        self.wordle_game = wordle_game
+        self.length_target_word = length_target_word
+        self.number_vowels = number_vowels
+        self.number_consonants = number_consonants
+        self.selection_strategy = selection_strategy
+        self.opening_book = opening_book
+        # Words sent and their feedback
+        self.history = []
+        # Everything known about the target word, and the constraints added by
+        # every attempt of the history
+        self.word_constraints = WordConstraints(length_target_word)
+        self.__new_constraints = []
+        self.__possible_words = None
+        # Number of attempts of the history applied to the possible words
+        self.__attempts_filtered = 0
+        self.speculative_guesser = speculative_guesser
+        self.target_prior = target_prior
+        # Word being sent with the future of its predictions, and next word 
+        # taken from a prediction
+        self.__speculation = None
+        self.__speculated_word = None
+        self.__decision_node = None
+        if decision_tree is not None:
+            self.__decision_node = decision_tree.get_root(
+                length_target_word, number_vowels, number_consonants
+            )
+
+    def next_word(self) -> str:
+        """Return the next word to send
+
+        Returns:
+            str: Word to send, None if no word satisfies the feedback received
+        """
+        # The word of the decision tree needs no filtering, so the prior is 
+        # only used once the game leaves the tree
+        if self.__decision_node is not None:
+            return self.__decision_node[0]
+        if self.target_prior is not None:
+            likely_word = self.target_prior.get_likely_word(
+                self.get_possible_words()
+            )
+            if likely_word is not None:
+                return likely_word
+        if self.__speculated_word is not None:
+            metrics.observe_possible_words(len(self.__possible_words))
+            return self.__speculated_word
+        attempt_word = None
+        if self.opening_book is not None:
+            if len(self.history) == 0:
+                attempt_word = self.opening_book.get_first_word(
+                    self.length_target_word, self.number_vowels,
+                    self.number_consonants
+                )
+            elif len(self.history) == 1:
+                attempt_word = self.opening_book.get_second_word(
+                    self.length_target_word, self.number_vowels,
+                    self.number_consonants, *self.history[0][1:]
+                )
+        if attempt_word is None:
+            possible_words = self.get_possible_words()
+            metrics.observe_possible_words(len(possible_words))
+            if len(possible_words) == 0:
+                return None
+            if self.target_prior is not None:
+                possible_words = self.target_prior.rank_words(possible_words)
+            attempt_word = self.wordle_game.select_word(
+                possible_words, self.length_target_word,
+                self.selection_strategy, self.target_prior
+            )
+        return attempt_word
+
+    def speculate(self, attempt_word: str) -> None:
+        """Start computing the next word for the most likely feedbacks of the
+        word about to be sent
+
+        Nothing is computed when the next word will come from the decision 
+        tree or the opening book, when there is no speculative guesser, or 
+        when there is a target prior, which the predictions do not use.
+
+        Args:
+            attempt_word (str): Word about to be sent
+        """
+        self.__speculation = None
+        if (
+            self.speculative_guesser is None
+            or self.target_prior is not None
+            or self.__decision_node is not None
+            or (self.opening_book is not None and len(self.history) == 0)
+        ):
+            return
+        possible_words = self.get_possible_words()
+        if len(possible_words) <= 1:
+            return
+        predictions_future = self.speculative_guesser.speculate(
+            self.wordle_game, possible_words, attempt_word,
+            self.length_target_word, self.selection_strategy
+        )
+        if predictions_future is not None:
+            self.__speculation = (attempt_word, predictions_future)
+
+    def register_feedback(
+            self, attempt_word: str, right_letters_in_right_positions: list,
+            right_letters_in_wrong_positions: list) -> None:
+        """Register the feedback received for a word
+
+        Args:
+            attempt_word (str): Word sent
+            right_letters_in_right_positions (list): Boolean list containing the
+            correct letter positions
+            right_letters_in_wrong_positions (list): List containing the correct
+            letters in the wrong positions
+        """
+        self.history.append((
+            attempt_word, right_letters_in_right_positions,
+            right_letters_in_wrong_positions,
+        ))
+        self.__new_constraints.append(self.word_constraints.add_feedback(
+            attempt_word, right_letters_in_right_positions,
+            right_letters_in_wrong_positions
+        ))
+        self.__speculated_word = None
+        if self.__speculation is not None:
+            speculated_attempt_word, predictions_future = self.__speculation
+            self.__speculation = None
+            prediction = None
+            if (
+                speculated_attempt_word == attempt_word
+                and self.__attempts_filtered == len(self.history) - 1
+            ):
+                prediction = self.speculative_guesser.resolve(
+                    predictions_future, right_letters_in_right_positions,
+                    right_letters_in_wrong_positions
+                )
+            if prediction is not None:
+                self.__possible_words, self.__speculated_word = prediction
+                self.__attempts_filtered = len(self.history)
+        self.__follow_decision_tree(
+            attempt_word, right_letters_in_right_positions,
+            right_letters_in_wrong_positions
+        )
+
+    def replay(self, history: list) -> None:
+        """Register the feedback of the words sent before the game was resumed
+
+        The feedback is merged into the constraints and the possible words are
+        filtered once with all of them, instead of once per word. It must be 
+        called before any other feedback is registered.
+
+        Args:
+            history (list): Words sent with the boolean list containing the 
+            correct letter positions and the list containing the correct 
+            letters in the wrong positions of each one
+        """
+        for (attempt_word, right_letters_in_right_positions,
+                right_letters_in_wrong_positions) in history:
+            self.history.append((
+                attempt_word, right_letters_in_right_positions,
+                right_letters_in_wrong_positions,
+            ))
+            self.__new_constraints.append(self.word_constraints.add_feedback(
+                attempt_word, right_letters_in_right_positions,
+                right_letters_in_wrong_positions
+            ))
+            self.__follow_decision_tree(
+                attempt_word, right_letters_in_right_positions,
+                right_letters_in_wrong_positions
+            )
+        if len(history) > 0:
+            self.__possible_words = (
+                self.wordle_game.filter_words_by_constraints(
+                    self.__get_filtered_words(), self.word_constraints
+                )
+            )
+            self.__attempts_filtered = len(self.history)
+
+    def __follow_decision_tree(
+            self, attempt_word: str, right_letters_in_right_positions: list,
+            right_letters_in_wrong_positions: list) -> None:
+        """Move to the node of the decision tree that follows the feedback of a
+        word, leaving the tree if the word is not the one of the node
+
+        Args:
+            attempt_word (str): Word sent
+            right_letters_in_right_positions (list): Boolean list containing the
+            correct letter positions
+            right_letters_in_wrong_positions (list): List containing the correct
+            letters in the wrong positions
+        """
+        if self.__decision_node is not None:
+            if self.__decision_node[0] == attempt_word:
+                self.__decision_node = DecisionTree.get_next_node(
+                    self.__decision_node, right_letters_in_right_positions,
+                    right_letters_in_wrong_positions
+                )
+            else:
+                self.__decision_node = None
+
+    def get_possible_words(self) -> list:
+        """Return the words that satisfy all the constraints of the feedback
+        registered
+
+        Returns:
+            list: List of possible words
+        """
+        filter_cache = self.wordle_game.filter_cache
+        while self.__attempts_filtered < len(self.history):
+            possible_words = None
+            if filter_cache is not None:
+                key = filter_cache.make_key(
+                    self.length_target_word, self.number_vowels,
+                    self.number_consonants,
+                    self.history[:self.__attempts_filtered + 1]
+                )
+                possible_words = filter_cache.get(key)
+            if possible_words is None:
+                # Only the constraints added by the attempt are checked on the
+                # words left by the previous ones
+                possible_words = self.wordle_game.filter_words_by_constraints(
+                    self.__get_filtered_words(),
+                    self.__new_constraints[self.__attempts_filtered]
+                )
+                if filter_cache is not None:
+                    filter_cache.put(key, possible_words)
+            self.__possible_words = possible_words
+            self.__attempts_filtered += 1
+        return self.__get_filtered_words()
+
+    def __get_filtered_words(self) -> list:
+        """Return the possible words after the attempts already filtered
+
+        Returns:
+            list: List of possible words
+        """
+        if self.__possible_words is None:
+            self.__possible_words = (
+                self.wordle_game.words_filter_initial_requirements(
+                    self.length_target_word, self.number_vowels,
+                    self.number_consonants
+                )
+            )
+        return self.__possible_words
+
+
+class BatchSolver:
+    def __init__(
+            self, wordle_game: WordleGame, selection_strategy: str = 'frequency',
+            opening_book: OpeningBook = None,
+            decision_tree: DecisionTree = None,
+            target_prior: TargetPrior = None) -> None:
+        """BatchSolver class constructor
+
+        Plays games against a local copy of the API feedback, so the solver
+        can be evaluated without network requests.
+
+        Args:
+            wordle_game (WordleGame): Wordle game with the word bank
+            selection_strategy (str, optional): Strategy used to select the 
+            words. Defaults to 'frequency'.
+            opening_book (OpeningBook, optional): Opening book. Defaults to None.
+            decision_tree (DecisionTree, optional): Decision tree. Defaults to 
+            None.
+            target_prior (TargetPrior, optional): Prior of the target words. 
+            Defaults to None.
+        """
+        self.wordle_game = wordle_game
+        self.selection_strategy = selection_strategy
+        self.opening_book = opening_book
+        self.decision_tree = decision_tree
+        self.target_prior = target_prior
+        self.auxiliary_functions = AuxiliaryFunctions()
+
+    def solve(self, target_word: str) -> int:
+        """Play a game whose target is a given word
+
+        Args:
+            target_word (str): Word to be found
+
+        Returns:
+            int: Number of attempts used to find the word, None if it was not 
+            found
+        """
+        length_target_word = len(target_word)
+        number_vowels = self.auxiliary_functions.letter_counter(
+            target_word, WordleGame.SET_OF_VOWELS)
+        number_consonants = self.auxiliary_functions.letter_counter(
+            target_word, WordleGame.SET_OF_CONSONANTS)
+        game_solver = GameSolver(
+            self.wordle_game, length_target_word, number_vowels,
+            number_consonants, self.selection_strategy, self.opening_book,
+            self.decision_tree, target_prior=self.target_prior
+        )
+        for attempt in range(1, MAXIMUM_ATTEMPTS + 1):
+            attempt_word = game_solver.next_word()
+            if attempt_word is None:
+                return None
+            if attempt_word == target_word:
+                return attempt
+            game_solver.register_feedback(
+                attempt_word,
+                *self.auxiliary_functions.attempt_feedback(
+                    attempt_word, target_word
+                )
+            )
+        return None
+
+    @staticmethod
+    def evaluate(
+            word_bank_path: str, selection_strategy: str = 'frequency',
+            opening_book_path: str = None, sample_size: int = None,
+            seed: int = 0, max_workers: int = None,
+            compiled_word_bank_path: str = None,
+            decision_tree_path: str = None,
+            share_word_bank: bool = True) -> dict:
+        """Play every word of the word bank, or a sample of them, as the target
+        word using a pool of processes
+
+        The word bank is placed in shared memory once and every worker attaches
+        to it when it starts, decoding only the groups of its target words. 
+        The target words are sorted by group, so a worker plays the games of a
+        few groups at a time.
+
+        Args:
+            word_bank_path (str): Location of the txt file containing the words
+            selection_strategy (str, optional): Strategy used to select the 
+            words. Defaults to 'frequency'.
+            opening_book_path (str, optional): Location of the opening book 
+            file. Defaults to None.
+            sample_size (int, optional): Number of target words, None to play 
+            the whole word bank. Defaults to None.
+            seed (int, optional): Seed of the sample. Defaults to 0.
+            max_workers (int, optional): Number of processes, None to use all 
+            the cores. Defaults to None.
+            compiled_word_bank_path (str, optional): Location of the compiled 
+            word bank, mapped by the workers instead of reading the txt file. 
+            Defaults to None.
+            decision_tree_path (str, optional): Location of the decision tree 
+            file. Defaults to None.
+            share_word_bank (bool, optional): Whether the workers attach to a 
+            shared copy of the word bank instead of loading it on their own. 
+            Defaults to True.
+
+        Returns:
+            dict: Win rate, distribution of the number of attempts and solver
+            CPU time per game
+        """
+        from concurrent.futures import ProcessPoolExecutor
+
+        wordle_game = load_wordle_game(word_bank_path, compiled_word_bank_path)
+        list_of_words = wordle_game.get_list_of_words()
+        target_indexes = list(range(len(list_of_words)))
+        if sample_size is not None and sample_size < len(list_of_words):
+            target_indexes = random.Random(seed).sample(
+                target_indexes, sample_size)
+        target_words = [
+            list_of_words[index] for index in sorted(
+                target_indexes, key=lambda index: (
+                    wordle_game.get_group_key(list_of_words[index]), index
+                )
+            )
+        ]
+        max_workers = max_workers or os.cpu_count() or 1
+        chunk_size = max(1, len(target_words) // (max_workers * 8))
+        chunks = [
+            target_words[index:index + chunk_size]
+            for index in range(0, len(target_words), chunk_size)
+        ]
+        initial_time = time.perf_counter()
+        attempts_distribution = {}
+        number_of_wins = 0
+        cpu_time = 0.0
+        shared_word_bank = None
+        if share_word_bank:
+            shared_word_bank = SharedWordBank(wordle_game)
+        try:
+            with ProcessPoolExecutor(
+                max_workers=max_workers,
+                initializer=_initialize_batch_worker,
+                initargs=(
+                    word_bank_path, selection_strategy, opening_book_path,
+                    compiled_word_bank_path, decision_tree_path,
+                    shared_word_bank and shared_word_bank.name,
+                ),
+            ) as executor:
+                for results, chunk_cpu_time in executor.map(
+                        _solve_batch_targets, chunks):
+                    cpu_time += chunk_cpu_time
+                    for number_of_attempts in results:
+                        attempts_distribution[number_of_attempts] = (
+                            attempts_distribution.get(number_of_attempts, 0)
+                            + 1
+                        )
+                        if number_of_attempts is not None:
+                            number_of_wins += 1
+        finally:
+            if shared_word_bank is not None:
+                shared_word_bank.close()
+        number_of_games = len(target_words)
+        return {
+            'games': number_of_games,
+            'win_rate': number_of_wins / number_of_games if number_of_games else 0.0,
+            'attempts_distribution': attempts_distribution,
+            'cpu_time_per_game': cpu_time / number_of_games if number_of_games else 0.0,
+            'elapsed_time': time.perf_counter() - initial_time,
+        }
+
+
+# Solver of the current batch worker process
+_batch_solver = None
+
+
+def _initialize_batch_worker(
+        word_bank_path: str, selection_strategy: str,
+        opening_book_path: str, compiled_word_bank_path: str,
+        decision_tree_path: str, shared_word_bank_name: str = None) -> None:
+    """Load the word bank in a batch worker process
+
+    Args:
+        word_bank_path (str): Location of the txt file containing the words
+        selection_strategy (str): Strategy used to select the words
+        opening_book_path (str): Location of the opening book file, None to 
+        play without it
+        compiled_word_bank_path (str): Location of the compiled word bank, None
+        to read the txt file
+        decision_tree_path (str): Location of the decision tree file, None to 
+        play without it
+        shared_word_bank_name (str, optional): Name of the shared memory block
+        of the word bank, None to load the word bank files. Defaults to None.
+    """
+    global _batch_solver
+    wordle_game = None
+    if shared_word_bank_name is not None:
+        wordle_game = SharedWordBank.attach(shared_word_bank_name)
+    if wordle_game is None:
+        wordle_game = load_wordle_game(word_bank_path, compiled_word_bank_path)
+    opening_book = None
+    if opening_book_path is not None:
+        opening_book = OpeningBook(
+            opening_book_path, wordle_game, selection_strategy
+        )
+    decision_tree = None
+    if decision_tree_path is not None:
+        decision_tree = DecisionTree(
+            decision_tree_path, wordle_game, selection_strategy
+        )
+    _batch_solver = BatchSolver(
+        wordle_game, selection_strategy, opening_book, decision_tree
+    )
+
+
+def _solve_batch_targets(target_words: list) -> tuple:
+    """Play the games of a chunk of target words in a batch worker process
+
+    Args:
+        target_words (list): Target words
+
+    Returns:
+        tuple: Number of attempts of every game and CPU time of the chunk
+    """
+    initial_cpu_time = time.process_time()
+    results = [_batch_solver.solve(word) for word in target_words]
+    return results, time.process_time() - initial_cpu_time
+
+
+class WordBankManagement:
+    # Header of the compiled word bank: magic, bytes of the alphabet, number of
+    # words, number of lengths and sha256 hash of the txt file it was compiled
+    # from
+    COMPILED_HEADER = struct.Struct('<4sHIH32s')
+    # Entry of every length: length, number of words and offset of its block
+    COMPILED_LENGTH_ENTRY = struct.Struct('<HIQ')
+    COMPILED_MAGIC = b'WBK2'
+
+    def __init__(self) -> None:
+        """WordBankManagement class constructor
+        """
+        self.__list_of_words = []
+        # Blocks of the compiled word bank by length, None if it was not loaded
+        self.__compiled_blocks = None
+        self.__compiled_alphabet = ''
+        self.__compiled_number_of_words = 0
+        # Words of the compiled word bank already decoded, by length
+        self.__words_by_length = {}
+        # sha256 hash of the txt file the words come from
+        self.__source_hash = None
+
+    def create_list_of_words(self, url_words_bank: str) -> None:
+        """Create a list of words
+        Args:
+            url_words_bank (str): Location of the txt file containing the words
+        """
+        try:
+            with open(file=url_words_bank, mode="rb") as word_bank_file:
+                content = word_bank_file.read()
+            self.__set_list_of_words(
+                content.decode('utf-8').split('\n', 1)[0].split()
+            )
+            self.__source_hash = hashlib.sha256(content).digest()
+        except:
+            print(
+                'Error reading the file containing the words', file=sys.stderr
+            )
+
+    @timed('word_bank_load')
+    def load_word_bank(
+            self, url_compiled_words_bank: str, url_words_bank: str) -> None:
+        """Load the compiled word bank, or the txt file if it cannot be loaded
+        or it was not compiled from the txt file
+
+        Args:
+            url_compiled_words_bank (str): Location of the compiled word bank
+            url_words_bank (str): Location of the txt file containing the words
+        """
+        if self.load_compiled_word_bank(url_compiled_words_bank):
+            try:
+                with open(file=url_words_bank, mode='rb') as word_bank_file:
+                    source_hash = hashlib.sha256(word_bank_file.read()).digest()
+            except OSError:
+                # Without the txt file the compiled word bank is the only copy
+                return
+            if source_hash == self.__source_hash:
+                return
+            print(
+                f'The compiled word bank {url_compiled_words_bank} was not '
+                f'compiled from {url_words_bank}, the txt file is read instead',
+                file=sys.stderr
+            )
+        self.create_list_of_words(url_words_bank)
+
+    def compile_word_bank(
+            self, url_words_bank: str, url_compiled_words_bank: str) -> None:
+        """Write the word bank in the compiled binary format
+
+        Args:
+            url_words_bank (str): Location of the txt file containing the words
+            url_compiled_words_bank (str): Location of the compiled word bank
+        """
+        self.create_list_of_words(url_words_bank)
+        with open(url_compiled_words_bank, 'wb') as compiled_file:
+            compiled_file.write(self.encode_word_bank())
+
+    def encode_word_bank(self) -> bytes:
+        """Encode the loaded word bank in the compiled binary format
+
+        The words are grouped by length. Every group stores one letter code per
+        position (one byte per letter), the number of vowels and consonants of
+        every word and its position in the txt file. The header keeps the hash
+        of the txt file, so a compiled word bank left from another txt file is
+        not loaded instead of it.
+
+        Returns:
+            bytes: Compiled word bank
+        """
+        list_of_words = self.get_list_of_words()
+        auxiliary_functions = AuxiliaryFunctions()
+        alphabet = ''.join(sorted(set(''.join(list_of_words))))
+        if len(alphabet) > 256:
+            raise ValueError('The word bank has more than 256 different letters')
+        letter_codes = {letter: code for code, letter in enumerate(alphabet)}
+        positions_by_length = {}
+        for position, word in enumerate(list_of_words):
+            positions_by_length.setdefault(len(word), []).append(position)
+        encoded_alphabet = alphabet.encode('utf-8')
+        offset = (
+            self.COMPILED_HEADER.size + len(encoded_alphabet)
+            + self.COMPILED_LENGTH_ENTRY.size * len(positions_by_length)
+        )
+        length_entries = []
+        blocks = []
+        for length, positions in sorted(positions_by_length.items()):
+            length_entries.append(self.COMPILED_LENGTH_ENTRY.pack(
+                length, len(positions), offset
+            ))
+            codes = bytearray()
+            number_vowels = bytearray()
+            number_consonants = bytearray()
+            for position in positions:
+                word = list_of_words[position]
+                codes.extend(letter_codes[letter] for letter in word)
+                number_vowels.append(auxiliary_functions.letter_counter(
+                    word, WordleGame.SET_OF_VOWELS))
+                number_consonants.append(auxiliary_functions.letter_counter(
+                    word, WordleGame.SET_OF_CONSONANTS))
+            word_positions = array('I', positions)
+            if sys.byteorder != 'little':
+                word_positions.byteswap()
+            block = (
+                bytes(codes) + bytes(number_vowels) + bytes(number_consonants)
+                + word_positions.tobytes()
+            )
+            blocks.append(block)
+            offset += len(block)
+        return b''.join([
+            self.COMPILED_HEADER.pack(
+                self.COMPILED_MAGIC, len(encoded_alphabet), len(list_of_words),
+                len(positions_by_length), self.__source_hash or bytes(32)
+            ),
+            encoded_alphabet,
+            *length_entries,
+            *blocks,
+        ])
+
+    def load_compiled_word_bank(self, url_compiled_words_bank: str) -> bool:
+        """Map the compiled word bank into memory without copying it
+
+        Args:
+            url_compiled_words_bank (str): Location of the compiled word bank
+
+        Returns:
+            bool: True if the compiled word bank was loaded
+        """
+        if url_compiled_words_bank is None:
+            return False
+        try:
+            with open(url_compiled_words_bank, 'rb') as compiled_file:
+                compiled_map = mmap.mmap(
+                    compiled_file.fileno(), 0, access=mmap.ACCESS_READ
+                )
+        except (OSError, ValueError):
+            return False
+        return self.__load_compiled_view(memoryview(compiled_map))
+
+    def __load_compiled_view(self, compiled_view: memoryview) -> bool:
+        """Read the blocks of a compiled word bank without copying them
+
+        Args:
+            compiled_view (memoryview): Compiled word bank
+
+        Returns:
+            bool: True if the compiled word bank has a known format
+        """
+        if (
+            len(compiled_view) < self.COMPILED_HEADER.size
+            or compiled_view[:4] != self.COMPILED_MAGIC
+        ):
+            print(
+                'The compiled word bank has an unknown format, it must be '
+                'compiled again', file=sys.stderr
+            )
+            return False
+        _, alphabet_size, number_of_words, number_of_lengths, source_hash = (
+            self.COMPILED_HEADER.unpack_from(compiled_view)
+        )
+        offset = self.COMPILED_HEADER.size
+        alphabet = bytes(compiled_view[offset:offset + alphabet_size]).decode(
+            'utf-8')
+        offset += alphabet_size
+        blocks = {}
+        for _ in range(number_of_lengths):
+            length, count, block_offset = (
+                self.COMPILED_LENGTH_ENTRY.unpack_from(compiled_view, offset)
+            )
+            offset += self.COMPILED_LENGTH_ENTRY.size
+            codes_end = block_offset + count * length
+            word_positions = compiled_view[
+                codes_end + 2 * count:codes_end + 6 * count]
+            if sys.byteorder == 'little':
+                word_positions = word_positions.cast('I')
+            else:
+                word_positions = array('I', word_positions.tobytes())
+                word_positions.byteswap()
+            blocks[length] = {
+                'count': count,
+                'codes': compiled_view[block_offset:codes_end],
+                'number_vowels': compiled_view[codes_end:codes_end + count],
+                'number_consonants': compiled_view[
+                    codes_end + count:codes_end + 2 * count],
+                'word_positions': word_positions,
+            }
+        self.__compiled_alphabet = alphabet
+        self.__compiled_number_of_words = number_of_words
+        self.__compiled_blocks = blocks
+        self.__words_by_length = {}
+        self.__list_of_words = None
+        self.__source_hash = source_hash
+        return True
+
+    def get_words_of_length(self, length: int) -> list:
+        """Return the words of a given length of the compiled word bank
+
+        Args:
+            length (int): Length of the words
+
+        Returns:
+            list: List of words with that length, in word bank order
+        """
+        if length in self.__words_by_length:
+            return self.__words_by_length[length]
+        block = self.__compiled_blocks.get(length)
+        if block is None:
+            return []
+        self.__words_by_length[length] = self.decode_words(
+            block['codes'], self.__compiled_alphabet, length
+        )
+        return self.__words_by_length[length]
+
+    @staticmethod
+    def decode_words(codes: memoryview, alphabet: str, length: int) -> list:
+        """Decode the letter codes of words with the same length
+
+        Args:
+            codes (memoryview): One code per letter, the position of the 
+            letter in the alphabet
+            alphabet (str): Letters of the word bank
+            length (int): Length of the words
+
+        Returns:
+            list: List of words
+        """
+        if all(ord(letter) < 256 for letter in alphabet):
+            # Every code is translated to its latin-1 byte in a single pass
+            translation = bytes(
+                ord(letter) for letter in alphabet
+            ).ljust(256, b'\0')
+            text = codes.tobytes().translate(translation).decode('latin-1')
+        else:
+            text = ''.join(alphabet[code] for code in codes)
+        return [
+            text[index:index + length]
+            for index in range(0, len(text), length)
+        ]
+
+    def get_initial_requirements_groups(self) -> dict:
+        """Return the words grouped by length, number of vowels and number of 
+        consonants using the counts stored in the compiled word bank
+
+        Returns:
+            dict: Dictionary whose keys are (length, vowels, consonants) tuples
+            and whose values are the words of that group, None if the compiled
+            word bank was not loaded
+        """
+        if self.__compiled_blocks is None:
+            return None
+        groups = {}
+        for length, block in sorted(self.__compiled_blocks.items()):
+            for word, number_vowels, number_consonants in zip(
+                    self.get_words_of_length(length), block['number_vowels'],
+                    block['number_consonants']):
+                groups.setdefault(
+                    (length, number_vowels, number_consonants), []
+                ).append(word)
+        return groups
+
+    def __set_list_of_words(self, list_of_words: list) -> None:
+        """Assign word list
+
+        Args:
+            list_of_words (list): List of words 
+        """
+        self.__list_of_words = list_of_words
+        self.__compiled_blocks = None
+
+    def get_list_of_words(self) -> list:
+        """Return the list of words
+
+        Returns:
+            list: List of words
+        """
+        if self.__list_of_words is None:
+            # The words of the compiled word bank are put back in the order of
+            # the txt file
+            list_of_words = [None] * self.__compiled_number_of_words
+            for length, block in self.__compiled_blocks.items():
+                for word, position in zip(
+                        self.get_words_of_length(length),
+                        block['word_positions']):
+                    list_of_words[position] = word
+            self.__list_of_words = list_of_words
+        return self.__list_of_words
+
+
+
+class SharedWordBank:
+    # Header of the shared block: magic, bytes of the alphabet, number of 
+    # words, number of groups and hexadecimal hash of the word bank
+    HEADER = struct.Struct('<4sHIH64s')
+    # Entry of every group: length, vowels, consonants, number of words and
+    # offset of its block
+    GROUP_ENTRY = struct.Struct('<HHHIQ')
+    MAGIC = b'WBS1'
+
+    def __init__(self, wordle_game: WordleGame) -> None:
+        """SharedWordBank class constructor
+
+        Places the words of a Wordle game in a shared memory block once, 
+        grouped by length, number of vowels and number of consonants. Worker
+        processes attach to it with SharedWordBank.attach and read the groups
+        from the shared block instead of loading the word bank again. The block
+        is removed when the shared word bank is closed.
+
+        Args:
+            wordle_game (WordleGame): Wordle game with the word bank
+        """
+        from multiprocessing import shared_memory
+
+        content = self.encode(wordle_game)
+        self.size = len(content)
+        self.__shared_block = shared_memory.SharedMemory(
+            create=True, size=self.size
+        )
+        self.__shared_block.buf[:self.size] = content
+        self.name = self.__shared_block.name
+
+    def __enter__(self) -> 'SharedWordBank':
+        return self
+
+    def __exit__(self, *exception_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Remove the shared memory block
+        """
+        if self.__shared_block is not None:
+            self.__shared_block.close()
+            self.__shared_block.unlink()
+            self.__shared_block = None
+
+    @classmethod
+    def encode(cls, wordle_game: WordleGame) -> bytes:
+        """Encode the words of a Wordle game in the format of the shared block
+
+        Every group stores one letter code per position (one byte per letter)
+        and the position of every word in the word bank, aligned to 8 bytes.
+
+        Args:
+            wordle_game (WordleGame): Wordle game with the word bank
+
+        Returns:
+            bytes: Content of the shared block
+        """
+        list_of_words = wordle_game.get_list_of_words()
+        alphabet = ''.join(sorted(set(''.join(list_of_words))))
+        if len(alphabet) > 256:
+            raise ValueError('The word bank has more than 256 different letters')
+        letter_codes = {letter: code for code, letter in enumerate(alphabet)}
+        positions_by_group = {}
+        for position, word in enumerate(list_of_words):
+            positions_by_group.setdefault(
+                wordle_game.get_group_key(word), []
+            ).append(position)
+        encoded_alphabet = alphabet.encode('utf-8')
+        offset = cls.__align(
+            cls.HEADER.size + len(encoded_alphabet)
+            + cls.GROUP_ENTRY.size * len(positions_by_group)
+        )
+        group_entries = []
+        blocks = []
+        for key, positions in sorted(positions_by_group.items()):
+            group_entries.append(cls.GROUP_ENTRY.pack(
+                *key, len(positions), offset
+            ))
+            codes = bytearray()
+            for position in positions:
+                codes.extend(
+                    letter_codes[letter] for letter in list_of_words[position]
+                )
+            word_positions = array('I', positions)
+            if sys.byteorder != 'little':
+                word_positions.byteswap()
+            block = bytes(codes).ljust(cls.__align(len(codes)), b'\0')
+            block += word_positions.tobytes()
+            block = block.ljust(cls.__align(len(block)), b'\0')
+            blocks.append(block)
+            offset += len(block)
+        header = b''.join([
+            cls.HEADER.pack(
+                cls.MAGIC, len(encoded_alphabet), len(list_of_words),
+                len(positions_by_group),
+                wordle_game.get_word_bank_hash().encode('ascii')
+            ),
+            encoded_alphabet,
+            *group_entries,
+        ])
+        return b''.join([
+            header.ljust(cls.__align(len(header)), b'\0'), *blocks
+        ])
+
+    @staticmethod
+    def __align(size: int) -> int:
+        """Round a size up to a multiple of 8 bytes
+
+        Args:
+            size (int): Size in bytes
+
+        Returns:
+            int: Aligned size
+        """
+        return (size + 7) // 8 * 8
+
+    @staticmethod
+    def attach(name: str, maximum_groups: int = 16) -> WordleGame:
+        """Create a Wordle game whose groups are read from a shared word bank
+
+        Only the groups being played are decoded, so the memory of a process
+        attached to the shared word bank does not depend on the size of the
+        word bank.
+
+        Args:
+            name (str): Name of the shared memory block
+            maximum_groups (int, optional): Number of groups whose words and 
+            bitmask index are kept, the least recently used are dropped. 
+            Defaults to 16.
+
+        Returns:
+            WordleGame: Wordle game of the shared word bank, None if the block
+            cannot be attached
+        """
+        from multiprocessing import shared_memory
+
+        try:
+            shared_block = shared_memory.SharedMemory(name=name)
+        except (OSError, ValueError):
+            return None
+        shared_word_groups = SharedWordGroups(shared_block, maximum_groups)
+        return WordleGame(
+            None, shared_word_groups,
+            word_bank_hash=shared_word_groups.word_bank_hash,
+            maximum_group_indexes=maximum_groups,
+        )
+
+
+class SharedWordGroups(Mapping):
+    def __init__(
+            self, shared_block, maximum_groups: int = None) -> None:
+        """SharedWordGroups class constructor
+
+        Read-only view of the groups of a SharedWordBank, used by WordleGame as
+        its words grouped by length, number of vowels and number of consonants.
+        The words of a group are decoded when it is requested.
+
+        Args:
+            shared_block (shared_memory.SharedMemory): Shared memory block of
+            the word bank
+            maximum_groups (int, optional): Number of groups whose words are 
+            kept, the least recently used are dropped. By default all of them
+            are kept.
+        """
+        self.__view = shared_block.buf.toreadonly()
+        # The view is released before the block is closed, also when the 
+        # process exits with the view still in use
+        self.__finalizer = weakref.finalize(
+            self, self.__release, self.__view, shared_block
+        )
+        magic, alphabet_size, number_of_words, number_of_groups, word_bank_hash = (
+            SharedWordBank.HEADER.unpack_from(self.__view)
+        )
+        if magic != SharedWordBank.MAGIC:
+            self.close()
+            raise ValueError('The shared word bank has an unknown format')
+        self.word_bank_hash = word_bank_hash.decode('ascii')
+        offset = SharedWordBank.HEADER.size
+        self.__alphabet = bytes(
+            self.__view[offset:offset + alphabet_size]).decode('utf-8')
+        offset += alphabet_size
+        self.__number_of_words = number_of_words
+        # Number of words and offset of the block of every group
+        self.__groups = {}
+        for _ in range(number_of_groups):
+            length, number_vowels, number_consonants, count, block_offset = (
+                SharedWordBank.GROUP_ENTRY.unpack_from(self.__view, offset)
+            )
+            offset += SharedWordBank.GROUP_ENTRY.size
+            self.__groups[(length, number_vowels, number_consonants)] = (
+                count, block_offset
+            )
+        self.maximum_groups = maximum_groups
+        self.__words_by_group = OrderedDict()
+        self.__words_by_group_lock = threading.Lock()
+
+    def __getitem__(self, key: tuple) -> list:
+        with self.__words_by_group_lock:
+            words = self.__words_by_group.get(key)
+            if words is not None:
+                self.__words_by_group.move_to_end(key)
+                return words
+        count, block_offset = self.__groups[key]
+        words = WordBankManagement.decode_words(
+            self.__view[block_offset:block_offset + count * key[0]],
+            self.__alphabet, key[0]
+        )
+        with self.__words_by_group_lock:
+            self.__words_by_group[key] = words
+            if (
+                self.maximum_groups is not None
+                and len(self.__words_by_group) > self.maximum_groups
+            ):
+                self.__words_by_group.popitem(last=False)
+        return words
+
+    def __iter__(self):
+        return iter(self.__groups)
+
+    def __len__(self) -> int:
+        return len(self.__groups)
+
+    def get_list_of_words(self) -> list:
+        """Decode every group and put the words back in word bank order
+
+        Returns:
+            list: List of words
+        """
+        list_of_words = [None] * self.__number_of_words
+        for key, (count, block_offset) in self.__groups.items():
+            codes_size = count * key[0]
+            positions_offset = block_offset + (codes_size + 7) // 8 * 8
+            word_positions = array('I', self.__view[
+                positions_offset:positions_offset + 4 * count].tobytes())
+            if sys.byteorder != 'little':
+                word_positions.byteswap()
+            words = WordBankManagement.decode_words(
+                self.__view[block_offset:block_offset + codes_size],
+                self.__alphabet, key[0]
+            )
+            for word, position in zip(words, word_positions):
+                list_of_words[position] = word
+        return list_of_words
+
+    def close(self) -> None:
+        """Release the view of the shared memory block, which is removed by 
+        the SharedWordBank that created it
+        """
+        self.__finalizer()
+
+    @staticmethod
+    def __release(view: memoryview, shared_block) -> None:
+        """Release a view of a shared memory block and close the block
+
+        Args:
+            view (memoryview): View of the shared memory block
+            shared_block (shared_memory.SharedMemory): Shared memory block
+        """
+        view.release()
+        shared_block.close()
+
+def load_wordle_game(
+        word_bank_path: str = WORD_BANK_PATH,
+        compiled_word_bank_path: str = COMPILED_WORD_BANK_PATH,
+        filter_cache: FilterCache = None) -> WordleGame:
+    """Load the word bank and create a Wordle game with it
+
+    Args:
+        word_bank_path (str, optional): Location of the txt file containing the
+        words. Defaults to WORD_BANK_PATH.
+        compiled_word_bank_path (str, optional): Location of the compiled word 
+        bank, used instead of the txt file when it was compiled from it. 
+        Defaults to COMPILED_WORD_BANK_PATH.
+        filter_cache (FilterCache, optional): Cache of the possible words. 
+        Defaults to None.
+
+    Returns:
+        WordleGame: Wordle game with the word bank
+    """
+    word_bank_management = WordBankManagement()
+    word_bank_management.load_word_bank(compiled_word_bank_path, word_bank_path)
+    return WordleGame(
+        word_bank_management.get_list_of_words(),
+        word_bank_management.get_initial_requirements_groups(),
+        filter_cache
+    )
@@ -0,0 +1,1170 @@
+import atexit
+import bisect
+from datetime import datetime, timedelta, timezone
+import json
+import math
+import os
+import queue
+import sys
+import threading
+import time
+
+from observability import events, metrics, timed
+
+
+class Database:
+    # Upper bounds of the buckets of the time to find the word kept by the 
+    # summary of the games, in seconds
+    TIME_BUCKETS = (
+        0.25, 0.5, 0.75, 1.0, 1.5, 2.0, 3.0, 4.0, 5.0, 7.5, 10.0, 15.0, 30.0,
+        60.0, math.inf,
+    )
+    # Versions of the schema, applied in order by migrate. A version must 
+    # never be modified once released: changes go in a new version
+    MIGRATIONS = (
+        (1, 'Tables of the games and their attempts', (
+            '''CREATE TABLE IF NOT EXISTS game (
+                game_id SERIAL PRIMARY KEY,
+                token_api TEXT NOT NULL,
+                number_vowels INTEGER,
+                number_consonants INTEGER,
+                length_word INTEGER,
+                time_to_find_word REAL,
+                total_time REAL,
+                win BOOLEAN
+            )''',
+            '''CREATE TABLE IF NOT EXISTS attempt (
+                attempt_id SERIAL PRIMARY KEY,
+                game_id INTEGER REFERENCES game (game_id),
+                word_sent TEXT,
+                score REAL,
+                date DATE,
+                time TIME,
+                current_attemps INTEGER,
+                position_array INTEGER[],
+                right_letters_in_wrong_positions TEXT[]
+            )''',
+        )),
+        (2, 'Indexes of the game lookups', (
+            'CREATE INDEX IF NOT EXISTS game_token_api_index ON game (token_api)',
+            'CREATE INDEX IF NOT EXISTS attempt_game_id_index ON attempt (game_id)',
+        )),
+        (3, 'Summary of the games by length of the target word', (
+            '''CREATE TABLE IF NOT EXISTS game_stats (
+                length_word INTEGER PRIMARY KEY,
+                games INTEGER NOT NULL,
+                wins INTEGER NOT NULL,
+                attempts INTEGER NOT NULL
+            )''',
+            '''CREATE TABLE IF NOT EXISTS game_time_histogram (
+                length_word INTEGER NOT NULL,
+                bucket INTEGER NOT NULL,
+                games INTEGER NOT NULL,
+                PRIMARY KEY (length_word, bucket)
+            )''',
+            '''INSERT INTO game_stats (length_word, games, wins, attempts)
+            SELECT game.length_word, COUNT(*), 
+            SUM(CASE WHEN game.win THEN 1 ELSE 0 END),
+            SUM((SELECT COUNT(*) FROM attempt 
+                 WHERE attempt.game_id = game.game_id))
+            FROM game WHERE game.total_time IS NOT NULL
+            GROUP BY game.length_word''',
+            '''INSERT INTO game_time_histogram (length_word, bucket, games)
+            SELECT length_word, bucket, COUNT(*) FROM (
+                SELECT length_word, CASE ''' + ' '.join(
+                f'WHEN time_to_find_word <= {bound} THEN {bucket}'
+                for bucket, bound in enumerate(TIME_BUCKETS[:-1])
+            ) + f''' ELSE {len(TIME_BUCKETS) - 1} END AS bucket
+                FROM game WHERE total_time IS NOT NULL
+            ) AS game_bucket
+            GROUP BY length_word, bucket''',
+        )),
+        (4, 'Queue of the games played by the workers', (
+            '''CREATE TABLE IF NOT EXISTS game_job (
+                job_id SERIAL PRIMARY KEY,
+                status TEXT NOT NULL DEFAULT 'pending',
+                worker_id TEXT,
+                claims INTEGER NOT NULL DEFAULT 0,
+                token_api TEXT,
+                created_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+                heartbeat_at TIMESTAMP,
+                finished_at TIMESTAMP
+            )''',
+            'CREATE INDEX IF NOT EXISTS game_job_status_index ON game_job (status, job_id)',
+            'CREATE INDEX IF NOT EXISTS game_job_worker_id_index ON game_job (worker_id)',
+        )),
+        (5, 'Checkpoints of the games in progress', (
+            'ALTER TABLE game ADD COLUMN session_cookies TEXT',
+            'ALTER TABLE game ADD COLUMN checkpoint_at TIMESTAMP',
+            'CREATE INDEX IF NOT EXISTS game_unfinished_index ON game (checkpoint_at) WHERE total_time IS NULL',
+        )),
+        (6, 'Time played until the checkpoint of the games in progress', (
+            'ALTER TABLE game ADD COLUMN elapsed_time REAL',
+        )),
+    )
+
+    def __init__(self, conn=None, connection_pool=None) -> None:
+        self.connection_pool = connection_pool
+        if connection_pool is not None:
+            conn = connection_pool.getconn()
+        self.conn = conn
+        self.cursor = self.conn.cursor()
+        # game_id of every game inserted or searched, by token_api
+        self.__game_ids = {}
+        # Rows of the attempt table waiting to be written
+        self.__pending_attempt_rows = []
+
+    @staticmethod
+    def create_connection_pool(
+            hostname_db: str, username_db: str, password_db: str, dbname: str,
+            minimum_connections: int = 1, maximum_connections: int = 10):
+        import psycopg2.pool
+
+        return psycopg2.pool.ThreadedConnectionPool(
+            minimum_connections,
+            maximum_connections,
+            host=hostname_db,
+            user=username_db,
+            password=password_db,
+            dbname=dbname
+        )
+
+    @timed('database_migrate')
+    def migrate(self) -> list:
+        # Apply the versions of the schema that the database does not have yet,
+        # each one in its own transaction. Returns the versions applied
+        cursor = self.cursor
+        applied_versions = []
+        try:
+            cursor.execute('''CREATE TABLE IF NOT EXISTS schema_migrations (
+                version INTEGER PRIMARY KEY,
+                description TEXT NOT NULL
+            )''')
+            self.conn.commit()
+            cursor.execute('SELECT version FROM schema_migrations')
+            current_versions = {row[0] for row in cursor.fetchall()}
+            for version, description, statements in self.MIGRATIONS:
+                if version in current_versions:
+                    continue
+                for statement in statements:
+                    cursor.execute(statement)
+                cursor.execute(
+                    'INSERT INTO schema_migrations (version, description) VALUES (%s, %s)',
+                    (version, description)
+                )
+                self.conn.commit()
+                applied_versions.append(version)
+        except:
+            self.conn.rollback()
+            print('No se pudo actualizar el esquema de la base de datos')
+            raise
+        return applied_versions
+
+    def get_pending_migrations(self) -> list:
+        # Versions of the schema that the database does not have yet, read 
+        # without taking any lock on the tables
+        cursor = self.cursor
+        try:
+            cursor.execute('SELECT version FROM schema_migrations')
+            current_versions = {row[0] for row in cursor.fetchall()}
+            self.conn.commit()
+        except Exception:
+            # There is no schema_migrations table, so no version was applied
+            self.conn.rollback()
+            current_versions = set()
+        return [
+            version for version, _, _ in self.MIGRATIONS
+            if version not in current_versions
+        ]
+
+    def check_schema(self) -> None:
+        # The schema is only changed by the migrate command, so the games are
+        # never played against a database with an old schema
+        pending_versions = self.get_pending_migrations()
+        if pending_versions:
+            raise RuntimeError(
+                'El esquema de la base de datos no está actualizado, faltan '
+                f'las versiones {pending_versions}: ejecute el comando migrate'
+            )
+
+    @staticmethod
+    def check_pool_schema(connection_pool) -> None:
+        # Check the schema with a connection of the pool, before any game is
+        # started
+        database = Database(connection_pool=connection_pool)
+        try:
+            database.check_schema()
+        finally:
+            database.close_connection()
+
+    @staticmethod
+    def current_timestamp() -> datetime:
+        # Time written in the heartbeats and checkpoints and compared with 
+        # them, taken by the process in UTC so the cutoffs are computed with 
+        # the same clock and the queries do not depend on the SQL dialect
+        return datetime.now(timezone.utc).replace(tzinfo=None)
+
+    @staticmethod
+    def encrypt_session_cookies(
+            session_cookies: dict, session_cookies_key: str) -> str:
+        # The cookies of the API sessions are credentials, so they are only 
+        # written encrypted with the key of the environment
+        from cryptography.fernet import Fernet
+
+        return Fernet(session_cookies_key).encrypt(
+            json.dumps(session_cookies).encode('utf-8')
+        ).decode('ascii')
+
+    @staticmethod
+    def decrypt_session_cookies(
+            encrypted_session_cookies: str, session_cookies_key: str) -> dict:
+        from cryptography.fernet import Fernet
+
+        return json.loads(Fernet(session_cookies_key).decrypt(
+            encrypted_session_cookies.encode('ascii')
+        ))
+
+    @staticmethod
+    def time_bucket(time_to_find_word: float) -> int:
+        # Bucket of the summary of the games that holds a time to find the word
+        return bisect.bisect_left(Database.TIME_BUCKETS, time_to_find_word)
+
+    def __add_game_to_stats(
+            self, length_word: int, number_of_attempts: int,
+            time_to_find_word: float, win: bool) -> None:
+        # The summary is updated in the transaction that finishes the game, so
+        # the statistics never need a scan of the game and attempt tables
+        cursor = self.cursor
+        add_game_stats_query = '''INSERT INTO game_stats 
+        (length_word, games, wins, attempts) VALUES (%s, 1, %s, %s)
+        ON CONFLICT (length_word) DO UPDATE SET 
+        games = game_stats.games + 1,
+        wins = game_stats.wins + excluded.wins,
+        attempts = game_stats.attempts + excluded.attempts
+        '''
+        cursor.execute(
+            add_game_stats_query,
+            (length_word, 1 if win else 0, number_of_attempts)
+        )
+        add_game_time_histogram_query = '''INSERT INTO game_time_histogram 
+        (length_word, bucket, games) VALUES (%s, %s, 1)
+        ON CONFLICT (length_word, bucket) DO UPDATE SET 
+        games = game_time_histogram.games + 1
+        '''
+        cursor.execute(
+            add_game_time_histogram_query,
+            (length_word, self.time_bucket(time_to_find_word))
+        )
+
+    @staticmethod
+    def histogram_percentile(bucket_counts: dict, percent: float) -> float:
+        # Percentile of the times of a histogram, interpolated inside its 
+        # bucket. The last bucket has no upper bound, so its lower one is used
+        total = sum(bucket_counts.values())
+        if total == 0:
+            return None
+        rank = percent / 100 * total
+        cumulative_count = 0
+        for bucket in sorted(bucket_counts):
+            count = bucket_counts[bucket]
+            if count == 0:
+                continue
+            lower_bound = Database.TIME_BUCKETS[bucket - 1] if bucket > 0 else 0.0
+            upper_bound = Database.TIME_BUCKETS[bucket]
+            if cumulative_count + count >= rank:
+                if upper_bound == math.inf:
+                    return lower_bound
+                fraction = (rank - cumulative_count) / count
+                return lower_bound + (upper_bound - lower_bound) * fraction
+            cumulative_count += count
+        return lower_bound
+
+    @timed('database_stats')
+    def get_stats(self, percents: tuple = (50, 95, 99)) -> dict:
+        # Win rate, mean attempts and percentiles of the time to find the word
+        # of every length of the target word, from the summary of the games
+        cursor = self.cursor
+        cursor.execute(
+            'SELECT length_word, games, wins, attempts FROM game_stats'
+        )
+        stats_rows = cursor.fetchall()
+        cursor.execute(
+            'SELECT length_word, bucket, games FROM game_time_histogram'
+        )
+        time_histograms = {}
+        for length_word, bucket, games in cursor.fetchall():
+            time_histograms.setdefault(length_word, {})[bucket] = games
+        stats = {}
+        for length_word, games, wins, attempts in sorted(stats_rows):
+            time_histogram = time_histograms.get(length_word, {})
+            stats[length_word] = {
+                'games': games,
+                'wins': wins,
+                'win_rate': wins / games if games else 0.0,
+                'mean_attempts': attempts / games if games else 0.0,
+                'time_to_find_word_percentiles': {
+                    percent: self.histogram_percentile(time_histogram, percent)
+                    for percent in percents
+                },
+            }
+        return stats
+
+    @timed('database_insert_game')
+    def insert_data_game_table(self, data: tuple) -> int:
+        try:
+            cursor = self.cursor
+            insert_data_game_table_query = '''INSERT INTO game 
+            (token_api, number_vowels, number_consonants, length_word) VALUES (%s, %s, %s, %s)
+            RETURNING game_id;
+            '''
+            cursor.execute(insert_data_game_table_query, data)
+            game_id = cursor.fetchone()[0]
+            self.conn.commit()
+            self.__game_ids[data[0]] = game_id
+            return game_id
+        except:
+            self.conn.rollback()
+            print('No se pudo insertar los datos en la tabla game')
+
+    @timed('database_update_game')
+    def update_data_game_table(self, data: tuple) -> None:
+        # The pending attempts and the final data of the game are written in
+        # the same transaction
+        try:
+            add_datetime_gametable_query = '''UPDATE game SET time_to_find_word = %s, total_time = %s, win = %s WHERE token_api = %s'''
+            cursor = self.cursor
+            self.__write_attempt_rows(self.__pending_attempt_rows)
+            search_data_game_table_query = '''SELECT game_id, length_word, total_time FROM game 
+            WHERE token_api = %s
+            '''
+            cursor.execute(search_data_game_table_query, (data[3],))
+            game_row = cursor.fetchone()
+            cursor.execute(add_datetime_gametable_query, data)
+            if game_row is not None and game_row[2] is None:
+                count_data_attempt_table_query = '''SELECT COUNT(*) FROM attempt 
+                WHERE game_id = %s
+                '''
+                cursor.execute(count_data_attempt_table_query, (game_row[0],))
+                self.__add_game_to_stats(
+                    game_row[1], cursor.fetchone()[0], data[0], data[2]
+                )
+            self.conn.commit()
+            self.__pending_attempt_rows = []
+        except:
+            self.conn.rollback()
+            print('No se puedo añadir los valores al tabla game')
+
+    def close_connection(self) -> None:
+        self.flush_attempts()
+        self.cursor.close()
+        if self.connection_pool is not None:
+            self.connection_pool.putconn(self.conn)
+        else:
+            self.conn.close()
+    
+    @staticmethod
+    def attempt_row(game_id: int, attempt_data: dict) -> tuple:
+        # Row of the attempt table for the API response of a word sent
+        attempt_date, attempt_time = attempt_data.get('try_datetime').split('T')
+        return (
+            game_id,
+            attempt_data.get('word_sent'),
+            round(attempt_data.get('score'), 2),
+            attempt_date,
+            attempt_time,
+            attempt_data.get('current_attemps'),
+            [1 if position else 0
+             for position in attempt_data.get('position_array')],
+            list(attempt_data.get('right_letters_in_wrong_positions') or []),
+        )
+
+    def insert_data_attempt_table(self, data: tuple) -> None:
+        # The row is kept in memory until the game is updated or the attempts 
+        # are flushed
+        self.__pending_attempt_rows.append(data)
+
+    @timed('database_flush_attempts')
+    def flush_attempts(self) -> None:
+        if len(self.__pending_attempt_rows) == 0:
+            return
+        try:
+            self.__write_attempt_rows(self.__pending_attempt_rows)
+            self.conn.commit()
+            self.__pending_attempt_rows = []
+        except:
+            self.conn.rollback()
+            print('No se pudo añadir los datos a la tabla attempt')
+
+    @timed('database_save_game')
+    def save_game(
+            self, game_data: tuple, attempts: list, times_data: tuple,
+            job: tuple = None) -> int:
+        # Write a whole game in one transaction. The game is searched by its 
+        # token_api and only the attempts not written yet, by a checkpoint or 
+        # by a write that failed, are inserted, so writing it again never 
+        # duplicates any row. The job (job_id, worker_id) that played the 
+        # game, if any, is finished in the same transaction. The errors are 
+        # raised so that the write can be retried
+        cursor = self.cursor
+        token_api = game_data[0]
+        try:
+            search_data_game_table_query = '''SELECT game_id, total_time FROM game 
+            WHERE token_api = %s
+            '''
+            cursor.execute(search_data_game_table_query, (token_api,))
+            row = cursor.fetchone()
+            if row is None:
+                insert_data_game_table_query = '''INSERT INTO game 
+                (token_api, number_vowels, number_consonants, length_word) VALUES (%s, %s, %s, %s)
+                RETURNING game_id;
+                '''
+                cursor.execute(insert_data_game_table_query, game_data)
+                game_id = cursor.fetchone()[0]
+            else:
+                game_id = row[0]
+            written_attempts = set()
+            if row is not None:
+                # The attempts checkpointed while the game was played are kept
+                search_written_attempts_query = '''SELECT current_attemps 
+                FROM attempt WHERE game_id = %s
+                '''
+                cursor.execute(search_written_attempts_query, (game_id,))
+                written_attempts = {
+                    current_attemps for (current_attemps,) in cursor.fetchall()
+                }
+            self.__write_attempt_rows([
+                Database.attempt_row(game_id, attempt_data)
+                for attempt_data in attempts
+                if attempt_data.get('current_attemps') not in written_attempts
+            ])
+            # The cookies of the API session are not needed once the game is
+            # finished
+            add_datetime_gametable_query = '''UPDATE game SET time_to_find_word = %s, total_time = %s, win = %s, session_cookies = NULL WHERE token_api = %s'''
+            cursor.execute(add_datetime_gametable_query, times_data)
+            # A game already finished was counted in the summary by a write 
+            # that committed before failing
+            if row is None or row[1] is None:
+                self.__add_game_to_stats(
+                    game_data[3], len(attempts), times_data[0], times_data[2]
+                )
+            if job is not None:
+                # A job queued again after its worker stopped heartbeating 
+                # belongs to another worker, so it is not finished here
+                finish_game_job_query = '''UPDATE game_job SET status = 'done',
+                token_api = %s, finished_at = CURRENT_TIMESTAMP 
+                WHERE job_id = %s AND worker_id = %s AND status = 'running'
+                '''
+                cursor.execute(finish_game_job_query, (token_api, *job))
+            self.conn.commit()
+        except:
+            self.conn.rollback()
+            raise
+        self.__game_ids[token_api] = game_id
+        return game_id
+
+    @timed('database_checkpoint_games')
+    def checkpoint_games(
+            self, checkpoints: list, session_cookies_key: str = None) -> None:
+        # Record games in progress with the attempts just sent and the cookies
+        # of their API sessions, so that the games can be resumed if the 
+        # process dies. The checkpoints (game_data, session_cookies, 
+        # attempt_data, elapsed_time) are written in a single transaction, and
+        # only the last one of every game updates its row. Without a key the 
+        # cookies are not written and the games cannot be resumed. The errors 
+        # are raised so that the write can be retried
+        cursor = self.cursor
+        game_ids = {}
+        last_checkpoints = {}
+        try:
+            for game_data, session_cookies, attempt_data, elapsed_time in (
+                    checkpoints):
+                token_api = game_data[0]
+                game_id = game_ids.get(token_api, self.__game_ids.get(token_api))
+                if game_id is None:
+                    search_data_game_table_query = '''SELECT game_id FROM game 
+                    WHERE token_api = %s
+                    '''
+                    cursor.execute(search_data_game_table_query, (token_api,))
+                    row = cursor.fetchone()
+                    if row is None:
+                        insert_data_game_table_query = '''INSERT INTO game 
+                        (token_api, number_vowels, number_consonants, length_word) VALUES (%s, %s, %s, %s)
+                        RETURNING game_id;
+                        '''
+                        cursor.execute(insert_data_game_table_query, game_data)
+                        row = cursor.fetchone()
+                    game_id = row[0]
+                game_ids[token_api] = game_id
+                if attempt_data is not None:
+                    # A retried write replaces the attempt instead of 
+                    # duplicating it
+                    delete_data_attempt_table_query = '''DELETE FROM attempt 
+                    WHERE game_id = %s AND current_attemps = %s
+                    '''
+                    cursor.execute(
+                        delete_data_attempt_table_query,
+                        (game_id, attempt_data.get('current_attemps'))
+                    )
+                    self.__write_attempt_rows(
+                        [Database.attempt_row(game_id, attempt_data)]
+                    )
+                last_checkpoints[game_id] = (session_cookies, elapsed_time)
+            checkpoint_at = Database.current_timestamp()
+            checkpoint_game_query = '''UPDATE game SET session_cookies = %s,
+            elapsed_time = %s, checkpoint_at = %s WHERE game_id = %s
+            '''
+            for game_id, (session_cookies, elapsed_time) in (
+                    last_checkpoints.items()):
+                if session_cookies_key is not None:
+                    session_cookies = Database.encrypt_session_cookies(
+                        session_cookies, session_cookies_key
+                    )
+                else:
+                    session_cookies = None
+                cursor.execute(
+                    checkpoint_game_query,
+                    (session_cookies, elapsed_time, checkpoint_at, game_id)
+                )
+            self.conn.commit()
+        except:
+            self.conn.rollback()
+            raise
+        self.__game_ids.update(game_ids)
+
+    def checkpoint_game(
+            self, game_data: tuple, session_cookies: dict,
+            attempt_data: dict = None, elapsed_time: float = 0.0,
+            session_cookies_key: str = None) -> int:
+        # Record a single game in progress. Returns its game_id
+        self.checkpoint_games(
+            [(game_data, session_cookies, attempt_data, elapsed_time)],
+            session_cookies_key
+        )
+        return self.__game_ids[game_data[0]]
+
+    @timed('database_unfinished_games')
+    def get_unfinished_games(
+            self, session_cookies_key: str, stale_after: float = 60.0) -> list:
+        # Games left in progress whose last checkpoint is older than 
+        # stale_after seconds, with the cookies of their API session, the 
+        # seconds played until the checkpoint and the API responses of their 
+        # attempts. The attempts of all the games are read with a single query
+        cursor = self.cursor
+        unfinished_game_condition = '''game.total_time IS NULL 
+        AND game.session_cookies IS NOT NULL AND game.checkpoint_at < %s
+        '''
+        checkpoint_cutoff = (
+            Database.current_timestamp() - timedelta(seconds=stale_after)
+        )
+        search_unfinished_games_query = '''SELECT game.game_id, game.token_api,
+        game.number_vowels, game.number_consonants, game.length_word, 
+        game.session_cookies, game.elapsed_time FROM game 
+        WHERE ''' + unfinished_game_condition + '''
+        ORDER BY game.game_id
+        '''
+        cursor.execute(search_unfinished_games_query, (checkpoint_cutoff,))
+        unfinished_games = {}
+        for (game_id, token_api, number_vowels, number_consonants, length_word,
+                session_cookies, elapsed_time) in cursor.fetchall():
+            unfinished_games[game_id] = {
+                'token_api': token_api,
+                'number_vowels': number_vowels,
+                'number_consonants': number_consonants,
+                'length_word': length_word,
+                'session_cookies': Database.decrypt_session_cookies(
+                    session_cookies, session_cookies_key
+                ),
+                'elapsed_time': elapsed_time or 0.0,
+                'attempts': [],
+            }
+        search_unfinished_attempts_query = '''SELECT attempt.game_id, 
+        attempt.word_sent, attempt.score, attempt.date, attempt.time, 
+        attempt.current_attemps, attempt.position_array, 
+        attempt.right_letters_in_wrong_positions 
+        FROM attempt JOIN game ON attempt.game_id = game.game_id
+        WHERE ''' + unfinished_game_condition + '''
+        ORDER BY attempt.game_id, attempt.current_attemps
+        '''
+        cursor.execute(search_unfinished_attempts_query, (checkpoint_cutoff,))
+        for (game_id, word_sent, score, attempt_date, attempt_time,
+                current_attemps, position_array,
+                right_letters_in_wrong_positions) in cursor.fetchall():
+            if game_id not in unfinished_games:
+                continue
+            unfinished_games[game_id]['attempts'].append({
+                'word_sent': word_sent,
+                'score': score,
+                'try_datetime': f'{attempt_date}T{attempt_time}',
+                'current_attemps': current_attemps,
+                'position_array': [bool(position) for position in position_array],
+                'right_letters_in_wrong_positions': list(
+                    right_letters_in_wrong_positions or []),
+            })
+        self.conn.commit()
+        return list(unfinished_games.values())
+
+    def get_won_words(self, after_game_id: int = 0) -> list:
+        # Target word of every game won after a game_id, found in the attempt
+        # that won it. Returns (game_id, word) tuples sorted by game_id
+        cursor = self.cursor
+        search_won_words_query = '''SELECT game.game_id, attempt.word_sent 
+        FROM game JOIN attempt ON attempt.game_id = game.game_id
+        WHERE game.win AND attempt.score = 1.0 AND game.game_id > %s
+        ORDER BY game.game_id
+        '''
+        cursor.execute(search_won_words_query, (after_game_id,))
+        won_words = cursor.fetchall()
+        self.conn.commit()
+        return won_words
+
+    def enqueue_games(self, number_of_games: int) -> list:
+        # Queue games to be played by the workers. Returns the job_id of every
+        # job
+        cursor = self.cursor
+        try:
+            enqueue_games_query = '''INSERT INTO game_job (status) 
+            SELECT 'pending' FROM generate_series(1, %s) 
+            RETURNING job_id
+            '''
+            cursor.execute(enqueue_games_query, (number_of_games,))
+            job_ids = [row[0] for row in cursor.fetchall()]
+            self.conn.commit()
+        except:
+            self.conn.rollback()
+            print('No se pudieron encolar los juegos')
+            raise
+        return job_ids
+
+    @timed('database_claim_jobs')
+    def claim_jobs(self, worker_id: str, batch_size: int) -> list:
+        # Mark a batch of pending jobs as running for a worker. The rows locked
+        # by the claims of other workers are skipped, so the workers never wait
+        # on each other nor claim the same job. Returns the job_id of every job
+        cursor = self.cursor
+        try:
+            claim_jobs_query = '''UPDATE game_job SET status = 'running', 
+            worker_id = %s, claims = claims + 1, heartbeat_at = %s
+            WHERE job_id IN (
+                SELECT job_id FROM game_job WHERE status = 'pending'
+                ORDER BY job_id LIMIT %s FOR UPDATE SKIP LOCKED
+            )
+            RETURNING job_id
+            '''
+            cursor.execute(claim_jobs_query, (
+                worker_id, Database.current_timestamp(), batch_size
+            ))
+            job_ids = sorted(row[0] for row in cursor.fetchall())
+            self.conn.commit()
+        except:
+            self.conn.rollback()
+            raise
+        return job_ids
+
+    def heartbeat_jobs(self, worker_id: str) -> int:
+        # Record that the running jobs of a worker are still in progress. 
+        # Returns the number of jobs
+        cursor = self.cursor
+        try:
+            heartbeat_jobs_query = '''UPDATE game_job SET heartbeat_at = %s
+            WHERE worker_id = %s AND status = 'running'
+            '''
+            cursor.execute(
+                heartbeat_jobs_query, (Database.current_timestamp(), worker_id)
+            )
+            number_of_jobs = cursor.rowcount
+            self.conn.commit()
+        except:
+            self.conn.rollback()
+            raise
+        return number_of_jobs
+
+    def requeue_stale_jobs(
+            self, stale_timeout: float, maximum_claims: int) -> list:
+        # Queue again the running jobs without a heartbeat in the last 
+        # stale_timeout seconds, whose workers are assumed dead. A job claimed
+        # maximum_claims times is marked as failed instead. Returns the job_id 
+        # of every job
+        cursor = self.cursor
+        try:
+            requeue_stale_jobs_query = '''UPDATE game_job SET 
+            status = CASE WHEN claims >= %s THEN 'failed' ELSE 'pending' END,
+            worker_id = NULL
+            WHERE status = 'running' 
+            AND heartbeat_at < %s
+            RETURNING job_id
+            '''
+            heartbeat_cutoff = (
+                Database.current_timestamp() - timedelta(seconds=stale_timeout)
+            )
+            cursor.execute(
+                requeue_stale_jobs_query, (maximum_claims, heartbeat_cutoff)
+            )
+            job_ids = [row[0] for row in cursor.fetchall()]
+            self.conn.commit()
+        except:
+            self.conn.rollback()
+            raise
+        return job_ids
+
+    def release_jobs(self, worker_id: str, maximum_claims: int) -> list:
+        # Queue again the running jobs of a worker whose games were not 
+        # written. A job claimed maximum_claims times is marked as failed 
+        # instead. Returns the job_id of every job
+        cursor = self.cursor
+        try:
+            release_jobs_query = '''UPDATE game_job SET 
+            status = CASE WHEN claims >= %s THEN 'failed' ELSE 'pending' END,
+            worker_id = NULL
+            WHERE worker_id = %s AND status = 'running'
+            RETURNING job_id
+            '''
+            cursor.execute(release_jobs_query, (maximum_claims, worker_id))
+            job_ids = [row[0] for row in cursor.fetchall()]
+            self.conn.commit()
+        except:
+            self.conn.rollback()
+            raise
+        return job_ids
+
+    def get_job_counts(self) -> dict:
+        # Number of jobs of the queue by status
+        cursor = self.cursor
+        cursor.execute('SELECT status, COUNT(*) FROM game_job GROUP BY status')
+        job_counts = dict(cursor.fetchall())
+        self.conn.commit()
+        return job_counts
+
+    def __write_attempt_rows(self, rows: list) -> None:
+        if len(rows) == 0:
+            return
+        if not hasattr(self.cursor, 'mogrify'):
+            # Connections other than psycopg2 ones, such as the local SQLite 
+            # stand-in, insert the rows with executemany
+            insert_data_attempt_table_query = '''INSERT INTO attempt
+            (game_id, word_sent, score, date, time, current_attemps, position_array, right_letters_in_wrong_positions) VALUES (%s, %s, %s, %s, %s, %s, %s, %s)
+            '''
+            self.cursor.executemany(insert_data_attempt_table_query, rows)
+            return
+        import psycopg2.extras
+
+        insert_data_attempt_table_query = '''INSERT INTO attempt
+        (game_id, word_sent, score, date, time, current_attemps, position_array, right_letters_in_wrong_positions) VALUES %s
+        '''
+        psycopg2.extras.execute_values(
+            self.cursor, insert_data_attempt_table_query, rows
+        )
+
+    @timed('database_search_game')
+    def search_data_game_table(self, token_game: str) :
+        if token_game in self.__game_ids:
+            return self.__game_ids[token_game]
+        try:   
+            cursor = self.cursor
+            search_data_game_table_query = '''SELECT game_id FROM game 
+            WHERE token_api = %s
+            '''
+            cursor.execute(search_data_game_table_query, (token_game,))
+            game_id = list(cursor.fetchone())[0]
+            self.__game_ids[token_game] = game_id
+            return game_id
+        except:
+            print('No se encontro el juego especificado')
+
+    @timed('database_win_game')
+    def win_game(self, token_api: str) -> str:
+           
+        cursor = self.cursor
+        id_game = self.search_data_game_table(token_api)
+        for row in self.__pending_attempt_rows:
+            if row[0] == id_game and row[2] == 1.0:
+                return row[2]
+        search_data_game_table_query = '''SELECT score FROM attempt 
+        WHERE score = 1.0 AND game_id = %s
+        '''
+        cursor.execute(search_data_game_table_query, (id_game,))
+        return list(cursor.fetchone())[0]
+        
+            # print('No se encontro el juego especificado')
+
+
+class DatabaseWriter:
+    # Object put in the queue to stop the writer thread
+    STOP = object()
+    # First item of the checkpoints of the games in progress in the queue
+    CHECKPOINT = object()
+
+    def __init__(
+            self, connection_pool, maximum_queued_games: int = 1000,
+            maximum_retries: int = 5, retry_delay: float = 0.5,
+            maximum_retry_delay: float = 30.0,
+            spool_path: str = None, session_cookies_key: str = None,
+            maximum_checkpoint_batch: int = 100) -> None:
+        """DatabaseWriter class constructor
+
+        Writes the games in the database from a background thread, so the games
+        only wait on the API. The games are kept in a bounded queue: when the 
+        database falls behind and the queue is full, submitting a game blocks
+        until there is room. A failed write is retried, and since the games are
+        written by token_api a retry never duplicates rows. The games that 
+        still fail are appended to a local spool file, which is written to the
+        database when the next writer starts, so every game is written at 
+        least once. The queue is flushed when the writer is closed or the 
+        process exits. The schema is not migrated by the writer: the database
+        must be migrated with the migrate command.
+
+        If the thread stops because of an error, the games queued are spooled 
+        and submitting or flushing games raises the error.
+
+        The checkpoints waiting one after another in the queue are written in
+        a single transaction. The cookies of the API sessions are written 
+        encrypted with the session cookies key, which needs the cryptography 
+        package. Without a key the checkpoints are skipped, since the games 
+        could not be resumed from them.
+
+        Args:
+            connection_pool (psycopg2.pool.AbstractConnectionPool): Pool from 
+            which the writer takes its connection
+            maximum_queued_games (int, optional): Maximum number of games 
+            waiting to be written. Defaults to 1000.
+            maximum_retries (int, optional): Maximum number of times a failed 
+            write is retried. Defaults to 5.
+            retry_delay (float, optional): Seconds waited before the first 
+            retry, doubled after every failure. Defaults to 0.5.
+            maximum_retry_delay (float, optional): Maximum seconds waited 
+            between retries. Defaults to 30.0.
+            spool_path (str, optional): Location of the JSONL file of the games
+            that could not be written, None to not keep them. Defaults to None.
+            session_cookies_key (str, optional): Fernet key with which the 
+            cookies of the checkpoints are encrypted. Defaults to None.
+            maximum_checkpoint_batch (int, optional): Maximum number of 
+            checkpoints written in a single transaction. Defaults to 100.
+        """
+        self.connection_pool = connection_pool
+        self.maximum_retries = maximum_retries
+        self.retry_delay = retry_delay
+        self.maximum_retry_delay = maximum_retry_delay
+        self.spool_path = spool_path
+        self.session_cookies_key = session_cookies_key
+        self.maximum_checkpoint_batch = maximum_checkpoint_batch
+        self.written_games = 0
+        # Games that could not be written after all the retries nor spooled
+        self.failed_games = []
+        # Number of games appended to the spool file and written from it
+        self.spooled_games = 0
+        self.replayed_games = 0
+        # Error that stopped the writer thread
+        self.error = None
+        self.__queue = queue.Queue(maximum_queued_games)
+        # Item taken from the queue while gathering checkpoints, written next
+        self.__next_item = None
+        self.__closed = False
+        self.__thread = threading.Thread(target=self.__write_games, daemon=True)
+        self.__thread.start()
+        atexit.register(self.close)
+
+    def submit_game(
+            self, game_data: tuple, attempts: list, times_data: tuple,
+            job: tuple = None) -> None:
+        """Queue a game to be written, waiting while the queue is full
+
+        Args:
+            game_data (tuple): token_api, number of vowels, number of 
+            consonants and length of the target word
+            attempts (list): API responses of the words sent
+            times_data (tuple): Time to find the word, total time, whether the
+            game was won and token_api
+            job (tuple, optional): job_id and worker_id of the queued job that
+            played the game, finished when the game is written. Defaults to 
+            None.
+
+        Raises:
+            RuntimeError: If the writer is closed or its thread stopped
+        """
+        self.__check_alive()
+        game = (game_data, list(attempts), times_data, job)
+        try:
+            self.__queue.put_nowait(game)
+        except queue.Full:
+            with metrics.time('database_backpressure'):
+                self.__queue.put(game)
+
+    def submit_checkpoint(
+            self, game_data: tuple, session_cookies: dict,
+            attempt_data: dict = None, elapsed_time: float = 0.0) -> None:
+        """Queue the checkpoint of a game in progress, waiting while the queue
+        is full
+
+        The checkpoints of a game are written in order and before the game is
+        written, since the queue is written by a single thread.
+
+        Args:
+            game_data (tuple): token_api, number of vowels, number of 
+            consonants and length of the target word
+            session_cookies (dict): Cookies of the API session of the game
+            attempt_data (dict, optional): API response of the word just sent.
+            Defaults to None.
+            elapsed_time (float, optional): Seconds played until the 
+            checkpoint, added to the times of the game when it is resumed. 
+            Defaults to 0.0.
+
+        Raises:
+            RuntimeError: If the writer is closed or its thread stopped
+        """
+        if self.session_cookies_key is None:
+            # Without the key the game could not be resumed from the 
+            # checkpoint, so it is only written when it finishes
+            return
+        self.__check_alive()
+        checkpoint = (
+            self.CHECKPOINT, game_data, dict(session_cookies), attempt_data,
+            elapsed_time
+        )
+        try:
+            self.__queue.put_nowait(checkpoint)
+        except queue.Full:
+            with metrics.time('database_backpressure'):
+                self.__queue.put(checkpoint)
+
+    def is_full(self) -> bool:
+        """Check whether submitting a game would wait for room in the queue
+
+        Returns:
+            bool: True if the queue is full
+        """
+        return self.__queue.full()
+
+    def get_pending_games(self) -> int:
+        """Return the number of games waiting to be written
+
+        Returns:
+            int: Number of games in the queue
+        """
+        return self.__queue.qsize()
+
+    def flush(self) -> None:
+        """Wait until every queued game has been written or has failed
+
+        Raises:
+            RuntimeError: If the writer thread stopped
+        """
+        self.__queue.join()
+        if self.error is not None:
+            raise RuntimeError('The database writer stopped') from self.error
+
+    def __check_alive(self) -> None:
+        """Check that games can still be submitted
+
+        Raises:
+            RuntimeError: If the writer is closed or its thread stopped
+        """
+        if self.__closed:
+            raise RuntimeError('The database writer is closed')
+        if self.error is not None:
+            raise RuntimeError('The database writer stopped') from self.error
+
+    def close(self) -> None:
+        """Write the queued games and stop the writer thread
+        """
+        if self.__closed:
+            return
+        self.__closed = True
+        atexit.unregister(self.close)
+        self.__queue.put(self.STOP)
+        self.__thread.join()
+        events.emit(
+            'database_writer_closed', written_games=self.written_games,
+            spooled_games=self.spooled_games,
+            replayed_games=self.replayed_games,
+            failed_games=len(self.failed_games),
+            error=str(self.error) if self.error is not None else None
+        )
+        if self.spooled_games:
+            print(
+                f'{self.spooled_games} juegos se guardaron en {self.spool_path}'
+                ' y se escribirán en la base de datos al volver a iniciar',
+                file=sys.stderr
+            )
+        if self.failed_games:
+            print(
+                f'No se pudieron guardar {len(self.failed_games)} juegos en la'
+                ' base de datos', file=sys.stderr
+            )
+
+    def __write_games(self) -> None:
+        database = None
+        try:
+            database = Database(connection_pool=self.connection_pool)
+            database.check_schema()
+            self.__replay_spool(database)
+            while True:
+                game = self.__get_item()
+                if game is self.STOP:
+                    self.__queue.task_done()
+                    return
+                if game[0] is self.CHECKPOINT:
+                    checkpoints = self.__gather_checkpoints(game)
+                    try:
+                        self.__write_checkpoints(database, checkpoints)
+                    finally:
+                        for _ in checkpoints:
+                            self.__queue.task_done()
+                    continue
+                try:
+                    self.__write_game(database, game)
+                finally:
+                    self.__queue.task_done()
+        except Exception as error:
+            self.error = error
+            print(
+                f'El escritor de la base de datos se detuvo: {error}',
+                file=sys.stderr
+            )
+            # The games queued until the writer is closed are spooled, so 
+            # flush and close never wait for a thread that is gone
+            self.__spool_queued_games()
+        finally:
+            if database is not None:
+                try:
+                    database.close_connection()
+                except Exception:
+                    pass
+
+    def __get_item(self):
+        # Next item of the queue, starting with the one taken while gathering
+        # checkpoints
+        if self.__next_item is not None:
+            item, self.__next_item = self.__next_item, None
+            return item
+        return self.__queue.get()
+
+    def __gather_checkpoints(self, checkpoint: tuple) -> list:
+        # The checkpoints already waiting after a checkpoint are taken with it,
+        # and the first item that is not a checkpoint is kept to be written 
+        # next, so the items are still written in order
+        checkpoints = [checkpoint]
+        while len(checkpoints) < self.maximum_checkpoint_batch:
+            try:
+                item = self.__queue.get_nowait()
+            except queue.Empty:
+                break
+            if item is self.STOP or item[0] is not self.CHECKPOINT:
+                self.__next_item = item
+                break
+            checkpoints.append(item)
+        return checkpoints
+
+    def __write_checkpoints(self, database: Database, checkpoints: list) -> bool:
+        retry_delay = self.retry_delay
+        for retry in range(self.maximum_retries + 1):
+            try:
+                database.checkpoint_games(
+                    [checkpoint[1:] for checkpoint in checkpoints],
+                    self.session_cookies_key
+                )
+                return True
+            except Exception as error:
+                if retry == self.maximum_retries:
+                    # A lost checkpoint only means the game cannot be resumed
+                    # from it
+                    print(
+                        f'No se pudieron guardar {len(checkpoints)} puntos de '
+                        f'control: {error}', file=sys.stderr
+                    )
+                    return False
+                time.sleep(retry_delay)
+                retry_delay = min(retry_delay * 2, self.maximum_retry_delay)
+
+    def __spool_queued_games(self) -> None:
+        while True:
+            game = self.__get_item()
+            try:
+                if game is self.STOP:
+                    return
+                # A lost checkpoint only means the game cannot be resumed from
+                # it
+                if game[0] is not self.CHECKPOINT:
+                    self.__spool_game(game)
+            finally:
+                self.__queue.task_done()
+
+    def __write_game(self, database: Database, game: tuple) -> bool:
+        retry_delay = self.retry_delay
+        for retry in range(self.maximum_retries + 1):
+            try:
+                database.save_game(*game)
+                self.written_games += 1
+                return True
+            except Exception as error:
+                if retry == self.maximum_retries:
+                    print(
+                        f'No se pudo guardar el juego {game[0][0]}: {error}',
+                        file=sys.stderr
+                    )
+                    self.__spool_game(game)
+                    return False
+                time.sleep(retry_delay)
+                retry_delay = min(retry_delay * 2, self.maximum_retry_delay)
+
+    def __spool_game(self, game: tuple) -> None:
+        # The game is appended to the spool file, so it is written when the 
+        # next writer starts
+        if self.spool_path is None:
+            self.failed_games.append(game)
+            return
+        game_data, attempts, times_data, job = game
+        try:
+            with open(
+                file=self.spool_path, mode='a', encoding='utf-8'
+            ) as spool_file:
+                spool_file.write(json.dumps({
+                    'game_data': game_data,
+                    'attempts': attempts,
+                    'times_data': times_data,
+                    'job': job,
+                }, ensure_ascii=False) + '\n')
+            self.spooled_games += 1
+        except OSError as error:
+            print(
+                f'No se pudo guardar el juego {game_data[0]}: {error}',
+                file=sys.stderr
+            )
+            self.failed_games.append(game)
+
+    def __replay_spool(self, database: Database) -> None:
+        # The games of the spool file are moved to a replay file before they 
+        # are written, so the games that fail again are spooled for the next 
+        # start. A replay file left by a writer that stopped is written first,
+        # and since the games are written by token_api, writing one twice 
+        # does not duplicate any row
+        if self.spool_path is None:
+            return
+        replay_path = f'{self.spool_path}.replay'
+        for move_spool in (False, True):
+            if move_spool:
+                if not os.path.exists(self.spool_path):
+                    return
+                os.replace(self.spool_path, replay_path)
+            try:
+                with open(
+                    file=replay_path, mode='r', encoding='utf-8'
+                ) as replay_file:
+                    lines = replay_file.readlines()
+            except FileNotFoundError:
+                continue
+            for line in lines:
+                if not line.strip():
+                    continue
+                spooled_game = json.loads(line)
+                job = spooled_game['job']
+                if self.__write_game(database, (
+                    tuple(spooled_game['game_data']),
+                    spooled_game['attempts'],
+                    tuple(spooled_game['times_data']),
+                    tuple(job) if job is not None else None,
+                )):
+                    self.replayed_games += 1
+            try:
+                os.remove(replay_path)
+            except FileNotFoundError:
+                # Another writer replayed the same file
+                pass
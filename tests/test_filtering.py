@@ -0,0 +1,198 @@
+import random
+
+import pytest
+
+from constants import WORD_BANK_PATH
+from solver import (
+    AuxiliaryFunctions, WordBankManagement, WordBitmaskIndex, WordConstraints,
+    WordleGame, WordWeights,
+)
+
+auxiliary_functions = AuxiliaryFunctions()
+
+
+def baseline_filter_words(
+        wordlist: list, last_attempt: str,
+        right_letters_in_right_positions: list,
+        right_letters_in_wrong_positions: list) -> list:
+    """Three-pass filter of the first version of WordleGame.filter_words
+
+    Args:
+        wordlist (list): List of words
+        last_attempt (str): Word used in the last attempt
+        right_letters_in_right_positions (list): Boolean list containing the 
+        correct letter positions
+        right_letters_in_wrong_positions (list): List containing the correct 
+        letters in the wrong positions
+
+    Returns:
+        list: List of filtered words
+    """
+    # Words with the letters in the correct positions
+    first_filter = [
+        word for word in wordlist
+        if auxiliary_functions.comparison_position_letter_with_array_booleans(
+            last_attempt, word, right_letters_in_right_positions
+        )
+    ]
+    # Words without the letters that the target word does not have
+    right_letters = [
+        last_attempt[index]
+        for index in range(len(right_letters_in_right_positions))
+        if right_letters_in_right_positions[index]
+    ]
+    letters_not_located_in_wordtarget = [
+        last_attempt[index] for index in range(len(last_attempt))
+        if last_attempt[index] not in right_letters_in_wrong_positions
+        and not right_letters_in_right_positions[index]
+        and last_attempt[index] not in right_letters
+    ]
+    second_filter = [
+        word for word in first_filter
+        if auxiliary_functions.verify_word_no_wrong_letter(
+            letters_not_located_in_wordtarget, word
+        )
+    ]
+    # Words with the right letters outside the positions known to be wrong. 
+    # When no word has all of them, the words are kept
+    wordlist_contain_right_letter = [
+        word for word in second_filter
+        if all(letter in word for letter in right_letters_in_wrong_positions)
+    ]
+    if len(wordlist_contain_right_letter) == 0:
+        return second_filter
+    return [
+        word for word in wordlist_contain_right_letter
+        if not any(
+            not right_letters_in_right_positions[index]
+            and word[index] == last_attempt[index]
+            for index in range(len(right_letters_in_right_positions))
+        )
+    ]
+
+
+@pytest.fixture(scope='module')
+def wordle_game() -> WordleGame:
+    word_bank_management = WordBankManagement()
+    word_bank_management.create_list_of_words(WORD_BANK_PATH)
+    return WordleGame(word_bank_management.get_list_of_words())
+
+
+def sample_games(wordle_game: WordleGame, number_of_games: int) -> list:
+    """Pick target words with the words of their group sent as attempts
+
+    Args:
+        wordle_game (WordleGame): Wordle game
+        number_of_games (int): Number of games
+
+    Returns:
+        list: Target word, attempts and words of the group of every game
+    """
+    generator = random.Random(0)
+    groups = [
+        words for words in wordle_game.get_initial_requirements_groups().values()
+        if len(words) > 1
+    ]
+    games = []
+    for _ in range(number_of_games):
+        words = generator.choice(groups)
+        attempts = generator.sample(words, min(4, len(words)))
+        games.append((generator.choice(words), attempts, words))
+    return games
+
+
+def test_filter_words_matches_baseline(wordle_game):
+    for target_word, attempts, words in sample_games(wordle_game, 300):
+        possible_words = list(words)
+        for attempt in attempts:
+            feedback = auxiliary_functions.attempt_feedback(attempt, target_word)
+            expected = baseline_filter_words(possible_words, attempt, *feedback)
+            possible_words = wordle_game.filter_words(
+                possible_words, attempt, *feedback
+            )
+            assert possible_words == expected
+            assert target_word in possible_words
+
+
+def test_filter_words_keeps_words_outside_word_bank(wordle_game):
+    wordlist = ['zzzzq', 'qzzzz', 'zqzzz']
+    feedback = auxiliary_functions.attempt_feedback('qzzzz', 'zqzzz')
+    assert wordle_game.filter_words(wordlist, 'qzzzz', *feedback) == (
+        baseline_filter_words(wordlist, 'qzzzz', *feedback)
+    )
+
+
+def test_filter_bitset_matches_brute_force(wordle_game):
+    for target_word, attempts, words in sample_games(wordle_game, 40):
+        word_bitmask_index = wordle_game.get_word_bitmask_index(len(target_word))
+        word_constraints = WordConstraints(len(target_word))
+        feedbacks = []
+        for attempt in attempts:
+            feedback = auxiliary_functions.attempt_feedback(attempt, target_word)
+            feedbacks.append((attempt, feedback))
+            word_constraints.add_feedback(attempt, *feedback)
+            candidates = word_bitmask_index.filter_bitset(
+                word_bitmask_index.all_words_bitset(), word_constraints
+            )
+            obtained = word_bitmask_index.bitset_to_words(candidates)
+            # The words that would have received the same feedback
+            expected = [
+                word for word in word_bitmask_index.get_list_of_words()
+                if all(
+                    auxiliary_functions.attempt_feedback(sent_word, word)
+                    == sent_feedback
+                    for sent_word, sent_feedback in feedbacks
+                )
+            ]
+            assert obtained == expected
+            assert word_bitmask_index.count_bitset(candidates) == len(expected)
+
+
+def test_feedback_partition_sizes_match_brute_force(wordle_game):
+    for target_word, attempts, words in sample_games(wordle_game, 50):
+        word_bitmask_index = wordle_game.get_word_bitmask_index(len(target_word))
+        candidates = word_bitmask_index.words_to_bitset(words)
+        for attempt in attempts:
+            partitions = {}
+            for word in words:
+                right_positions, wrong_positions = (
+                    auxiliary_functions.attempt_feedback(attempt, word)
+                )
+                key = (tuple(right_positions), frozenset(wrong_positions))
+                partitions[key] = partitions.get(key, 0) + 1
+            assert sorted(word_bitmask_index.feedback_partition_sizes(
+                attempt, candidates
+            )) == sorted(partitions.values())
+
+
+def test_weighted_feedback_partitions_match_brute_force(wordle_game):
+    generator = random.Random(1)
+    for target_word, attempts, words in sample_games(wordle_game, 50):
+        word_bitmask_index = wordle_game.get_word_bitmask_index(len(target_word))
+        candidates = word_bitmask_index.words_to_bitset(words)
+        word_counts = {
+            word: generator.randint(1, 9)
+            for word in generator.sample(words, min(3, len(words)))
+        }
+        word_weights = WordWeights(word_bitmask_index, word_counts, 0.5)
+        assert word_weights.weigh(candidates) == (
+            0.5 * len(words) + sum(word_counts.values())
+        )
+        for attempt in attempts:
+            partitions = {}
+            for word in words:
+                right_positions, wrong_positions = (
+                    auxiliary_functions.attempt_feedback(attempt, word)
+                )
+                key = (tuple(right_positions), frozenset(wrong_positions))
+                partitions[key] = (
+                    partitions.get(key, 0) + word_counts.get(word, 0) + 0.5
+                )
+            assert sorted(word_bitmask_index.feedback_partition_sizes(
+                attempt, candidates, word_weights
+            )) == sorted(partitions.values())
+
+
+def test_word_bitmask_index_rejects_words_of_other_lengths():
+    with pytest.raises(ValueError):
+        WordBitmaskIndex(['abc', 'abcd'])
@@ -0,0 +1,44 @@
+import pytest
+
+from main import parse_feedback, parse_target_word
+
+
+def test_parse_feedback_positions_only():
+    assert parse_feedback('01001', 'arcos') == (
+        'arcos', [False, True, False, False, True], []
+    )
+
+
+@pytest.mark.parametrize('line', ['01001 co', '01001|co', '  01001   co\n'])
+def test_parse_feedback_with_right_letters_in_wrong_positions(line):
+    assert parse_feedback(line, 'arcos') == (
+        'arcos', [False, True, False, False, True], ['c', 'o']
+    )
+
+
+def test_parse_feedback_with_word_sent():
+    assert parse_feedback('corsa 10000 a', 'arcos') == (
+        'corsa', [True, False, False, False, False], ['a']
+    )
+
+
+def test_parse_feedback_removes_repeated_letters():
+    assert parse_feedback('00000 oco', 'arcos')[2] == ['o', 'c']
+
+
+@pytest.mark.parametrize('line', [
+    '', '0100', '010011', '01201', '01001 co extra', 'arcos', 'corsa co',
+])
+def test_parse_feedback_rejects_invalid_lines(line):
+    with pytest.raises(ValueError):
+        parse_feedback(line, 'arcos')
+
+
+def test_parse_target_word():
+    assert parse_target_word('5 2 3\n') == (5, 2, 3)
+
+
+@pytest.mark.parametrize('line', ['5 2', '5 2 x', 'five two three'])
+def test_parse_target_word_rejects_invalid_lines(line):
+    with pytest.raises(ValueError):
+        parse_target_word(line)
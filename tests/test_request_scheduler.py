@@ -0,0 +1,257 @@
+import asyncio
+import sys
+import types
+
+import pytest
+
+from networking import RequestScheduler
+
+try:
+    import aiohttp
+except ImportError:
+    # The scheduler only uses the timeout and the exceptions of aiohttp, so a
+    # module with them is enough to run the tests without it
+    aiohttp = types.ModuleType('aiohttp')
+
+    class ClientError(Exception):
+        pass
+
+    class ClientResponseError(ClientError):
+        def __init__(
+                self, request_info, history, status: int = None,
+                message: str = '') -> None:
+            super().__init__(status, message)
+            self.status = status
+
+    class ClientConnectionError(ClientError):
+        pass
+
+    class ClientConnectorError(ClientConnectionError):
+        def __init__(self, connection_key, os_error: OSError) -> None:
+            super().__init__(os_error)
+
+    class ServerDisconnectedError(ClientConnectionError):
+        pass
+
+    for exception_class in (
+            ClientError, ClientResponseError, ClientConnectionError,
+            ClientConnectorError, ServerDisconnectedError):
+        setattr(aiohttp, exception_class.__name__, exception_class)
+    aiohttp.ClientTimeout = lambda total=None: total
+
+
+@pytest.fixture(autouse=True)
+def aiohttp_module(monkeypatch):
+    monkeypatch.setitem(sys.modules, 'aiohttp', aiohttp)
+
+
+class FakeResponse:
+    def __init__(
+            self, status: int, data: dict, gate: asyncio.Event = None) -> None:
+        self.status = status
+        self.reason = 'Fake'
+        self.request_info = None
+        self.history = ()
+        self.__data = data
+        self.__gate = gate
+
+    def raise_for_status(self) -> None:
+        if self.status >= 400:
+            raise aiohttp.ClientResponseError(
+                self.request_info, self.history, status=self.status
+            )
+
+    async def json(self) -> dict:
+        return self.__data
+
+    async def __aenter__(self) -> 'FakeResponse':
+        if self.__gate is not None:
+            await self.__gate.wait()
+        return self
+
+    async def __aexit__(self, *exception_info) -> None:
+        return None
+
+
+class FakeSession:
+    def __init__(self, outcomes: list) -> None:
+        """Session whose requests get, in order, a status code or raise an 
+        exception. The response of an asyncio.Event is a 200 status sent when
+        the event is set
+
+        Args:
+            outcomes (list): Status code, exception or event of every request
+        """
+        self.outcomes = list(outcomes)
+        self.requests = 0
+
+    def request(self, method: str, url: str, **kwargs) -> FakeResponse:
+        self.requests += 1
+        outcome = self.outcomes.pop(0)
+        if isinstance(outcome, Exception):
+            raise outcome
+        if isinstance(outcome, asyncio.Event):
+            return FakeResponse(200, {'status': 200}, outcome)
+        return FakeResponse(outcome, {'status': outcome})
+
+
+def send(
+        request_scheduler: RequestScheduler, session: FakeSession,
+        idempotent: bool = True) -> dict:
+    return asyncio.run(request_scheduler.request(
+        session, 'POST', 'http://api/attempt',
+        RequestScheduler.PRIORITY_SEND_WORD, idempotent=idempotent
+    ))
+
+
+def connection_refused() -> Exception:
+    return aiohttp.ClientConnectorError(
+        None, ConnectionRefusedError(111, 'Connection refused')
+    )
+
+
+def test_retries_transient_failures_without_decreasing_the_limit():
+    request_scheduler = RequestScheduler(8, retry_delay=0.0)
+    session = FakeSession([503, 502, 200])
+    assert send(request_scheduler, session) == {'status': 200}
+    assert session.requests == 3
+    assert request_scheduler.retries == 2
+    assert request_scheduler.failures == 2
+    assert request_scheduler.concurrency_limit == 8
+
+
+def test_decreases_the_limit_when_overloaded():
+    request_scheduler = RequestScheduler(8, retry_delay=0.0)
+    assert send(request_scheduler, FakeSession([429, 200])) == {'status': 200}
+    assert request_scheduler.concurrency_limit == 4
+
+
+def test_decreases_the_limit_once_per_round():
+    request_scheduler = RequestScheduler(8, retry_delay=0.0)
+    send(request_scheduler, FakeSession([429, 429, 200]))
+    assert request_scheduler.concurrency_limit == 4
+
+
+def test_raises_after_the_last_retry():
+    request_scheduler = RequestScheduler(8, maximum_retries=2, retry_delay=0.0)
+    session = FakeSession([503, 503, 503])
+    with pytest.raises(aiohttp.ClientResponseError):
+        send(request_scheduler, session)
+    assert session.requests == 3
+
+
+def test_does_not_retry_processed_requests_that_are_not_idempotent():
+    request_scheduler = RequestScheduler(8, retry_delay=0.0)
+    session = FakeSession([502, 200])
+    with pytest.raises(aiohttp.ClientResponseError):
+        send(request_scheduler, session, idempotent=False)
+    assert session.requests == 1
+
+
+@pytest.mark.parametrize('outcome', [503, 429, connection_refused()])
+def test_retries_unprocessed_requests_that_are_not_idempotent(outcome):
+    request_scheduler = RequestScheduler(8, retry_delay=0.0)
+    session = FakeSession([outcome, 200])
+    assert send(request_scheduler, session, idempotent=False) == {'status': 200}
+    assert session.requests == 2
+
+
+def test_does_not_retry_lost_connections_that_are_not_idempotent():
+    request_scheduler = RequestScheduler(8, retry_delay=0.0)
+    session = FakeSession([aiohttp.ServerDisconnectedError(), 200])
+    with pytest.raises(aiohttp.ServerDisconnectedError):
+        send(request_scheduler, session, idempotent=False)
+    assert session.requests == 1
+
+
+def test_increases_the_limit_after_a_round_under_the_target_latency():
+    request_scheduler = RequestScheduler(
+        8, initial_concurrency=2, target_latency=10.0
+    )
+    session = FakeSession([200, 200])
+    send(request_scheduler, session)
+    assert request_scheduler.concurrency_limit == 2
+    send(request_scheduler, session)
+    assert request_scheduler.concurrency_limit == 3
+
+
+def test_does_not_exceed_the_maximum_concurrency():
+    request_scheduler = RequestScheduler(
+        2, initial_concurrency=2, target_latency=10.0
+    )
+    session = FakeSession([200] * 4)
+    for _ in range(4):
+        send(request_scheduler, session)
+    assert request_scheduler.concurrency_limit == 2
+
+
+def test_halves_the_limit_down_to_the_minimum_over_the_target_latency():
+    request_scheduler = RequestScheduler(
+        8, initial_concurrency=4, minimum_concurrency=3, target_latency=0.0
+    )
+    session = FakeSession([200] * 8)
+    for _ in range(4):
+        send(request_scheduler, session)
+    assert request_scheduler.concurrency_limit == 3
+    for _ in range(3):
+        send(request_scheduler, session)
+    assert request_scheduler.concurrency_limit == 3
+
+
+def test_backoff_delay_is_bounded():
+    for retry in range(5):
+        assert 0 <= RequestScheduler.backoff_delay(retry, 0.1) <= 0.1 * 2 ** retry
+
+
+
+def send_after_cancelling(
+        request_scheduler: RequestScheduler, outcomes: list) -> dict:
+    """Send a request, cancel a second one while it waits, let the events of 
+    the outcomes be set and send a third request, which only finds room if 
+    the cancelled request gave it back
+    """
+    async def send_request() -> dict:
+        return await request_scheduler.request(
+            session, 'POST', 'http://api/attempt',
+            RequestScheduler.PRIORITY_SEND_WORD
+        )
+
+    async def run() -> dict:
+        first = asyncio.create_task(send_request())
+        await asyncio.sleep(0.01)
+        second = asyncio.create_task(send_request())
+        await asyncio.sleep(0.01)
+        second.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await second
+        for outcome in outcomes:
+            if isinstance(outcome, asyncio.Event):
+                outcome.set()
+        await first
+        return await asyncio.wait_for(send_request(), timeout=5)
+
+    session = FakeSession(outcomes)
+    return asyncio.run(run())
+
+
+def test_cancelled_request_waiting_for_room_gives_it_back():
+    request_scheduler = RequestScheduler(1, retry_delay=0.0)
+    assert send_after_cancelling(
+        request_scheduler, [asyncio.Event(), 200]
+    ) == {'status': 200}
+
+
+def test_cancelled_request_waiting_for_a_token_gives_its_room_back():
+    request_scheduler = RequestScheduler(
+        1, requests_per_second=1, burst=1, retry_delay=0.0
+    )
+    assert send_after_cancelling(request_scheduler, [200, 200]) == {
+        'status': 200
+    }
+
+
+def test_cancelled_request_in_flight_gives_its_room_back():
+    request_scheduler = RequestScheduler(1, retry_delay=0.0)
+    assert send_after_cancelling(
+        request_scheduler, [200, asyncio.Event(), 200]
+    ) == {'status': 200}
@@ -0,0 +1,52 @@
+from solver import SharedWordBank, WordBankManagement, load_wordle_game
+
+
+def write_word_bank(path, words: list) -> str:
+    path.write_text(' '.join(words) + '\n', encoding='utf-8')
+    return str(path)
+
+
+def test_compiled_word_bank_matches_txt(tmp_path):
+    words = ['casa', 'perro', 'gato', 'mesa', 'ñandú']
+    word_bank_path = write_word_bank(tmp_path / 'words.txt', words)
+    compiled_path = str(tmp_path / 'words.bin')
+    WordBankManagement().compile_word_bank(word_bank_path, compiled_path)
+    wordle_game = load_wordle_game(word_bank_path, compiled_path)
+    assert wordle_game.get_list_of_words() == words
+    assert wordle_game.words_filter_initial_requirements(4, 2, 2) == [
+        'casa', 'gato', 'mesa'
+    ]
+
+
+def test_compiled_word_bank_of_another_txt_is_ignored(tmp_path, capsys):
+    compiled_path = str(tmp_path / 'words.bin')
+    WordBankManagement().compile_word_bank(
+        write_word_bank(tmp_path / 'full.txt', ['casa', 'perro', 'gato']),
+        compiled_path
+    )
+    word_bank_path = write_word_bank(tmp_path / 'small.txt', ['mesa'])
+    wordle_game = load_wordle_game(word_bank_path, compiled_path)
+    assert wordle_game.get_list_of_words() == ['mesa']
+    assert 'was not compiled from' in capsys.readouterr().err
+
+
+def test_shared_word_bank_matches_txt(tmp_path):
+    words = ['casa', 'perro', 'gato', 'mesa', 'ñandú']
+    wordle_game = load_wordle_game(
+        write_word_bank(tmp_path / 'words.txt', words), None
+    )
+    with SharedWordBank(wordle_game) as shared_word_bank:
+        shared_game = SharedWordBank.attach(
+            shared_word_bank.name, maximum_groups=1
+        )
+        assert shared_game.words_filter_initial_requirements(4, 2, 2) == [
+            'casa', 'gato', 'mesa'
+        ]
+        assert dict(shared_game.get_initial_requirements_groups()) == (
+            wordle_game.get_initial_requirements_groups()
+        )
+        assert shared_game.get_list_of_words() == words
+        assert shared_game.get_word_bank_hash() == (
+            wordle_game.get_word_bank_hash()
+        )
+        shared_game.get_initial_requirements_groups().close()